@@ -0,0 +1,549 @@
+"""
+Listas e matrizes de adjacência persistentes, com compartilhamento estrutural.
+
+As operações funcionais de inclusão/exclusão de vértice (Grafo.incluir_vertice_*
+e Grafo.excluir_vertice_*) devolvem uma nova versão sem alterar a anterior. Em vez
+de copiar a estrutura inteira, cada versão reaproveita tudo o que não mudou:
+
+- as linhas ficam em um VetorPersistente indexado por um ID interno do vértice
+  (uma trie de 32 posições por nó): alterar k linhas copia só os nós no caminho
+  até elas, O(k log32 V), e as demais linhas são as mesmas da versão anterior;
+- a ordem dos vértices (rótulo -> posição -> ID) fica em RotulosOrdenados, uma
+  sequência ordenada dividida em blocos imutáveis: incluir ou excluir um vértice
+  copia um bloco e os vetores de topo, O(TAMANHO_BLOCO + V / TAMANHO_BLOCO).
+
+Assim, derivar uma versão custa O(linhas alteradas), e centenas de versões vivas
+ocupam pouco mais que a primeira. As linhas são compartilhadas entre versões e
+não devem ser alteradas pelo chamador.
+"""
+
+from bisect import bisect_left, bisect_right
+from collections.abc import Mapping, Sequence
+from itertools import chain
+
+BITS_NO = 5
+LARGURA_NO = 1 << BITS_NO
+MASCARA_NO = LARGURA_NO - 1
+TAMANHO_BLOCO = 64
+
+
+def _sequencias_iguais(a, b):
+    return len(a) == len(b) and all(x == y for x, y in zip(a, b))
+
+
+# =============================================================================
+# VETOR PERSISTENTE (TRIE COM CÓPIA DE CAMINHO)
+# =============================================================================
+
+def _atualizar_no(no, deslocamento, itens):
+    # Copia o nó uma única vez e desce só pelos filhos que contêm posições alteradas
+    copia = list(no)
+    if deslocamento == 0:
+        for i, valor in itens:
+            copia[i & MASCARA_NO] = valor
+        return copia
+    grupos = {}
+    for item in itens:
+        grupos.setdefault((item[0] >> deslocamento) & MASCARA_NO, []).append(item)
+    for k, grupo in grupos.items():
+        copia[k] = _atualizar_no(no[k], deslocamento - BITS_NO, grupo)
+    return copia
+
+
+def _anexar_no(no, deslocamento, i, valor):
+    copia = [] if no is None else list(no)
+    if deslocamento == 0:
+        copia.append(valor)
+        return copia
+    k = (i >> deslocamento) & MASCARA_NO
+    if k < len(copia):
+        copia[k] = _anexar_no(copia[k], deslocamento - BITS_NO, i, valor)
+    else:
+        copia.append(_anexar_no(None, deslocamento - BITS_NO, i, valor))
+    return copia
+
+
+class VetorPersistente(Sequence):
+    """
+    Vetor imutável em uma trie de 32 posições por nó. `atualizar` e `anexar`
+    devolvem um novo vetor que compartilha com este todos os nós não alterados.
+    """
+    __slots__ = ('_tamanho', '_deslocamento', '_raiz')
+
+    def __init__(self, tamanho=0, deslocamento=0, raiz=None):
+        self._tamanho = tamanho
+        self._deslocamento = deslocamento
+        self._raiz = [] if raiz is None else raiz
+
+    @classmethod
+    def de_sequencia(cls, valores):
+        """
+        Monta o vetor em O(n), agrupando os valores em folhas de 32 e subindo nível a nível.
+        """
+        valores = list(valores)
+        nos = [valores[i:i + LARGURA_NO] for i in range(0, len(valores), LARGURA_NO)] or [[]]
+        deslocamento = 0
+        while len(nos) > 1:
+            nos = [nos[i:i + LARGURA_NO] for i in range(0, len(nos), LARGURA_NO)]
+            deslocamento += BITS_NO
+        return cls(len(valores), deslocamento, nos[0])
+
+    def __len__(self):
+        return self._tamanho
+
+    def __getitem__(self, i):
+        if not 0 <= i < self._tamanho:
+            raise IndexError("Posição fora do vetor.")
+        no = self._raiz
+        deslocamento = self._deslocamento
+        while deslocamento:
+            no = no[(i >> deslocamento) & MASCARA_NO]
+            deslocamento -= BITS_NO
+        return no[i & MASCARA_NO]
+
+    def atualizar(self, alteracoes):
+        """
+        Retorna um novo vetor com as posições alteradas.
+
+        Args:
+            alteracoes (dict): Posição -> novo valor
+
+        Returns:
+            VetorPersistente: Nova versão (este vetor não muda)
+        """
+        for i in alteracoes:
+            if not 0 <= i < self._tamanho:
+                raise IndexError("Posição fora do vetor.")
+        if not alteracoes:
+            return self
+        raiz = _atualizar_no(self._raiz, self._deslocamento, list(alteracoes.items()))
+        return VetorPersistente(self._tamanho, self._deslocamento, raiz)
+
+    def anexar(self, valor):
+        """
+        Retorna um novo vetor com `valor` acrescentado ao final.
+        """
+        raiz = self._raiz
+        deslocamento = self._deslocamento
+        # Trie cheia: a raiz atual vira o primeiro filho de uma nova raiz
+        if self._tamanho == 1 << (deslocamento + BITS_NO):
+            raiz = [raiz]
+            deslocamento += BITS_NO
+        raiz = _anexar_no(raiz, deslocamento, self._tamanho, valor)
+        return VetorPersistente(self._tamanho + 1, deslocamento, raiz)
+
+
+# =============================================================================
+# RÓTULOS ORDENADOS EM BLOCOS
+# =============================================================================
+
+class RotulosOrdenados(Sequence):
+    """
+    Sequência ordenada de rótulos, cada um associado ao ID interno da sua linha.
+
+    Os rótulos ficam em blocos (tuplas) de até 2 * TAMANHO_BLOCO elementos; uma
+    nova versão reaproveita todos os blocos exceto o alterado.
+    """
+    __slots__ = ('_blocos', '_ids', '_ultimos', '_inicios', '_tamanho')
+
+    def __init__(self, blocos=(), ids=()):
+        """
+        Args:
+            blocos (tuple): Tuplas de rótulos em ordem crescente, não vazias
+            ids (tuple): Tuplas paralelas com o ID de cada rótulo
+        """
+        self._blocos = blocos
+        self._ids = ids
+        self._ultimos = tuple(bloco[-1] for bloco in blocos)
+        inicios = []
+        total = 0
+        for bloco in blocos:
+            inicios.append(total)
+            total += len(bloco)
+        self._inicios = inicios
+        self._tamanho = total
+
+    @classmethod
+    def de_rotulos(cls, rotulos, ids):
+        """
+        Monta a sequência a partir de rótulos já ordenados e dos seus IDs.
+        """
+        rotulos = tuple(rotulos)
+        ids = tuple(ids)
+        fatias = range(0, len(rotulos), TAMANHO_BLOCO)
+        return cls(tuple(rotulos[i:i + TAMANHO_BLOCO] for i in fatias),
+                   tuple(ids[i:i + TAMANHO_BLOCO] for i in fatias))
+
+    def _localizar(self, rotulo):
+        b = bisect_left(self._ultimos, rotulo)
+        if b == len(self._blocos):
+            return b, -1
+        k = bisect_left(self._blocos[b], rotulo)
+        return b, (k if self._blocos[b][k] == rotulo else -1)
+
+    def posicao(self, rotulo):
+        """
+        Retorna a posição do rótulo na ordem crescente, ou -1 se não existir. O(log V).
+        """
+        b, k = self._localizar(rotulo)
+        return -1 if k < 0 else self._inicios[b] + k
+
+    def id_de(self, rotulo):
+        """
+        Retorna o ID interno do rótulo, ou -1 se não existir. O(log V).
+        """
+        b, k = self._localizar(rotulo)
+        return -1 if k < 0 else self._ids[b][k]
+
+    def id_na_posicao(self, i):
+        """
+        Retorna o ID interno do rótulo na posição `i`. O(log V).
+        """
+        b = bisect_right(self._inicios, i) - 1
+        return self._ids[b][i - self._inicios[b]]
+
+    def iterar_ids(self):
+        """
+        Gera os IDs internos na ordem dos rótulos.
+        """
+        return chain.from_iterable(self._ids)
+
+    def __len__(self):
+        return self._tamanho
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return list(self)[i]
+        if i < 0:
+            i += self._tamanho
+        if not 0 <= i < self._tamanho:
+            raise IndexError("Posição fora da sequência.")
+        b = bisect_right(self._inicios, i) - 1
+        return self._blocos[b][i - self._inicios[b]]
+
+    def __iter__(self):
+        return chain.from_iterable(self._blocos)
+
+    def __contains__(self, rotulo):
+        return self._localizar(rotulo)[1] >= 0
+
+    def __eq__(self, outro):
+        if isinstance(outro, (list, tuple, RotulosOrdenados)):
+            return _sequencias_iguais(self, outro)
+        return NotImplemented
+
+    def __repr__(self):
+        return repr(list(self))
+
+    def inserir(self, rotulo, id_rotulo):
+        """
+        Retorna uma nova sequência com o rótulo incluído na sua posição ordenada.
+        """
+        if not self._blocos:
+            return RotulosOrdenados(((rotulo,),), ((id_rotulo,),))
+        b = min(bisect_left(self._ultimos, rotulo), len(self._blocos) - 1)
+        bloco = self._blocos[b]
+        ids = self._ids[b]
+        k = bisect_left(bloco, rotulo)
+        bloco = bloco[:k] + (rotulo,) + bloco[k:]
+        ids = ids[:k] + (id_rotulo,) + ids[k:]
+        if len(bloco) > 2 * TAMANHO_BLOCO:
+            novos_blocos = (bloco[:TAMANHO_BLOCO], bloco[TAMANHO_BLOCO:])
+            novos_ids = (ids[:TAMANHO_BLOCO], ids[TAMANHO_BLOCO:])
+        else:
+            novos_blocos = (bloco,)
+            novos_ids = (ids,)
+        return RotulosOrdenados(self._blocos[:b] + novos_blocos + self._blocos[b + 1:],
+                                self._ids[:b] + novos_ids + self._ids[b + 1:])
+
+    def remover(self, rotulo):
+        """
+        Retorna uma nova sequência sem o rótulo (que deve existir).
+        """
+        b, k = self._localizar(rotulo)
+        bloco = self._blocos[b][:k] + self._blocos[b][k + 1:]
+        ids = self._ids[b][:k] + self._ids[b][k + 1:]
+        meio_blocos = (bloco,) if bloco else ()
+        meio_ids = (ids,) if ids else ()
+        return RotulosOrdenados(self._blocos[:b] + meio_blocos + self._blocos[b + 1:],
+                                self._ids[:b] + meio_ids + self._ids[b + 1:])
+
+
+class MapaPosicoes(Mapping):
+    """
+    Mapeamento rótulo -> posição sobre RotulosOrdenados, sem montar um dicionário.
+    """
+
+    def __init__(self, rotulos):
+        self._rotulos = rotulos
+
+    def __getitem__(self, rotulo):
+        posicao = self._rotulos.posicao(rotulo)
+        if posicao < 0:
+            raise KeyError(rotulo)
+        return posicao
+
+    def __contains__(self, rotulo):
+        return rotulo in self._rotulos
+
+    def __iter__(self):
+        return iter(self._rotulos)
+
+    def __len__(self):
+        return len(self._rotulos)
+
+
+# =============================================================================
+# LISTA DE ADJACÊNCIA PERSISTENTE
+# =============================================================================
+
+class ListaAdjacenciaPersistente(Mapping):
+    """
+    Lista de adjacência imutável (vértice -> lista de vizinhos), iterada em ordem
+    crescente de vértice. Cada inclusão/exclusão devolve uma nova versão que
+    compartilha com esta as linhas não alteradas.
+
+    A exclusão supõe a lista de um grafo não direcionado: um vértice aparece
+    na linha de cada um dos seus vizinhos.
+    """
+
+    def __init__(self, rotulos, linhas):
+        """
+        Args:
+            rotulos (RotulosOrdenados): Vértices e os IDs das suas linhas
+            linhas (VetorPersistente): Lista de vizinhos de cada ID
+        """
+        self._rotulos = rotulos
+        self._linhas = linhas
+
+    @classmethod
+    def de_dicionario(cls, lista_adj):
+        """
+        Cria a versão inicial a partir de um dicionário, sem copiar as listas de vizinhos.
+        """
+        vertices = sorted(lista_adj)
+        return cls(RotulosOrdenados.de_rotulos(vertices, range(len(vertices))),
+                   VetorPersistente.de_sequencia(lista_adj[v] for v in vertices))
+
+    def __getitem__(self, vertice):
+        id_vertice = self._rotulos.id_de(vertice)
+        if id_vertice < 0:
+            raise KeyError(vertice)
+        return self._linhas[id_vertice]
+
+    def __contains__(self, vertice):
+        return vertice in self._rotulos
+
+    def __iter__(self):
+        return iter(self._rotulos)
+
+    def __len__(self):
+        return len(self._rotulos)
+
+    def __repr__(self):
+        return repr(dict(self.items()))
+
+    def incluir_vertice(self, novo_vertice, vizinhos):
+        """
+        Retorna uma nova versão com o vértice ligado aos vizinhos informados.
+        Copia apenas as linhas dos vizinhos.
+
+        Args:
+            novo_vertice: Vértice inexistente nesta versão
+            vizinhos (iterable): Vértices existentes (ou o próprio novo vértice, para um laço)
+
+        Returns:
+            ListaAdjacenciaPersistente: Nova versão
+        """
+        linha_nova = list(dict.fromkeys(vizinhos))
+        id_novo = len(self._linhas)
+        alteracoes = {}
+        for vizinho in linha_nova:
+            if vizinho == novo_vertice:
+                continue
+            id_vizinho = self._rotulos.id_de(vizinho)
+            linha = self._linhas[id_vizinho]
+            if novo_vertice not in linha:
+                alteracoes[id_vizinho] = linha + [novo_vertice]
+        linhas = self._linhas.atualizar(alteracoes).anexar(linha_nova)
+        return ListaAdjacenciaPersistente(self._rotulos.inserir(novo_vertice, id_novo), linhas)
+
+    def excluir_vertice(self, vertice):
+        """
+        Retorna uma nova versão sem o vértice. Copia apenas as linhas dos seus vizinhos.
+
+        Args:
+            vertice: Vértice existente nesta versão
+
+        Returns:
+            ListaAdjacenciaPersistente: Nova versão
+        """
+        id_vertice = self._rotulos.id_de(vertice)
+        # A linha removida deixa de ser referenciada pela nova versão
+        alteracoes = {id_vertice: None}
+        for vizinho in dict.fromkeys(self._linhas[id_vertice]):
+            id_vizinho = self._rotulos.id_de(vizinho)
+            if vizinho != vertice and id_vizinho >= 0:
+                alteracoes[id_vizinho] = [v for v in self._linhas[id_vizinho] if v != vertice]
+        return ListaAdjacenciaPersistente(self._rotulos.remover(vertice),
+                                          self._linhas.atualizar(alteracoes))
+
+
+# =============================================================================
+# MATRIZ DE ADJACÊNCIA PERSISTENTE
+# =============================================================================
+
+class LinhaMatrizPersistente(Sequence):
+    """
+    Linha da matriz persistente: lida de um dicionário esparso {ID da coluna: valor}.
+    """
+    __slots__ = ('_valores', '_rotulos')
+
+    def __init__(self, valores, rotulos):
+        self._valores = valores
+        self._rotulos = rotulos
+
+    def __len__(self):
+        return len(self._rotulos)
+
+    def __getitem__(self, j):
+        if isinstance(j, slice):
+            return list(self)[j]
+        if j < 0:
+            j += len(self._rotulos)
+        if not 0 <= j < len(self._rotulos):
+            raise IndexError("Coluna fora da matriz.")
+        return self._valores.get(self._rotulos.id_na_posicao(j), 0)
+
+    def __iter__(self):
+        valores = self._valores
+        return (valores.get(id_coluna, 0) for id_coluna in self._rotulos.iterar_ids())
+
+    def __eq__(self, outra):
+        if isinstance(outra, (list, tuple, LinhaMatrizPersistente)):
+            return _sequencias_iguais(self, outra)
+        return NotImplemented
+
+    def __repr__(self):
+        return repr(list(self))
+
+
+class MatrizAdjacenciaPersistente(Sequence):
+    """
+    Matriz de adjacência imutável, com linhas e colunas na ordem crescente dos
+    vértices. Cada linha é guardada de forma esparsa (só os valores não nulos),
+    indexada pelo ID interno das colunas: incluir ou excluir um vértice não
+    desloca as demais linhas, e a nova versão copia só as linhas dos vizinhos.
+    """
+
+    def __init__(self, rotulos, linhas):
+        """
+        Args:
+            rotulos (RotulosOrdenados): Vértices e os IDs das suas linhas/colunas
+            linhas (VetorPersistente): Dicionário {ID da coluna: valor} de cada ID
+        """
+        self.vertices = rotulos
+        self._linhas = linhas
+
+    @classmethod
+    def de_matriz(cls, matriz_adj, vertices_ordenados):
+        """
+        Cria a versão inicial a partir de uma matriz densa (lista de listas), em O(V²).
+        """
+        linhas = (
+            {j: valor for j, valor in enumerate(linha) if valor}
+            for linha in matriz_adj
+        )
+        return cls(RotulosOrdenados.de_rotulos(vertices_ordenados, range(len(vertices_ordenados))),
+                   VetorPersistente.de_sequencia(linhas))
+
+    @classmethod
+    def de_csr(cls, csr, vertices_ordenados):
+        """
+        Cria a versão inicial direto das adjacências (CSR), em O(V + E).
+        """
+        linhas = (dict.fromkeys(csr.vizinhos_de(i), 1) for i in range(csr.num_vertices))
+        return cls(RotulosOrdenados.de_rotulos(vertices_ordenados, range(csr.num_vertices)),
+                   VetorPersistente.de_sequencia(linhas))
+
+    @property
+    def mapa_vertices(self):
+        """
+        Mapeamento vértice -> posição (linha/coluna) nesta versão.
+        """
+        return MapaPosicoes(self.vertices)
+
+    def __len__(self):
+        return len(self.vertices)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return list(self)[i]
+        if i < 0:
+            i += len(self.vertices)
+        if not 0 <= i < len(self.vertices):
+            raise IndexError("Linha fora da matriz.")
+        return LinhaMatrizPersistente(self._linhas[self.vertices.id_na_posicao(i)], self.vertices)
+
+    def __iter__(self):
+        for id_linha in self.vertices.iterar_ids():
+            yield LinhaMatrizPersistente(self._linhas[id_linha], self.vertices)
+
+    def __eq__(self, outra):
+        if isinstance(outra, (list, tuple, MatrizAdjacenciaPersistente)):
+            return _sequencias_iguais(self, outra)
+        return NotImplemented
+
+    def __repr__(self):
+        return repr([list(linha) for linha in self])
+
+    def incluir_vertice(self, novo_vertice, vizinhos):
+        """
+        Retorna uma nova versão com o vértice ligado (valor 1) aos vizinhos informados.
+        Copia apenas as linhas dos vizinhos.
+
+        Args:
+            novo_vertice: Vértice inexistente nesta versão
+            vizinhos (iterable): Vértices existentes (ou o próprio novo vértice, para um laço)
+
+        Returns:
+            MatrizAdjacenciaPersistente: Nova versão
+        """
+        id_novo = len(self._linhas)
+        linha_nova = {}
+        alteracoes = {}
+        for vizinho in vizinhos:
+            if vizinho == novo_vertice:
+                linha_nova[id_novo] = 1
+                continue
+            id_vizinho = self.vertices.id_de(vizinho)
+            linha_nova[id_vizinho] = 1
+            if id_vizinho not in alteracoes:
+                alteracoes[id_vizinho] = dict(self._linhas[id_vizinho])
+            alteracoes[id_vizinho][id_novo] = 1
+        linhas = self._linhas.atualizar(alteracoes).anexar(linha_nova)
+        return MatrizAdjacenciaPersistente(self.vertices.inserir(novo_vertice, id_novo), linhas)
+
+    def excluir_vertice(self, vertice):
+        """
+        Retorna uma nova versão sem a linha e a coluna do vértice.
+
+        A coluna some da nova versão assim que o ID deixa de estar na ordem dos
+        vértices; as linhas dos vizinhos são copiadas só para descartar a entrada.
+
+        Args:
+            vertice: Vértice existente nesta versão
+
+        Returns:
+            MatrizAdjacenciaPersistente: Nova versão
+        """
+        id_vertice = self.vertices.id_de(vertice)
+        alteracoes = {id_vertice: None}
+        for id_vizinho in self._linhas[id_vertice]:
+            linha = self._linhas[id_vizinho]
+            if id_vizinho != id_vertice and linha is not None and id_vertice in linha:
+                linha = dict(linha)
+                del linha[id_vertice]
+                alteracoes[id_vizinho] = linha
+        return MatrizAdjacenciaPersistente(self.vertices.remover(vertice),
+                                           self._linhas.atualizar(alteracoes))
@@ -0,0 +1,245 @@
+"""
+Decomposição biconexa (articulações, pontes, blocos e árvore de blocos) sobre a CSR.
+
+Uma única DFS iterativa calcula a função low-point (lowpt) e mantém uma pilha
+com os IDs inteiros das arestas (algoritmo de Hopcroft-Tarjan): quando um filho
+v de p termina com low[v] >= d[p], as arestas empilhadas desde a aresta (p, v)
+formam um bloco; se, além disso, low[v] > d[p], a aresta (p, v) é uma ponte.
+
+A aresta de volta ao pai é ignorada pelo seu ID, e não pelo vértice: uma cópia
+paralela dessa aresta conta como aresta de retorno, então arestas paralelas
+nunca são pontes. Laços não afetam a biconexidade e ficam fora dos blocos.
+
+Tudo é guardado em vetores `array`, sem tuplas por aresta: os blocos ficam em
+formato compacto (início de cada bloco + IDs das arestas, como a CSR), e a
+árvore de blocos e articulações é uma CSR com um nó por bloco seguido de um nó
+por articulação.
+
+Para o grafo subjacente de um dígrafo (ver vista_subjacente.py), os vizinhos de
+cada vértice são os sucessores seguidos dos predecessores, lidos das duas CSRs
+do dígrafo, e os IDs são os dos arcos. Arcos paralelos ou opostos formam uma só
+aresta do grafo subjacente: a aresta de volta ao pai é ignorada pelo vértice (em
+todas as suas cópias), e as cópias de uma aresta de retorno entram no mesmo bloco.
+"""
+
+from array import array
+from collections.abc import Sequence
+
+from csr import CSR, tipo_indice, tipo_vetor, vetor_preenchido
+
+
+class BlocosArestas(Sequence):
+    """
+    Sequência de blocos em formato compacto: o bloco b é a fatia
+    arestas[inicio[b]:inicio[b + 1]] com os IDs das suas arestas.
+    """
+
+    def __init__(self, inicio, arestas):
+        """
+        Args:
+            inicio (array): num_blocos + 1 posições delimitando cada bloco
+            arestas (array): IDs das arestas, bloco após bloco
+        """
+        self.inicio = inicio
+        self.arestas = arestas
+
+    def __len__(self):
+        return len(self.inicio) - 1
+
+    def __getitem__(self, bloco):
+        if isinstance(bloco, slice):
+            return [self[b] for b in range(*bloco.indices(len(self)))]
+        if bloco < 0:
+            bloco += len(self)
+        if not 0 <= bloco < len(self):
+            raise IndexError("Índice de bloco fora do intervalo.")
+        return self.arestas[self.inicio[bloco]:self.inicio[bloco + 1]]
+
+    def __repr__(self):
+        return f"BlocosArestas({len(self)} blocos, {len(self.arestas)} arestas)"
+
+
+def decomposicao_biconexa_csr(csr, csr_reversa=None):
+    """
+    Calcula articulações, pontes e blocos em uma única DFS iterativa, O(V + E).
+
+    Args:
+        csr (CSR): Adjacências simétricas, com os IDs das arestas em `ids_arestas`
+        csr_reversa (CSR, optional): Predecessores de cada vértice, quando `csr`
+                                     são os sucessores de um dígrafo (decompõe o
+                                     grafo subjacente; os IDs são os dos arcos)
+
+    Returns:
+        dict: Dicionário contendo:
+            - 'articulacao': bytearray com 1 nos vértices de articulação
+            - 'pontes': array com os IDs das pontes, na ordem em que são encontradas
+            - 'blocos': BlocosArestas com os IDs das arestas de cada bloco, na
+                        ordem em que os blocos se completam na DFS
+    """
+    n = csr.num_vertices
+    offsets = csr.offsets
+    vizinhos = csr.vizinhos
+    ids_arestas = csr.ids_arestas
+    tipo_vertices = tipo_indice(n)
+    tipo_arestas = tipo_vetor(ids_arestas)
+
+    descoberta = vetor_preenchido(tipo_vertices, -1, n)
+    low = vetor_preenchido(tipo_vertices, 0, n)
+    pais = vetor_preenchido(tipo_vertices, -1, n)
+    aresta_pai = vetor_preenchido(tipo_arestas, -1, n)
+    proximo = array(tipo_vetor(offsets), offsets[:n])
+    pilha = array(tipo_vertices)
+    pilha_arestas = array(tipo_arestas)
+    subjacente = csr_reversa is not None
+    if subjacente:
+        offsets_reversa = csr_reversa.offsets
+        vizinhos_reversa = csr_reversa.vizinhos
+        ids_reversa = csr_reversa.ids_arestas
+        proximo_reversa = array(tipo_vetor(offsets_reversa), offsets_reversa[:n])
+
+    articulacao = bytearray(n)
+    pontes = array(tipo_arestas)
+    inicio_blocos = array(tipo_vetor(offsets), [0])
+    arestas_blocos = array(tipo_arestas)
+    contador = 0
+
+    for raiz in range(n):
+        if descoberta[raiz] >= 0:
+            continue
+        descoberta[raiz] = low[raiz] = contador
+        contador += 1
+        pilha.append(raiz)
+        filhos_raiz = 0
+
+        while pilha:
+            u = pilha[-1]
+            posicao = proximo[u]
+            fim = offsets[u + 1]
+            id_pai = aresta_pai[u]
+            pai = pais[u] if subjacente else -1
+            while posicao < fim:
+                v = vizinhos[posicao]
+                id_aresta = ids_arestas[posicao]
+                posicao += 1
+                if descoberta[v] < 0:
+                    break
+                # Aresta de retorno para um ancestral (cada uma é vista uma vez deste
+                # lado; do lado do ancestral, d[v] > d[u] e ela é ignorada)
+                if descoberta[v] < descoberta[u] and id_aresta != id_pai and v != pai:
+                    pilha_arestas.append(id_aresta)
+                    if descoberta[v] < low[u]:
+                        low[u] = descoberta[v]
+            else:
+                v = -1
+            proximo[u] = posicao
+
+            if v < 0 and subjacente:
+                # Sucessores esgotados: continua pelos predecessores
+                posicao = proximo_reversa[u]
+                fim = offsets_reversa[u + 1]
+                while posicao < fim:
+                    v = vizinhos_reversa[posicao]
+                    id_aresta = ids_reversa[posicao]
+                    posicao += 1
+                    if descoberta[v] < 0:
+                        break
+                    if descoberta[v] < descoberta[u] and v != pai:
+                        pilha_arestas.append(id_aresta)
+                        if descoberta[v] < low[u]:
+                            low[u] = descoberta[v]
+                else:
+                    v = -1
+                proximo_reversa[u] = posicao
+
+            if v >= 0:
+                # Aresta de árvore: desce para v
+                pais[v] = u
+                aresta_pai[v] = id_aresta
+                descoberta[v] = low[v] = contador
+                contador += 1
+                pilha_arestas.append(id_aresta)
+                pilha.append(v)
+                continue
+
+            # u finalizado: propaga o lowpt e fecha o bloco, se for o caso
+            pilha.pop()
+            p = pais[u]
+            if p < 0:
+                continue
+            if low[u] < low[p]:
+                low[p] = low[u]
+            if low[u] >= descoberta[p]:
+                if pais[p] >= 0:
+                    articulacao[p] = 1
+                else:
+                    filhos_raiz += 1
+                id_pai = aresta_pai[u]
+                while True:
+                    id_aresta = pilha_arestas.pop()
+                    arestas_blocos.append(id_aresta)
+                    if id_aresta == id_pai:
+                        break
+                inicio_blocos.append(len(arestas_blocos))
+                if low[u] > descoberta[p]:
+                    pontes.append(id_pai)
+
+        # A raiz da DFS só é articulação se tiver mais de um filho
+        if filhos_raiz > 1:
+            articulacao[raiz] = 1
+
+    return {
+        'articulacao': articulacao,
+        'pontes': pontes,
+        'blocos': BlocosArestas(inicio_blocos, arestas_blocos)
+    }
+
+
+def arvore_blocos_csr(blocos, articulacao, origens, destinos):
+    """
+    Monta a árvore de blocos e articulações (block-cut tree) em O(V + E).
+
+    Os nós 0..num_blocos - 1 são os blocos e os nós seguintes são as articulações,
+    em ordem crescente de índice de vértice. Cada bloco se liga às articulações
+    que contém; um vetor de marcas (o último bloco que registrou cada vértice)
+    evita ligações repetidas.
+
+    Args:
+        blocos (BlocosArestas): Blocos de decomposicao_biconexa_csr
+        articulacao (bytearray): 1 nos vértices de articulação
+        origens (sequence): Primeira extremidade de cada aresta, por ID
+        destinos (sequence): Segunda extremidade de cada aresta, por ID
+
+    Returns:
+        tuple: (csr, articulacoes): a CSR simétrica da árvore e um array com o
+               vértice de cada nó de articulação (nó num_blocos + k -> articulacoes[k])
+    """
+    n = len(articulacao)
+    num_blocos = len(blocos)
+    tipo_vertices = tipo_indice(n)
+    articulacoes = array(tipo_vertices, (v for v in range(n) if articulacao[v]))
+    tipo_nos = tipo_indice(num_blocos + len(articulacoes))
+    no_da_articulacao = vetor_preenchido(tipo_nos, -1, n)
+    for k, v in enumerate(articulacoes):
+        no_da_articulacao[v] = num_blocos + k
+
+    marca = vetor_preenchido(tipo_nos, -1, n)
+    ligacoes_blocos = array(tipo_nos)
+    ligacoes_articulacoes = array(tipo_nos)
+    inicio = blocos.inicio
+    arestas = blocos.arestas
+    for bloco in range(num_blocos):
+        for id_aresta in arestas[inicio[bloco]:inicio[bloco + 1]]:
+            x = origens[id_aresta]
+            if articulacao[x] and marca[x] != bloco:
+                marca[x] = bloco
+                ligacoes_blocos.append(bloco)
+                ligacoes_articulacoes.append(no_da_articulacao[x])
+            x = destinos[id_aresta]
+            if articulacao[x] and marca[x] != bloco:
+                marca[x] = bloco
+                ligacoes_blocos.append(bloco)
+                ligacoes_articulacoes.append(no_da_articulacao[x])
+
+    csr = CSR.construir(num_blocos + len(articulacoes), ligacoes_blocos,
+                        ligacoes_articulacoes, simetrico=True)
+    return csr, articulacoes
@@ -0,0 +1,110 @@
+"""
+Verificação de bipartição (coloração com 2 cores) sobre a CSR, com certificado.
+
+A coloração é feita por BFS, componente por componente, em O(V + E), com o
+estado em vetores `array`: a cor de cada vértice (-1 enquanto não visitado), a
+fila (o próprio vetor da ordem de visita, percorrido por um cursor) e, quando
+pedido, o pai de cada vértice na árvore da BFS.
+
+Se uma aresta (u, v) liga dois vértices da mesma cor, u e v estão no mesmo nível
+da BFS (vizinhos diferem de no máximo um nível, e a cor é a paridade do nível).
+Subindo pelos pais a partir dos dois ao mesmo tempo, o primeiro vértice comum é
+o ancestral comum mais próximo (LCA) w, e w -> ... -> u, v -> ... -> w é um
+ciclo de comprimento 2k + 1, reconstruído em O(comprimento do ciclo).
+
+Para o grafo subjacente de um dígrafo (ver vista_subjacente.py), os vizinhos de
+cada vértice são os sucessores seguidos dos predecessores, lidos das duas CSRs
+do dígrafo; vizinhos repetidos não alteram a coloração.
+"""
+
+from array import array
+from itertools import chain
+
+from csr import tipo_indice, vetor_preenchido
+
+SEM_COR = -1
+
+
+def coloracao_bipartida_csr(csr, registrar_pais=True, csr_reversa=None):
+    """
+    Tenta colorir os vértices com duas cores, parando no primeiro conflito.
+
+    Args:
+        csr (CSR): Adjacências simétricas do grafo
+        registrar_pais (bool): Se False, não guarda a árvore da BFS (resposta
+                               sim/não, sem certificado e com menos memória)
+        csr_reversa (CSR, optional): Predecessores de cada vértice, quando `csr`
+                                     são os sucessores de um dígrafo (colore o
+                                     grafo subjacente)
+
+    Returns:
+        tuple: (cores, pais, conflito): array com a cor (0 ou 1) de cada vértice
+               (SEM_COR nos não alcançados antes de um conflito), array com o pai
+               de cada vértice na BFS (-1 nas raízes; None se registrar_pais for
+               False) e a aresta (u, v) com as duas pontas da mesma cor (None se
+               o grafo for bipartido)
+    """
+    n = csr.num_vertices
+    offsets = csr.offsets
+    vizinhos = csr.vizinhos
+    if csr_reversa is not None:
+        offsets_reversa = csr_reversa.offsets
+        vizinhos_reversa = csr_reversa.vizinhos
+    tipo = tipo_indice(n)
+
+    cores = vetor_preenchido('b', SEM_COR, n)
+    pais = vetor_preenchido(tipo, -1, n) if registrar_pais else None
+    fila = array(tipo)
+
+    for raiz in range(n):
+        if cores[raiz] != SEM_COR:
+            continue
+        cores[raiz] = 0
+        cabeca = len(fila)
+        fila.append(raiz)
+        while cabeca < len(fila):
+            u = fila[cabeca]
+            cabeca += 1
+            cor_u = cores[u]
+            linha = vizinhos[offsets[u]:offsets[u + 1]]
+            if csr_reversa is not None:
+                linha = chain(linha, vizinhos_reversa[offsets_reversa[u]:offsets_reversa[u + 1]])
+            for v in linha:
+                cor_v = cores[v]
+                if cor_v == SEM_COR:
+                    cores[v] = 1 - cor_u
+                    if registrar_pais:
+                        pais[v] = u
+                    fila.append(v)
+                elif cor_v == cor_u:
+                    return cores, pais, (u, v)
+
+    return cores, pais, None
+
+
+def ciclo_impar_bfs(pais, u, v):
+    """
+    Reconstrói o ciclo ímpar certificado pela aresta (u, v) entre vértices da mesma cor.
+
+    Args:
+        pais (array): Pai de cada vértice na árvore da BFS de coloracao_bipartida_csr
+        u, v (int): Extremidades da aresta em conflito (mesmo nível da BFS)
+
+    Returns:
+        list: Índices [w, ..., u, v, ..., x] do ciclo, com w o LCA de u e v; cada
+              vértice é adjacente ao seguinte e o último é adjacente ao primeiro
+    """
+    # Laço: o ciclo ímpar é o próprio vértice
+    if u == v:
+        return [u]
+    subida_u = [u]
+    subida_v = [v]
+    # Mesmo nível: sobem juntos até se encontrarem no LCA
+    while u != v:
+        u = pais[u]
+        v = pais[v]
+        subida_u.append(u)
+        subida_v.append(v)
+    subida_v.pop()
+    subida_u.reverse()
+    return subida_u + subida_v
@@ -0,0 +1,422 @@
+"""
+Motor de Busca em Largura (BFS) sobre a representação CSR.
+
+A busca roda em O(V + E): a fila é o próprio vetor com a ordem de visitação
+(percorrido por um cursor), os vértices descobertos são marcados em um mapa de
+bytes e cada lista de vizinhos é lida uma única vez. O modo determinístico não
+ordena nada durante a busca; ele apenas recebe uma CSR com as linhas já
+ordenadas (ver CSR.ordenada).
+
+Para várias fontes há duas variantes:
+- BFS bit-paralela: cada vértice guarda uma máscara com um bit por fonte, e
+  uma única varredura de fronteira por nível avança até `tamanho_lote` buscas
+  ao mesmo tempo (64 por padrão, uma palavra de máquina);
+- BFS multi-fonte simples: todas as fontes entram juntas na fila, rotulando
+  cada vértice com a fonte mais próxima em um único O(V + E).
+
+A BFS com otimização de direção (Beamer et al.) alterna, nível a nível, entre
+o passo top-down (a fronteira examina seus arcos de saída) e o bottom-up (cada
+vértice ainda não visitado procura um predecessor na fronteira pelos arcos de
+entrada, parando no primeiro). Quando a fronteira cobre boa parte do grafo, o
+bottom-up examina muito menos arcos.
+"""
+
+from array import array
+
+from csr import tipo_indice, vetor_preenchido
+
+
+def busca_em_largura_csr(csr, inicio, bloqueados=None, arestas_bloqueadas=None):
+    """
+    Executa a BFS a partir do índice `inicio` e devolve vetores indexados por vértice.
+
+    Vértices e arestas podem ser ocultados sem alterar a CSR (ver vista_mascarada.py):
+    os vértices bloqueados já começam marcados como visitados, sem custo por aresta.
+
+    Args:
+        csr (CSR): Estrutura de adjacência (para visitar os vizinhos em ordem
+                   crescente, passe uma CSR ordenada)
+        inicio (int): Índice do vértice inicial
+        bloqueados (bytearray, optional): 1 nos vértices que a busca não pode visitar
+        arestas_bloqueadas (set, optional): IDs (de `ids_arestas`) das arestas ignoradas
+
+    Returns:
+        dict: Dicionário contendo:
+            - 'ordem': array com os índices na ordem de visitação
+            - 'distancias': array com a distância de cada vértice (-1 se inalcançável)
+            - 'pais': array com o pai de cada vértice na árvore BFS (-1 se não houver)
+    """
+    n = csr.num_vertices
+    tipo = tipo_indice(n)
+    offsets = csr.offsets
+    vizinhos = csr.vizinhos
+
+    visitados = bytearray(n) if bloqueados is None else bytearray(bloqueados)
+    distancias = vetor_preenchido(tipo, -1, n)
+    pais = vetor_preenchido(tipo, -1, n)
+
+    # A ordem de visitação funciona como fila: `cabeca` aponta o próximo a processar
+    ordem = array(tipo, [inicio])
+    visitados[inicio] = 1
+    distancias[inicio] = 0
+    cabeca = 0
+
+    if arestas_bloqueadas:
+        ids_arestas = csr.ids_arestas
+        while cabeca < len(ordem):
+            u = ordem[cabeca]
+            cabeca += 1
+            distancia_vizinhos = distancias[u] + 1
+            for posicao in range(offsets[u], offsets[u + 1]):
+                v = vizinhos[posicao]
+                if not visitados[v] and ids_arestas[posicao] not in arestas_bloqueadas:
+                    visitados[v] = 1
+                    distancias[v] = distancia_vizinhos
+                    pais[v] = u
+                    ordem.append(v)
+    else:
+        while cabeca < len(ordem):
+            u = ordem[cabeca]
+            cabeca += 1
+            distancia_vizinhos = distancias[u] + 1
+            for v in vizinhos[offsets[u]:offsets[u + 1]]:
+                if not visitados[v]:
+                    visitados[v] = 1
+                    distancias[v] = distancia_vizinhos
+                    pais[v] = u
+                    ordem.append(v)
+
+    return {
+        'ordem': ordem,
+        'distancias': distancias,
+        'pais': pais
+    }
+
+
+ALFA_PADRAO = 14
+BETA_PADRAO = 24
+
+TOP_DOWN = 'top-down'
+BOTTOM_UP = 'bottom-up'
+
+
+def busca_em_largura_direcional_csr(csr, csr_reversa, inicio, alfa=ALFA_PADRAO,
+                                    beta=BETA_PADRAO):
+    """
+    Executa a BFS com otimização de direção a partir do índice `inicio`.
+
+    Critérios de troca (os mesmos da implementação de referência do GAP):
+    - top-down -> bottom-up quando os arcos de saída da fronteira superam
+      1/alfa dos arcos de entrada dos vértices ainda não visitados;
+    - bottom-up -> top-down quando a fronteira para de crescer e fica menor
+      que 1/beta dos vértices.
+
+    As distâncias são sempre as da BFS comum; a ordem de visitação dentro de um
+    nível e o pai escolhido podem diferir nos níveis bottom-up (o pai é o
+    primeiro predecessor na fronteira, na ordem das linhas de `csr_reversa`).
+
+    Args:
+        csr (CSR): Arcos de saída
+        csr_reversa (CSR): Arcos de entrada (ver CSR.transposta)
+        inicio (int): Índice do vértice inicial
+        alfa (float): Limiar de troca para bottom-up (maior = troca mais cedo)
+        beta (float): Limiar de volta ao top-down (maior = volta mais tarde)
+
+    Returns:
+        dict: As chaves de `busca_em_largura_csr` e mais:
+            - 'niveis': lista com um dicionário por nível expandido, com
+              'nivel', 'direcao' (TOP_DOWN ou BOTTOM_UP), 'fronteira' (vértices
+              no nível), 'arcos_examinados' e 'descobertos' (vértices do nível seguinte)
+
+    Raises:
+        ValueError: Se alfa ou beta não forem positivos
+    """
+    if alfa <= 0 or beta <= 0:
+        raise ValueError("Os limiares alfa e beta devem ser positivos.")
+    n = csr.num_vertices
+    tipo = tipo_indice(n)
+    offsets = csr.offsets
+    vizinhos = csr.vizinhos
+    offsets_entrada = csr_reversa.offsets
+    predecessores = csr_reversa.vizinhos
+
+    distancias = vetor_preenchido(tipo, -1, n)
+    pais = vetor_preenchido(tipo, -1, n)
+    ordem = array(tipo, [inicio])
+    distancias[inicio] = 0
+
+    # m_f: arcos de saída da fronteira; m_u: arcos de entrada dos não visitados
+    arcos_fronteira = offsets[inicio + 1] - offsets[inicio]
+    arcos_nao_explorados = (len(predecessores)
+                            - (offsets_entrada[inicio + 1] - offsets_entrada[inicio]))
+    nao_visitados = None  # candidatos do bottom-up, montados na primeira troca
+    niveis = []
+    inicio_fronteira, fim_fronteira = 0, 1
+    tamanho_anterior = 0
+    bottom_up = False
+    nivel = 0
+
+    while inicio_fronteira < fim_fronteira:
+        tamanho = fim_fronteira - inicio_fronteira
+        if bottom_up:
+            bottom_up = tamanho >= tamanho_anterior or tamanho > n / beta
+        else:
+            bottom_up = arcos_fronteira > arcos_nao_explorados / alfa
+        distancia_vizinhos = nivel + 1
+        proximos_arcos_fronteira = 0
+
+        if bottom_up:
+            if nao_visitados is None:
+                nao_visitados = [v for v in range(n) if distancias[v] < 0]
+            examinados = 0
+            restantes = []
+            for v in nao_visitados:
+                if distancias[v] >= 0:
+                    continue  # visitado em um passo top-down posterior à montagem
+                inicio_linha = offsets_entrada[v]
+                fim_linha = offsets_entrada[v + 1]
+                for k in range(inicio_linha, fim_linha):
+                    u = predecessores[k]
+                    if distancias[u] == nivel:
+                        distancias[v] = distancia_vizinhos
+                        pais[v] = u
+                        ordem.append(v)
+                        examinados += k - inicio_linha + 1
+                        arcos_nao_explorados -= fim_linha - inicio_linha
+                        proximos_arcos_fronteira += offsets[v + 1] - offsets[v]
+                        break
+                else:
+                    examinados += fim_linha - inicio_linha
+                    restantes.append(v)
+            nao_visitados = restantes
+        else:
+            examinados = arcos_fronteira
+            for i in range(inicio_fronteira, fim_fronteira):
+                u = ordem[i]
+                for v in vizinhos[offsets[u]:offsets[u + 1]]:
+                    if distancias[v] < 0:
+                        distancias[v] = distancia_vizinhos
+                        pais[v] = u
+                        ordem.append(v)
+                        arcos_nao_explorados -= offsets_entrada[v + 1] - offsets_entrada[v]
+                        proximos_arcos_fronteira += offsets[v + 1] - offsets[v]
+
+        niveis.append({
+            'nivel': nivel,
+            'direcao': BOTTOM_UP if bottom_up else TOP_DOWN,
+            'fronteira': tamanho,
+            'arcos_examinados': examinados,
+            'descobertos': len(ordem) - fim_fronteira
+        })
+        tamanho_anterior = tamanho
+        arcos_fronteira = proximos_arcos_fronteira
+        inicio_fronteira, fim_fronteira = fim_fronteira, len(ordem)
+        nivel += 1
+
+    return {
+        'ordem': ordem,
+        'distancias': distancias,
+        'pais': pais,
+        'niveis': niveis
+    }
+
+
+def tipo_distancia(num_vertices):
+    """
+    Retorna o menor typecode de `array` capaz de guardar distâncias de 0 a
+    num_vertices - 1 e o marcador -1 (inalcançável).
+    """
+    if num_vertices <= 2 ** 7:
+        return 'b'
+    if num_vertices <= 2 ** 15:
+        return 'h'
+    return tipo_indice(num_vertices)
+
+
+def _tabela_bits_por_byte(num_bytes):
+    """
+    Para cada posição de byte p e valor b, a tupla com as posições absolutas
+    (8p + i) dos bits ligados em b: extrai os bits de uma máscara byte a byte.
+    """
+    bits_do_byte = [tuple(i for i in range(8) if byte >> i & 1) for byte in range(256)]
+    return [
+        [tuple(8 * posicao + i for i in bits) for bits in bits_do_byte]
+        for posicao in range(num_bytes)
+    ]
+
+
+def busca_em_largura_multipla_csr(csr, fontes, tamanho_lote=64):
+    """
+    Calcula as distâncias de cada fonte a todos os vértices com BFS bit-paralela.
+
+    As fontes são processadas em lotes de `tamanho_lote`; dentro de um lote, o bit
+    k da máscara de um vértice indica que a k-ésima fonte do lote já o alcançou.
+    Cada nível da busca percorre a fronteira uma única vez, propagando por OR as
+    máscaras de todas as fontes que chegaram ao vértice naquele nível.
+
+    Args:
+        csr (CSR): Estrutura de adjacência
+        fontes (sequence): Índices dos vértices de origem (repetições são permitidas)
+        tamanho_lote (int): Quantidade de fontes por máscara (64 = uma palavra)
+
+    Returns:
+        list: Uma linha (array de tipo compacto, ver tipo_distancia) por fonte, com
+              a distância a cada vértice (-1 se inalcançável)
+    """
+    if tamanho_lote < 1:
+        raise ValueError("O tamanho do lote deve ser positivo.")
+    n = csr.num_vertices
+    offsets = csr.offsets
+    vizinhos = csr.vizinhos
+    linhas = [vetor_preenchido(tipo_distancia(n), -1, n) for _ in fontes]
+    bytes_por_mascara = (tamanho_lote + 7) // 8
+    tabela_bits = _tabela_bits_por_byte(bytes_por_mascara)
+
+    for inicio_lote in range(0, len(fontes), tamanho_lote):
+        lote = fontes[inicio_lote:inicio_lote + tamanho_lote]
+        linhas_lote = linhas[inicio_lote:inicio_lote + tamanho_lote]
+        vistos = [0] * n
+        acumulado = [0] * n  # máscaras que chegam a cada vértice no próximo nível
+        fronteira = []       # pares (vértice, máscara das fontes que chegaram nele)
+        for k, fonte in enumerate(lote):
+            if not vistos[fonte]:
+                fronteira.append(fonte)
+            vistos[fonte] |= 1 << k
+            linhas_lote[k][fonte] = 0
+        fronteira = [(u, vistos[u]) for u in fronteira]
+
+        distancia = 0
+        while fronteira:
+            distancia += 1
+            tocados = []
+            for u, mascara in fronteira:
+                for v in vizinhos[offsets[u]:offsets[u + 1]]:
+                    if not acumulado[v]:
+                        tocados.append(v)
+                    acumulado[v] |= mascara
+
+            fronteira = []
+            for v in tocados:
+                novos = acumulado[v] & ~vistos[v]
+                acumulado[v] = 0
+                if novos:
+                    vistos[v] |= novos
+                    fronteira.append((v, novos))
+                    for posicao, byte in enumerate(novos.to_bytes(bytes_por_mascara, 'little')):
+                        if byte:
+                            for k in tabela_bits[posicao][byte]:
+                                linhas_lote[k][v] = distancia
+
+    return linhas
+
+
+def busca_fonte_mais_proxima_csr(csr, fontes):
+    """
+    BFS multi-fonte: rotula cada vértice com a fonte mais próxima e a distância a ela.
+
+    Todas as fontes começam na fila com distância 0; empates são resolvidos a
+    favor da fonte que aparece primeiro em `fontes` (e, depois, pela ordem das
+    adjacências da CSR).
+
+    Args:
+        csr (CSR): Estrutura de adjacência
+        fontes (sequence): Índices dos vértices de origem
+
+    Returns:
+        dict: Dicionário contendo:
+            - 'ordem': array com os índices na ordem de visitação
+            - 'distancias': array com a distância à fonte mais próxima (-1 se inalcançável)
+            - 'fontes': array com a posição em `fontes` da fonte mais próxima (-1 se nenhuma)
+    """
+    n = csr.num_vertices
+    tipo = tipo_indice(max(n, len(fontes)))
+    offsets = csr.offsets
+    vizinhos = csr.vizinhos
+
+    distancias = vetor_preenchido(tipo, -1, n)
+    fonte_de = vetor_preenchido(tipo, -1, n)
+    ordem = array(tipo)
+    for posicao, fonte in enumerate(fontes):
+        if fonte_de[fonte] < 0:
+            fonte_de[fonte] = posicao
+            distancias[fonte] = 0
+            ordem.append(fonte)
+
+    cabeca = 0
+    while cabeca < len(ordem):
+        u = ordem[cabeca]
+        cabeca += 1
+        distancia_vizinhos = distancias[u] + 1
+        fonte_u = fonte_de[u]
+        for v in vizinhos[offsets[u]:offsets[u + 1]]:
+            if fonte_de[v] < 0:
+                fonte_de[v] = fonte_u
+                distancias[v] = distancia_vizinhos
+                ordem.append(v)
+
+    return {
+        'ordem': ordem,
+        'distancias': distancias,
+        'fontes': fonte_de
+    }
+
+
+def resultado_bfs_com_rotulos(resultado, rotulos):
+    """
+    Converte o resultado de `busca_em_largura_csr` para o formato com rótulos
+    usado por Grafo.busca_em_largura e Digrafo.busca_em_largura.
+
+    Args:
+        resultado (dict): Retorno de `busca_em_largura_csr`
+        rotulos (list): Rótulo de cada índice (ex: vertices_ordenados)
+
+    Returns:
+        dict: Dicionário com 'ordem_visitacao', 'distancias', 'pais' e 'alcancaveis'
+    """
+    ordem = resultado['ordem']
+    distancias = resultado['distancias']
+    pais = resultado['pais']
+
+    ordem_visitacao = [rotulos[i] for i in ordem]
+    return {
+        'ordem_visitacao': ordem_visitacao,
+        'distancias': {rotulos[i]: distancias[i] for i in ordem},
+        'pais': {rotulos[i]: (rotulos[pais[i]] if pais[i] >= 0 else None) for i in ordem},
+        'alcancaveis': set(ordem_visitacao)
+    }
+
+
+def resultado_bfs_multipla_com_rotulos(csr, fontes, rotulos, modo, tamanho_lote):
+    """
+    Executa a BFS com várias fontes (índices) e converte o resultado para rótulos.
+    Usado por Grafo.busca_em_largura_multipla e Digrafo.busca_em_largura_multipla.
+
+    Args:
+        csr (CSR): Estrutura de adjacência
+        fontes (list): Índices dos vértices de origem
+        rotulos (list): Rótulo de cada índice (ex: vertices_ordenados)
+        modo (str): 'matriz' ou 'mais_proxima'
+        tamanho_lote (int): Fontes por máscara na BFS bit-paralela
+
+    Returns:
+        dict: Ver Grafo.busca_em_largura_multipla
+
+    Raises:
+        ValueError: Se o modo for desconhecido
+    """
+    if modo == 'matriz':
+        return {
+            'fontes': [rotulos[f] for f in fontes],
+            'distancias': busca_em_largura_multipla_csr(csr, fontes, tamanho_lote)
+        }
+    if modo == 'mais_proxima':
+        resultado = busca_fonte_mais_proxima_csr(csr, fontes)
+        distancias = resultado['distancias']
+        fonte_de = resultado['fontes']
+        return {
+            'fonte_mais_proxima': {
+                rotulos[v]: rotulos[fontes[fonte_de[v]]] for v in resultado['ordem']
+            },
+            'distancias': {rotulos[v]: distancias[v] for v in resultado['ordem']}
+        }
+    raise ValueError(f"Modo de busca desconhecido: '{modo}'.")
@@ -0,0 +1,143 @@
+"""
+Motor de Busca em Profundidade (DFS) iterativo sobre a representação CSR.
+
+A recursão foi substituída por uma pilha explícita de vértices e por um vetor
+`proximo` que guarda, para cada vértice, a posição do próximo vizinho a examinar.
+Assim a busca percorre componentes em forma de caminho com milhões de vértices
+sem esbarrar no limite de recursão do Python, examinando as arestas exatamente
+na mesma ordem da versão recursiva.
+
+Os tempos seguem a convenção de Cormen: um único relógio é incrementado na
+descoberta e na finalização de cada vértice (valores de 1 a 2V).
+"""
+
+from array import array
+
+from csr import tipo_indice, tipo_vetor, vetor_preenchido
+
+
+def busca_em_profundidade_csr(csr, nao_direcionado=False, raizes=None,
+                              calcular_low=False, classificar_arcos=False):
+    """
+    Executa uma DFS completa (floresta) sobre a CSR.
+
+    Args:
+        csr (CSR): Estrutura de adjacência
+        nao_direcionado (bool): Se True, a aresta que leva de volta ao pai é
+                                ignorada e cada aresta de retorno é registrada uma
+                                única vez, como par ordenado (menor, maior)
+        raizes (iterable, optional): Ordem em que os vértices são tentados como
+                                     raiz. Default: todos os índices em ordem
+        calcular_low (bool): Se True, calcula a função low-point (lowpt) de cada
+                             vértice, expressa em tempos de entrada
+        classificar_arcos (bool): Se True (dígrafos), classifica os arcos em
+                                  árvore, retorno, avanço e cruzamento
+
+    Returns:
+        dict: Dicionário contendo:
+            - 'ordem': array com os índices na ordem de descoberta
+            - 'pais': array com o pai de cada vértice (-1 para raízes)
+            - 'entrada': array com o tempo de descoberta de cada vértice
+            - 'saida': array com o tempo de finalização de cada vértice
+            - 'low': array com o lowpt de cada vértice (None se não calculado)
+            - 'arestas_retorno': lista de pares (u, v) de índices das arestas de retorno
+            - 'tipos_arcos': dict com listas de pares (u, v) para 'arvore', 'retorno',
+                             'avanco' e 'cruzamento' (None se não classificado)
+    """
+    n = csr.num_vertices
+    offsets = csr.offsets
+    vizinhos = csr.vizinhos
+    tipo_vertices = tipo_indice(n)
+    tipo_tempos = tipo_indice(2 * n)
+
+    ordem = array(tipo_vertices)
+    pais = vetor_preenchido(tipo_vertices, -1, n)
+    entrada = vetor_preenchido(tipo_tempos, 0, n)  # 0 = ainda não descoberto
+    saida = vetor_preenchido(tipo_tempos, 0, n)    # 0 = ainda não finalizado
+    low = vetor_preenchido(tipo_tempos, 0, n) if calcular_low else None
+    # Cópia gravável: posição do próximo vizinho de cada vértice
+    proximo = array(tipo_vetor(offsets), offsets[:n])
+    pilha = array(tipo_vertices)
+
+    arestas_retorno = []
+    retornos_registrados = set()
+    tipos_arcos = None
+    if classificar_arcos:
+        tipos_arcos = {'arvore': [], 'retorno': [], 'avanco': [], 'cruzamento': []}
+
+    tempo = 0
+    for raiz in (range(n) if raizes is None else raizes):
+        if entrada[raiz]:
+            continue
+
+        tempo += 1
+        entrada[raiz] = tempo
+        if calcular_low:
+            low[raiz] = tempo
+        ordem.append(raiz)
+        pilha.append(raiz)
+
+        while pilha:
+            u = pilha[-1]
+            posicao = proximo[u]
+
+            if posicao == offsets[u + 1]:
+                # Todos os vizinhos de u foram examinados: finaliza u
+                pilha.pop()
+                tempo += 1
+                saida[u] = tempo
+                p = pais[u]
+                if calcular_low and p >= 0 and low[u] < low[p]:
+                    low[p] = low[u]
+                continue
+
+            proximo[u] = posicao + 1
+            v = vizinhos[posicao]
+
+            if nao_direcionado and v == pais[u]:
+                continue  # Ignora a aresta que leva de volta ao pai imediato
+
+            if not entrada[v]:
+                # Aresta de árvore: desce para v
+                pais[v] = u
+                tempo += 1
+                entrada[v] = tempo
+                if calcular_low:
+                    low[v] = tempo
+                ordem.append(v)
+                pilha.append(v)
+                if classificar_arcos:
+                    tipos_arcos['arvore'].append((u, v))
+                continue
+
+            if calcular_low and entrada[v] < low[u]:
+                low[u] = entrada[v]
+
+            if nao_direcionado:
+                # Em grafos, a mesma aresta de retorno é vista pelas duas extremidades;
+                # registra na forma ordenada e apenas na primeira vez
+                aresta = (v, u) if v < u else (u, v)
+                if aresta not in retornos_registrados:
+                    retornos_registrados.add(aresta)
+                    arestas_retorno.append(aresta)
+            elif not saida[v]:
+                # v ainda está na pilha (cinza): arco de retorno
+                arestas_retorno.append((u, v))
+                if classificar_arcos:
+                    tipos_arcos['retorno'].append((u, v))
+            elif classificar_arcos:
+                # v já foi finalizado (preto): avanço ou cruzamento
+                if entrada[u] < entrada[v]:
+                    tipos_arcos['avanco'].append((u, v))
+                else:
+                    tipos_arcos['cruzamento'].append((u, v))
+
+    return {
+        'ordem': ordem,
+        'pais': pais,
+        'entrada': entrada,
+        'saida': saida,
+        'low': low,
+        'arestas_retorno': arestas_retorno,
+        'tipos_arcos': tipos_arcos
+    }
@@ -0,0 +1,101 @@
+"""
+Cache das representações derivadas de um grafo ou dígrafo.
+
+Estruturas como a CSR, a lista de adjacência e as matrizes são caras de montar
+e só mudam quando o grafo é modificado. Cada grafo mantém um contador de versão
+que é incrementado a cada mutação; uma entrada do cache só é reaproveitada se
+tiver sido construída na versão atual.
+
+As entradas são compartilhadas entre chamadas. Os métodos públicos que entregam
+estruturas alteráveis (listas, matrizes, vetores de resultado) devolvem cópias
+delas (ver `copiar_lista_adjacencia` e `copiar_matriz`), de modo que uma
+alteração feita pelo chamador não aparece na próxima consulta.
+"""
+
+
+class CacheRepresentacoes:
+    """
+    Cache por grafo com invalidação por número de versão e contagem de acertos/falhas.
+    """
+
+    def __init__(self):
+        """
+        Inicializa o cache vazio, na versão 0.
+        """
+        self.versao = 0
+        self.acertos = 0
+        self.falhas = 0
+        self._entradas = {}  # chave -> (versão em que foi construída, valor)
+
+    def obter(self, chave, construtor):
+        """
+        Retorna a representação associada a `chave`, construindo-a se necessário.
+
+        Args:
+            chave (hashable): Identificador da representação (ex: 'csr')
+            construtor (callable): Função sem argumentos que monta a representação
+
+        Returns:
+            O valor armazenado para a versão atual do grafo. O objeto é
+            compartilhado entre chamadas e não deve ser modificado pelo chamador.
+        """
+        entrada = self._entradas.get(chave)
+        if entrada is not None and entrada[0] == self.versao:
+            self.acertos += 1
+            return entrada[1]
+
+        self.falhas += 1
+        valor = construtor()
+        self._entradas[chave] = (self.versao, valor)
+        return valor
+
+    def consultar(self, chave):
+        """
+        Retorna a representação já construída na versão atual, ou None, sem
+        construí-la nem alterar a contagem de acertos/falhas.
+        """
+        entrada = self._entradas.get(chave)
+        if entrada is not None and entrada[0] == self.versao:
+            return entrada[1]
+        return None
+
+    def registrar_mutacao(self):
+        """
+        Incrementa a versão do grafo, invalidando todas as representações em cache.
+        """
+        self.versao += 1
+        # As entradas antigas nunca mais serão usadas: libera a memória
+        self._entradas.clear()
+
+    def estatisticas(self):
+        """
+        Retorna um resumo do uso do cache.
+
+        Returns:
+            dict: Dicionário contendo:
+                - 'versao': Versão atual do grafo
+                - 'acertos': Quantidade de consultas atendidas pelo cache
+                - 'falhas': Quantidade de consultas que exigiram construção
+                - 'entradas': Representações atualmente armazenadas
+        """
+        return {
+            'versao': self.versao,
+            'acertos': self.acertos,
+            'falhas': self.falhas,
+            'entradas': sorted(str(chave) for chave in self._entradas)
+        }
+
+
+def copiar_lista_adjacencia(lista_adj):
+    """
+    Copia um dicionário vértice -> lista de vizinhos, lista a lista, em O(V + E).
+    """
+    return {vertice: list(vizinhos) for vertice, vizinhos in lista_adj.items()}
+
+
+def copiar_matriz(matriz):
+    """
+    Copia uma matriz em lista de listas, linha a linha.
+    """
+    return [list(linha) for linha in matriz]
+
@@ -0,0 +1,373 @@
+"""
+Carregadores de grafos a partir de arquivos, sem interação com o usuário.
+
+Formatos suportados:
+- lista de arestas CSV/TSV (ou separada por espaços), inclusive compactada com gzip;
+- lista de adjacências em texto ("v: w1 w2 ..." ou "v w1 w2 ...");
+- Matrix Market (formato coordinate);
+- SNAP (lista de arestas com IDs inteiros e comentários iniciados por '#').
+
+Os arquivos são lidos uma única vez, em blocos de `tamanho_buffer` caracteres.
+Cada rótulo é convertido em um ID inteiro na primeira vez que aparece e as arestas
+vão direto para dois vetores `array` de IDs (sem lista intermediária de tuplas);
+o Grafo/Digrafo é então criado com `de_extremidades`. Com `rotulos_compactos=True`,
+os rótulos vão para uma TabelaRotulos (ver tabela_rotulos.py) em vez de um
+dicionário e uma lista: bem menos memória para rótulos longos (URLs, hashes), ao
+custo de uma carga mais lenta.
+"""
+
+import gzip
+from array import array
+
+from csr import LIMITE_INT32
+from digrafo import Digrafo
+from grafo import Grafo
+from tabela_rotulos import TabelaRotulos
+
+TAMANHO_BUFFER_PADRAO = 1 << 20  # 1 Mi caracteres por leitura
+
+
+def _abrir(caminho):
+    """
+    Abre o arquivo em modo texto, descompactando gzip quando necessário
+    (detectado pelos bytes mágicos, não pela extensão).
+    """
+    with open(caminho, 'rb') as arquivo:
+        compactado = arquivo.read(2) == b'\x1f\x8b'
+    if compactado:
+        return gzip.open(caminho, 'rt', encoding='utf-8')
+    return open(caminho, 'r', encoding='utf-8')
+
+
+def ler_linhas(caminho, comentarios=('#',), tamanho_buffer=TAMANHO_BUFFER_PADRAO,
+               ao_comentar=None):
+    """
+    Lê o arquivo em blocos e produz as linhas de dados (sem espaços nas pontas).
+
+    Linhas vazias são ignoradas; linhas iniciadas por um dos prefixos de
+    `comentarios` também, sendo repassadas a `ao_comentar` quando informado.
+
+    Args:
+        caminho (str): Caminho do arquivo (texto ou gzip)
+        comentarios (tuple): Prefixos de linhas de comentário
+        tamanho_buffer (int): Quantidade de caracteres lidos por vez
+        ao_comentar (callable, optional): Função chamada com cada linha de comentário
+
+    Yields:
+        str: Cada linha de dados
+    """
+    if tamanho_buffer < 1:
+        raise ValueError("O tamanho do buffer deve ser positivo.")
+    comentarios = tuple(comentarios)
+    with _abrir(caminho) as arquivo:
+        resto = ''
+        while True:
+            bloco = arquivo.read(tamanho_buffer)
+            if not bloco:
+                break
+            linhas = (resto + bloco).split('\n')
+            resto = linhas.pop()  # última linha pode estar incompleta
+            for linha in linhas:
+                linha = linha.strip()
+                if not linha:
+                    continue
+                if comentarios and linha.startswith(comentarios):
+                    if ao_comentar is not None:
+                        ao_comentar(linha)
+                    continue
+                yield linha
+        linha = resto.strip()
+        if linha:
+            if comentarios and linha.startswith(comentarios):
+                if ao_comentar is not None:
+                    ao_comentar(linha)
+            else:
+                yield linha
+
+
+class _AcumuladorArestas:
+    """
+    Converte rótulos em IDs sequenciais e guarda as extremidades em vetores.
+    """
+
+    def __init__(self, rotulos_compactos=False):
+        # Com rótulos compactos, a TabelaRotulos faz o papel do dicionário e da lista
+        self.ids = None if rotulos_compactos else {}
+        self.rotulos = TabelaRotulos() if rotulos_compactos else []
+        self.origens = array('i')
+        self.destinos = array('i')
+
+    def _ampliar_vetores(self):
+        # Mais de 2^31 vértices: passa a usar inteiros de 64 bits
+        self.origens = array('q', self.origens)
+        self.destinos = array('q', self.destinos)
+
+    def id_de(self, rotulo):
+        if self.ids is None:
+            id_vertice = self.rotulos.internar(rotulo)
+            if id_vertice == LIMITE_INT32 + 1 and self.origens.typecode == 'i':
+                self._ampliar_vetores()
+            return id_vertice
+        id_vertice = self.ids.get(rotulo)
+        if id_vertice is None:
+            id_vertice = len(self.rotulos)
+            if id_vertice == LIMITE_INT32 + 1:
+                self._ampliar_vetores()
+            self.ids[rotulo] = id_vertice
+            self.rotulos.append(rotulo)
+        return id_vertice
+
+    def adicionar(self, rotulo_origem, rotulo_destino):
+        ids = self.ids
+        if ids is None:
+            id_origem = self.id_de(rotulo_origem)
+            self.origens.append(id_origem)
+            self.destinos.append(self.id_de(rotulo_destino))
+            return
+        # Caminho rápido: rótulos já vistos custam só uma consulta ao dicionário
+        id_origem = ids.get(rotulo_origem)
+        if id_origem is None:
+            id_origem = self.id_de(rotulo_origem)
+        id_destino = ids.get(rotulo_destino)
+        if id_destino is None:
+            id_destino = self.id_de(rotulo_destino)
+        self.origens.append(id_origem)
+        self.destinos.append(id_destino)
+
+    def construir(self, direcionado):
+        classe = Digrafo if direcionado else Grafo
+        return classe.de_extremidades(self.rotulos, self.origens, self.destinos)
+
+
+def _delimitador_padrao(caminho):
+    nome = caminho[:-3] if caminho.endswith('.gz') else caminho
+    if nome.endswith('.csv'):
+        return ','
+    if nome.endswith('.tsv'):
+        return '\t'
+    return None  # qualquer sequência de espaços/tabulações
+
+
+def carregar_lista_arestas(caminho, direcionado=False, delimitador='auto', colunas=(0, 1),
+                           cabecalho=False, comentarios=('#',), tipo_rotulo=str,
+                           tamanho_buffer=TAMANHO_BUFFER_PADRAO, rotulos_compactos=False):
+    """
+    Carrega uma lista de arestas (uma aresta por linha), como CSV, TSV ou texto.
+
+    Args:
+        caminho (str): Caminho do arquivo (pode estar compactado com gzip)
+        direcionado (bool): Se True, retorna um Digrafo; senão, um Grafo
+        delimitador (str ou None): Separador de colunas; 'auto' escolhe ',' para
+                                   .csv, tabulação para .tsv e espaços nos demais;
+                                   None separa por qualquer espaço em branco
+        colunas (tuple): Posições das colunas de origem e destino
+        cabecalho (bool): Se True, descarta a primeira linha de dados
+        comentarios (tuple): Prefixos de linhas de comentário
+        tipo_rotulo (callable): Conversão aplicada a cada rótulo (ex: int)
+        tamanho_buffer (int): Quantidade de caracteres lidos por vez
+        rotulos_compactos (bool): Se True, guarda os rótulos em uma TabelaRotulos
+
+    Returns:
+        Grafo ou Digrafo: Estrutura carregada
+
+    Raises:
+        ValueError: Se alguma linha não tiver as colunas indicadas
+    """
+    if delimitador == 'auto':
+        delimitador = _delimitador_padrao(caminho)
+    coluna_origem, coluna_destino = colunas
+    acumulador = _AcumuladorArestas(rotulos_compactos)
+    adicionar = acumulador.adicionar
+
+    linhas = ler_linhas(caminho, comentarios, tamanho_buffer)
+    if cabecalho:
+        next(linhas, None)
+    for numero, linha in enumerate(linhas, 1):
+        campos = linha.split(delimitador)
+        try:
+            origem = campos[coluna_origem].strip()
+            destino = campos[coluna_destino].strip()
+        except IndexError:
+            raise ValueError(f"Linha {numero} inválida em '{caminho}': {linha!r}") from None
+        adicionar(tipo_rotulo(origem), tipo_rotulo(destino))
+
+    return acumulador.construir(direcionado)
+
+
+def carregar_lista_adjacencia(caminho, direcionado=False, simetrica=True, comentarios=('#',),
+                              tipo_rotulo=str, tamanho_buffer=TAMANHO_BUFFER_PADRAO,
+                              rotulos_compactos=False):
+    """
+    Carrega uma lista de adjacências: cada linha traz um vértice seguido dos seus
+    vizinhos, no formato "v: w1 w2 ..." ou "v w1 w2 ..." (vírgulas também separam).
+    Vértices sem vizinhos entram como vértices isolados.
+
+    Args:
+        caminho (str): Caminho do arquivo (pode estar compactado com gzip)
+        direcionado (bool): Se True, cada vizinho w gera o arco v -> w (Digrafo)
+        simetrica (bool): Para grafos: se True (padrão), cada aresta pode aparecer
+                          nas linhas das duas extremidades (como em
+                          criar_lista_adjacencia) ou em só uma delas, e é incluída
+                          uma única vez (arestas paralelas: o maior número de
+                          ocorrências entre as duas linhas); se False, cada
+                          ocorrência gera uma aresta
+        comentarios (tuple): Prefixos de linhas de comentário
+        tipo_rotulo (callable): Conversão aplicada a cada rótulo
+        tamanho_buffer (int): Quantidade de caracteres lidos por vez
+        rotulos_compactos (bool): Se True, guarda os rótulos em uma TabelaRotulos
+
+    Returns:
+        Grafo ou Digrafo: Estrutura carregada
+    """
+    acumulador = _AcumuladorArestas(rotulos_compactos)
+    deduplicar = simetrica and not direcionado
+    # Par (menor ID, maior ID) -> ocorrências na linha do menor menos na do maior:
+    # a aresta entra quando uma das linhas passa a ter mais ocorrências que a
+    # outra, então uma aresta listada só em uma linha também é incluída
+    saldos = {}
+
+    for linha in ler_linhas(caminho, comentarios, tamanho_buffer):
+        cabeca, separador, cauda = linha.partition(':')
+        if separador:
+            vizinhos = cauda.replace(',', ' ').split()
+        else:
+            cabeca, *vizinhos = linha.replace(',', ' ').split()
+        vertice = tipo_rotulo(cabeca.strip())
+        id_vertice = acumulador.id_de(vertice)
+        lacos = 0
+        for vizinho in vizinhos:
+            vizinho = tipo_rotulo(vizinho)
+            if not deduplicar:
+                acumulador.adicionar(vertice, vizinho)
+                continue
+            id_vizinho = acumulador.id_de(vizinho)
+            if id_vizinho == id_vertice:
+                # O laço aparece duas vezes na própria linha: inclui um a cada par
+                # (e também o que aparecer uma vez só)
+                lacos += 1
+                if lacos % 2 == 1:
+                    acumulador.adicionar(vertice, vizinho)
+                continue
+            if id_vertice < id_vizinho:
+                par = (id_vertice, id_vizinho)
+                saldo = saldos.get(par, 0) + 1
+                incluir = saldo > 0
+            else:
+                par = (id_vizinho, id_vertice)
+                saldo = saldos.get(par, 0) - 1
+                incluir = saldo < 0
+            saldos[par] = saldo
+            if incluir:
+                acumulador.adicionar(vertice, vizinho)
+
+    return acumulador.construir(direcionado)
+
+
+def carregar_matrix_market(caminho, direcionado=None, tamanho_buffer=TAMANHO_BUFFER_PADRAO,
+                           rotulos_compactos=False):
+    """
+    Carrega um arquivo Matrix Market no formato coordinate.
+
+    Os vértices são os inteiros 1..n (incluindo os isolados) e cada entrada
+    (i, j) gera uma aresta/arco de i para j; os valores são ignorados. Matrizes
+    simétricas guardam só um triângulo: carregadas como Digrafo, cada entrada
+    fora da diagonal gera também o arco de j para i.
+
+    Args:
+        caminho (str): Caminho do arquivo (pode estar compactado com gzip)
+        direcionado (bool, optional): Se None, matrizes 'symmetric', 'skew-symmetric'
+                                      ou 'hermitian' geram um Grafo e 'general' um Digrafo
+        tamanho_buffer (int): Quantidade de caracteres lidos por vez
+        rotulos_compactos (bool): Se True, guarda os rótulos em uma TabelaRotulos
+
+    Returns:
+        Grafo ou Digrafo: Estrutura carregada
+
+    Raises:
+        ValueError: Se o cabeçalho for inválido, o formato não for coordinate, a
+                    matriz não for quadrada ou alguma entrada for malformada ou
+                    tiver índice fora de 1..n
+    """
+    comentarios_lidos = []
+    linhas = ler_linhas(caminho, ('%',), tamanho_buffer, ao_comentar=comentarios_lidos.append)
+    dimensoes = next(linhas, None)
+
+    cabecalho = comentarios_lidos[0].lower().split() if comentarios_lidos else []
+    if len(cabecalho) < 5 or cabecalho[0] != '%%matrixmarket' or cabecalho[1] != 'matrix':
+        raise ValueError(f"Cabeçalho Matrix Market inválido em '{caminho}'.")
+    if cabecalho[2] != 'coordinate':
+        raise ValueError(f"Apenas o formato 'coordinate' é suportado (encontrado: '{cabecalho[2]}').")
+    simetrica = cabecalho[4] != 'general'
+    if direcionado is None:
+        direcionado = not simetrica
+
+    if dimensoes is None:
+        raise ValueError(f"Linha de dimensões ausente em '{caminho}'.")
+    num_linhas, num_colunas, _ = (int(valor) for valor in dimensoes.split()[:3])
+    if num_linhas != num_colunas:
+        raise ValueError(f"A matriz deve ser quadrada (encontrado: {num_linhas} x {num_colunas}).")
+
+    # Vértice i tem ID i - 1: as entradas vão direto para os vetores
+    acumulador = _AcumuladorArestas(rotulos_compactos)
+    for vertice in range(1, num_linhas + 1):
+        acumulador.id_de(vertice)
+    origens = acumulador.origens
+    destinos = acumulador.destinos
+    espelhar = direcionado and simetrica
+    # A linha 1 (de dados) é a das dimensões
+    for numero, linha in enumerate(linhas, 2):
+        campos = linha.split(None, 2)
+        try:
+            i = int(campos[0])
+            j = int(campos[1])
+        except (IndexError, ValueError):
+            raise ValueError(f"Linha {numero} inválida em '{caminho}': {linha!r}") from None
+        if not (1 <= i <= num_linhas and 1 <= j <= num_linhas):
+            raise ValueError(
+                f"Linha {numero} de '{caminho}': índice fora de 1..{num_linhas} em {linha!r}."
+            )
+        origens.append(i - 1)
+        destinos.append(j - 1)
+        if espelhar and i != j:
+            origens.append(j - 1)
+            destinos.append(i - 1)
+
+    return acumulador.construir(direcionado)
+
+
+def carregar_snap(caminho, direcionado=None, tamanho_buffer=TAMANHO_BUFFER_PADRAO,
+                  rotulos_compactos=False):
+    """
+    Carrega um arquivo no estilo SNAP: pares "origem destino" de IDs inteiros
+    separados por espaço ou tabulação, com comentários iniciados por '#'.
+
+    Args:
+        caminho (str): Caminho do arquivo (pode estar compactado com gzip)
+        direcionado (bool, optional): Se None, usa o comentário de cabeçalho do SNAP
+                                      ("# Undirected graph" gera um Grafo; nos demais
+                                      casos, um Digrafo)
+        tamanho_buffer (int): Quantidade de caracteres lidos por vez
+        rotulos_compactos (bool): Se True, guarda os rótulos em uma TabelaRotulos
+
+    Returns:
+        Grafo ou Digrafo: Estrutura carregada
+
+    Raises:
+        ValueError: Se alguma linha não tiver dois IDs inteiros
+    """
+    comentarios_lidos = []
+    acumulador = _AcumuladorArestas(rotulos_compactos)
+    adicionar = acumulador.adicionar
+    linhas = ler_linhas(caminho, ('#',), tamanho_buffer, ao_comentar=comentarios_lidos.append)
+    for numero, linha in enumerate(linhas, 1):
+        try:
+            origem, destino = linha.split(None, 2)[:2]
+            origem, destino = int(origem), int(destino)
+        except ValueError:
+            raise ValueError(f"Linha {numero} inválida em '{caminho}': {linha!r}") from None
+        adicionar(origem, destino)
+
+    if direcionado is None:
+        direcionado = not any('undirected' in comentario.lower()
+                              for comentario in comentarios_lidos)
+    return acumulador.construir(direcionado)
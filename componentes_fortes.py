@@ -0,0 +1,179 @@
+"""
+Componentes fortemente conexas (CFC) e condensação de dígrafos sobre a CSR.
+
+O algoritmo de Tarjan roda de forma iterativa, em O(V + A), com o mesmo esquema
+do motor de DFS (pilha explícita e vetor `proximo` com a posição do próximo
+sucessor de cada vértice). Todo o estado fica em vetores `array` indexados pelo
+vértice: tempos de descoberta, low-links e o ID da componente, que também indica
+se o vértice ainda está na pilha de Tarjan (visitado e sem componente). Nada é
+recursivo nem guardado em dicionários por vértice.
+
+Os IDs das componentes seguem uma ordem topológica da condensação: todo arco
+entre componentes distintas vai de um ID menor para um maior.
+"""
+
+from array import array
+from collections.abc import Mapping
+
+from csr import CSR, tipo_indice, tipo_vetor, vetor_preenchido
+
+
+class MapaIndices(Mapping):
+    """
+    Mapeamento identidade i -> i para dígrafos cujos rótulos são 0..n-1
+    (como a condensação), sem montar um dicionário com n entradas.
+    """
+
+    def __init__(self, num_vertices):
+        self._num_vertices = num_vertices
+
+    def __getitem__(self, rotulo):
+        if type(rotulo) is int and 0 <= rotulo < self._num_vertices:
+            return rotulo
+        raise KeyError(rotulo)
+
+    def __iter__(self):
+        return iter(range(self._num_vertices))
+
+    def __len__(self):
+        return self._num_vertices
+
+    def __repr__(self):
+        return f"MapaIndices({self._num_vertices})"
+
+
+def componentes_fortemente_conexas_csr(csr):
+    """
+    Calcula as componentes fortemente conexas com o algoritmo de Tarjan iterativo.
+
+    Args:
+        csr (CSR): Sucessores de cada vértice
+
+    Returns:
+        tuple: (componente, num_componentes), em que componente é um array com o
+               ID (0 a num_componentes - 1, em ordem topológica) da componente de
+               cada vértice
+    """
+    n = csr.num_vertices
+    offsets = csr.offsets
+    vizinhos = csr.vizinhos
+    tipo = tipo_indice(n)
+
+    descoberta = vetor_preenchido(tipo, -1, n)
+    low = vetor_preenchido(tipo, 0, n)
+    componente = vetor_preenchido(tipo, -1, n)
+    proximo = array(tipo_vetor(offsets), offsets[:n])
+    pilha_dfs = array(tipo)
+    pilha_tarjan = array(tipo)
+    contador = 0
+    num_componentes = 0
+
+    for raiz in range(n):
+        if descoberta[raiz] >= 0:
+            continue
+        descoberta[raiz] = low[raiz] = contador
+        contador += 1
+        pilha_dfs.append(raiz)
+        pilha_tarjan.append(raiz)
+
+        while pilha_dfs:
+            u = pilha_dfs[-1]
+            posicao = proximo[u]
+            fim = offsets[u + 1]
+            # Consome os sucessores já visitados até achar um novo (ou esgotar a linha)
+            while posicao < fim:
+                v = vizinhos[posicao]
+                posicao += 1
+                if descoberta[v] < 0:
+                    break
+                # Ainda na pilha de Tarjan = visitado e sem componente atribuída
+                if componente[v] < 0 and descoberta[v] < low[u]:
+                    low[u] = descoberta[v]
+            else:
+                v = -1
+            proximo[u] = posicao
+
+            if v >= 0:
+                descoberta[v] = low[v] = contador
+                contador += 1
+                pilha_dfs.append(v)
+                pilha_tarjan.append(v)
+                continue
+
+            # Todos os sucessores de u examinados: finaliza u
+            pilha_dfs.pop()
+            if low[u] == descoberta[u]:
+                # u é a raiz de uma componente: desempilha seus membros
+                while True:
+                    w = pilha_tarjan.pop()
+                    componente[w] = num_componentes
+                    if w == u:
+                        break
+                num_componentes += 1
+            if pilha_dfs:
+                pai = pilha_dfs[-1]
+                if low[u] < low[pai]:
+                    low[pai] = low[u]
+
+    # Tarjan fecha as componentes em ordem topológica reversa (sumidouros primeiro)
+    ultimo = num_componentes - 1
+    for i in range(n):
+        componente[i] = ultimo - componente[i]
+    return componente, num_componentes
+
+
+def condensacao_csr(csr, componente, num_componentes):
+    """
+    Monta a condensação (DAG das componentes) em O(V + A), sem arcos repetidos.
+
+    Os vértices são agrupados por componente com uma ordenação por contagem, e um
+    vetor de marcas (a última componente de origem que registrou cada destino)
+    descarta os arcos internos e os paralelos.
+
+    Args:
+        csr (CSR): Sucessores de cada vértice
+        componente (array): ID da componente de cada vértice
+        num_componentes (int): Quantidade de componentes
+
+    Returns:
+        tuple: (tamanhos, csr_condensacao, origens, destinos): o número de vértices
+               de cada componente, a CSR da condensação e os vetores de extremidades
+               dos seus arcos (agrupados por componente de origem)
+    """
+    n = csr.num_vertices
+    offsets = csr.offsets
+    vizinhos = csr.vizinhos
+    tipo = tipo_indice(max(n, num_componentes))
+
+    tamanhos = vetor_preenchido(tipo, 0, num_componentes)
+    for c in componente:
+        tamanhos[c] += 1
+    inicio = vetor_preenchido(tipo, 0, num_componentes + 1)
+    for c in range(num_componentes):
+        inicio[c + 1] = inicio[c] + tamanhos[c]
+    membros = vetor_preenchido(tipo, 0, n)
+    proxima = array(tipo, inicio[:num_componentes])
+    for u in range(n):
+        c = componente[u]
+        membros[proxima[c]] = u
+        proxima[c] += 1
+
+    tipo_componentes = tipo_indice(num_componentes)
+    marca = vetor_preenchido(tipo_componentes, -1, num_componentes)
+    origens = array(tipo_componentes)
+    destinos = array(tipo_componentes)
+    offsets_condensacao = array(tipo_vetor(offsets), [0])
+    for c in range(num_componentes):
+        for u in membros[inicio[c]:inicio[c + 1]]:
+            for v in vizinhos[offsets[u]:offsets[u + 1]]:
+                d = componente[v]
+                if d != c and marca[d] != c:
+                    marca[d] = c
+                    origens.append(c)
+                    destinos.append(d)
+        offsets_condensacao.append(len(destinos))
+
+    num_arcos = len(destinos)
+    ids_arcos = array(tipo_indice(num_arcos), range(num_arcos))
+    csr_condensacao = CSR(num_componentes, offsets_condensacao, destinos, ids_arcos)
+    return tamanhos, csr_condensacao, origens, destinos
@@ -0,0 +1,221 @@
+"""
+Representação compacta de adjacências no formato CSR (Compressed Sparse Row).
+
+A estrutura guarda, para um grafo com n vértices indexados de 0 a n-1
+(os mesmos índices de `mapa_vertices`), três vetores contíguos:
+- offsets: n + 1 posições; os vizinhos do vértice i ficam em
+           vizinhos[offsets[i]:offsets[i + 1]]
+- vizinhos: índices dos vértices vizinhos, linha por linha
+- ids_arestas: para cada posição de `vizinhos`, o índice da aresta/arco
+               (posição na lista original) que gerou aquela entrada
+
+Os vetores são `array.array` de inteiros de 32 bits quando os valores cabem,
+e de 64 bits caso contrário, evitando listas e dicionários de objetos Python.
+Qualquer vetor indexável com fatiamento serve, inclusive `memoryview` somente
+leitura sobre um arquivo mapeado em memória (ver formato_binario.py).
+"""
+
+from array import array
+
+LIMITE_INT32 = 2 ** 31 - 1
+
+
+def tipo_indice(maximo):
+    """
+    Retorna o typecode de `array` adequado para armazenar valores até `maximo`.
+    """
+    return 'i' if maximo <= LIMITE_INT32 else 'q'
+
+
+def tipo_vetor(vetor):
+    """
+    Retorna o typecode de um vetor de inteiros: `array` ou `memoryview` já
+    convertido com `cast` (como os vetores mapeados de formato_binario.py).
+    """
+    return vetor.typecode if isinstance(vetor, array) else vetor.format
+
+
+def vetor_preenchido(tipo, valor, tamanho):
+    """
+    Cria um `array` do tipo informado com `tamanho` posições iguais a `valor`.
+    """
+    return array(tipo, [valor]) * tamanho
+
+
+class CSR:
+    """
+    Lista de adjacência compacta (CSR) indexada pelos índices dos vértices.
+    """
+    __slots__ = ('num_vertices', 'offsets', 'vizinhos', 'ids_arestas')
+
+    def __init__(self, num_vertices, offsets, vizinhos, ids_arestas):
+        """
+        Inicializa a estrutura a partir de vetores já montados.
+
+        Args:
+            num_vertices (int): Quantidade de vértices (linhas)
+            offsets: Vetor com num_vertices + 1 posições
+            vizinhos: Vetor com os índices dos vizinhos de cada linha
+            ids_arestas: Vetor paralelo a `vizinhos` com o índice de cada aresta
+        """
+        self.num_vertices = num_vertices
+        self.offsets = offsets
+        self.vizinhos = vizinhos
+        self.ids_arestas = ids_arestas
+
+    @classmethod
+    def construir(cls, num_vertices, origens, destinos, simetrico):
+        """
+        Monta a estrutura CSR em O(V + E) a partir de vetores de extremidades.
+
+        A ordem dos vizinhos em cada linha segue a ordem das arestas de entrada,
+        reproduzindo a lista de adjacência construída aresta por aresta.
+
+        Args:
+            num_vertices (int): Quantidade de vértices
+            origens (sequence): Índice da primeira extremidade de cada aresta
+                                (valores negativos indicam vértice inexistente)
+            destinos (sequence): Índice da segunda extremidade de cada aresta
+            simetrico (bool): Se True (grafo), cada aresta gera entradas nos dois
+                              sentidos; se False (dígrafo), apenas origem -> destino
+
+        Returns:
+            CSR: Estrutura construída
+        """
+        num_entradas_max = len(origens) * (2 if simetrico else 1)
+        tipo_offsets = tipo_indice(num_entradas_max)
+        tipo_vertices = tipo_indice(num_vertices)
+        tipo_arestas = tipo_indice(len(origens))
+
+        # 1ª passada: conta quantas entradas cada linha terá
+        offsets = vetor_preenchido(tipo_offsets, 0, num_vertices + 1)
+        for u, v in zip(origens, destinos):
+            if u < 0 or v < 0:
+                continue
+            offsets[u + 1] += 1
+            if simetrico:
+                offsets[v + 1] += 1
+
+        # Soma de prefixos: offsets[i] passa a ser o início da linha i
+        for i in range(num_vertices):
+            offsets[i + 1] += offsets[i]
+
+        total = offsets[num_vertices]
+        vizinhos = vetor_preenchido(tipo_vertices, 0, total)
+        ids_arestas = vetor_preenchido(tipo_arestas, 0, total)
+        proxima = array(tipo_offsets, offsets[:num_vertices])
+
+        # 2ª passada: preenche as linhas de forma estável (ordem das arestas)
+        for id_aresta, (u, v) in enumerate(zip(origens, destinos)):
+            if u < 0 or v < 0:
+                continue
+            posicao = proxima[u]
+            vizinhos[posicao] = v
+            ids_arestas[posicao] = id_aresta
+            proxima[u] = posicao + 1
+            if simetrico:
+                posicao = proxima[v]
+                vizinhos[posicao] = u
+                ids_arestas[posicao] = id_aresta
+                proxima[v] = posicao + 1
+
+        return cls(num_vertices, offsets, vizinhos, ids_arestas)
+
+    def vizinhos_de(self, indice):
+        """
+        Retorna os índices dos vizinhos do vértice `indice`.
+        """
+        return self.vizinhos[self.offsets[indice]:self.offsets[indice + 1]]
+
+    def arestas_de(self, indice):
+        """
+        Retorna os índices das arestas incidentes ao vértice `indice`,
+        na mesma ordem de `vizinhos_de`.
+        """
+        return self.ids_arestas[self.offsets[indice]:self.offsets[indice + 1]]
+
+    def grau(self, indice):
+        """
+        Retorna o número de entradas na linha do vértice `indice`.
+        """
+        return self.offsets[indice + 1] - self.offsets[indice]
+
+    def num_entradas(self):
+        """
+        Retorna o total de entradas armazenadas em `vizinhos`.
+        """
+        return len(self.vizinhos)
+
+    def ordenada(self):
+        """
+        Retorna uma nova CSR com os vizinhos de cada linha em ordem crescente de índice.
+
+        Como os índices seguem a ordem de `vertices_ordenados`, isso equivale a
+        ordenar os vizinhos pelo rótulo. Os ids de arestas acompanham seus vizinhos.
+
+        Returns:
+            CSR: Estrutura com as linhas ordenadas
+        """
+        offsets = self.offsets
+        vizinhos = array(tipo_vetor(self.vizinhos))
+        ids_arestas = array(tipo_vetor(self.ids_arestas))
+        for i in range(self.num_vertices):
+            inicio, fim = offsets[i], offsets[i + 1]
+            linha = sorted(zip(self.vizinhos[inicio:fim], self.ids_arestas[inicio:fim]))
+            vizinhos.extend(v for v, _ in linha)
+            ids_arestas.extend(e for _, e in linha)
+        return CSR(self.num_vertices, offsets, vizinhos, ids_arestas)
+
+    def transposta(self):
+        """
+        Retorna a CSR transposta (arcos invertidos) em O(V + E).
+
+        A linha j da transposta lista os vértices i que têm j entre seus vizinhos
+        (os predecessores, em um dígrafo). Como as linhas originais são lidas em
+        ordem crescente de i, cada linha da transposta já sai ordenada.
+
+        Returns:
+            CSR: Estrutura com as linhas de entrada de cada vértice
+        """
+        n = self.num_vertices
+        offsets = self.offsets
+        vizinhos = self.vizinhos
+        ids_arestas = self.ids_arestas
+        tipo_offsets = tipo_vetor(offsets)
+
+        offsets_t = vetor_preenchido(tipo_offsets, 0, n + 1)
+        for v in vizinhos:
+            offsets_t[v + 1] += 1
+        for j in range(n):
+            offsets_t[j + 1] += offsets_t[j]
+
+        total = len(vizinhos)
+        vizinhos_t = vetor_preenchido(tipo_indice(n), 0, total)
+        ids_arestas_t = vetor_preenchido(tipo_vetor(ids_arestas), 0, total)
+        proxima = array(tipo_offsets, offsets_t[:n])
+        for i in range(n):
+            for k in range(offsets[i], offsets[i + 1]):
+                j = vizinhos[k]
+                posicao = proxima[j]
+                vizinhos_t[posicao] = i
+                ids_arestas_t[posicao] = ids_arestas[k]
+                proxima[j] = posicao + 1
+
+        return CSR(n, offsets_t, vizinhos_t, ids_arestas_t)
+
+    def para_lista_adjacencia(self, rotulos):
+        """
+        Adaptador para a lista de adjacência tradicional (dict de listas).
+
+        Args:
+            rotulos (list): Rótulo de cada índice de vértice (ex: vertices_ordenados)
+
+        Returns:
+            dict: Dicionário rótulo -> lista de rótulos vizinhos
+        """
+        offsets = self.offsets
+        vizinhos = self.vizinhos
+        return {
+            rotulo: [rotulos[j] for j in vizinhos[offsets[i]:offsets[i + 1]]]
+            for i, rotulo in enumerate(rotulos)
+        }
@@ -1,3 +1,22 @@
+from array import array
+
+from cache_representacoes import CacheRepresentacoes, copiar_lista_adjacencia, copiar_matriz
+from busca_largura import (ALFA_PADRAO, BETA_PADRAO, busca_em_largura_csr,
+                           busca_em_largura_direcional_csr, resultado_bfs_com_rotulos,
+                           resultado_bfs_multipla_com_rotulos)
+from busca_profundidade import busca_em_profundidade_csr
+from componentes_fortes import (MapaIndices, componentes_fortemente_conexas_csr,
+                                condensacao_csr)
+from csr import CSR, tipo_indice, vetor_preenchido
+from incidencia_esparsa import MatrizIncidenciaEsparsa
+from matriz_bits import MatrizBits
+from matriz_numpy import matriz_adjacencia_de_csr
+from ordenacao_topologica import (CicloEncontrado, camadas_kahn_csr, gerar_ordenacao_kahn_csr,
+                                  ordenacao_dfs_csr, ordenacao_kahn_csr)
+from tabela_rotulos import MapaTabelaRotulos, TabelaRotulos
+from vista_subjacente import VistaSubjacente
+
+
 class Digrafo:
     """
     Classe para representar um dígrafo (grafo direcionado) e suas estruturas de dados.
@@ -15,32 +34,202 @@ class Digrafo:
             arcos (list): Lista de tuplas (origem, destino) representando arcos direcionados
         """
         self.vertices_ordenados = sorted(list(vertices))
-        self.arcos = arcos
+        self._arcos = arcos
         self.num_vertices = len(self.vertices_ordenados)
-        self.num_arcos = len(self.arcos)
+        self.num_arcos = len(self._arcos)
         self.mapa_vertices = {vertice: i for i, vertice in enumerate(self.vertices_ordenados)}
+        # Dígrafos carregados de arquivo (ver de_extremidades) guardam os arcos como
+        # dois vetores de índices; a lista de tuplas só é montada se alguém a pedir
+        self._extremidades_carregadas = None
+        # Representações derivadas (CSR, listas, matrizes), válidas até a próxima mutação
+        self.cache = CacheRepresentacoes()
+
+    @classmethod
+    def de_extremidades(cls, rotulos, origens, destinos):
+        """
+        Cria o dígrafo a partir de vetores de IDs, sem montar uma lista de tuplas.
+        Usado pelos carregadores de arquivos (ver carregadores.py).
+
+        Args:
+            rotulos (list | TabelaRotulos): Rótulo de cada ID de vértice (sem
+                repetições). Uma TabelaRotulos é guardada ordenada e serve, sem
+                cópia em listas e dicionários, de vertices_ordenados e mapa_vertices
+            origens (array): ID da origem de cada arco
+            destinos (array): ID do destino de cada arco
+
+        Returns:
+            Digrafo: Dígrafo com os arcos na ordem dos vetores
+        """
+        # Os índices do dígrafo seguem a ordem dos rótulos: renumera as extremidades
+        # (desnecessário se os rótulos já vierem ordenados, como em Matrix Market)
+        tipo = tipo_indice(len(rotulos))
+        if isinstance(rotulos, TabelaRotulos):
+            digrafo = cls((), [])
+            tabela, posicoes = rotulos.ordenada()
+            digrafo.vertices_ordenados = tabela
+            digrafo.mapa_vertices = MapaTabelaRotulos(tabela)
+            digrafo.num_vertices = len(tabela)
+        else:
+            digrafo = cls(rotulos, [])
+            posicoes = None
+            if digrafo.vertices_ordenados != list(rotulos):
+                posicoes = array(tipo, (digrafo.mapa_vertices[rotulo] for rotulo in rotulos))
+        if posicoes is None:
+            digrafo._extremidades_carregadas = (array(tipo, origens), array(tipo, destinos))
+        else:
+            digrafo._extremidades_carregadas = (
+                array(tipo, (posicoes[u] for u in origens)),
+                array(tipo, (posicoes[v] for v in destinos))
+            )
+        digrafo._arcos = None
+        digrafo.num_arcos = len(origens)
+        return digrafo
+
+    @classmethod
+    def de_csr(cls, vertices_ordenados, mapa_vertices, csr, origens, destinos, csr_ordenada=None):
+        """
+        Cria o dígrafo sobre estruturas já prontas, sem copiá-las nem percorrê-las.
+        Usado por formato_binario.py para expor um arquivo mapeado em memória.
+
+        Args:
+            vertices_ordenados (Sequence): Rótulos em ordem crescente
+            mapa_vertices (Mapping): Rótulo -> posição em `vertices_ordenados`
+            csr (CSR): Sucessores de cada vértice, indexados pelas posições
+            origens (sequence): Posição da origem de cada arco
+            destinos (sequence): Posição do destino de cada arco
+            csr_ordenada (CSR, optional): Versão com as linhas ordenadas (ver obter_csr)
+
+        Returns:
+            Digrafo: Dígrafo que lê diretamente as estruturas informadas
+        """
+        digrafo = cls((), [])
+        digrafo.vertices_ordenados = vertices_ordenados
+        digrafo.mapa_vertices = mapa_vertices
+        digrafo.num_vertices = len(vertices_ordenados)
+        digrafo._arcos = None
+        digrafo._extremidades_carregadas = (origens, destinos)
+        digrafo.num_arcos = len(origens)
+        digrafo.cache.obter('csr', lambda: csr)
+        if csr_ordenada is not None:
+            digrafo.cache.obter('csr_ordenada', lambda: csr_ordenada)
+        return digrafo
+
+    @property
+    def arcos(self):
+        """
+        Lista de tuplas (origem, destino) dos arcos, na ordem de inclusão.
+        """
+        if self._arcos is None:
+            rotulos = self.vertices_ordenados
+            origens, destinos = self._extremidades_carregadas
+            self._arcos = [(rotulos[u], rotulos[v]) for u, v in zip(origens, destinos)]
+        return self._arcos
+
+    def obter_csr(self, ordenada=False):
+        """
+        Retorna a representação compacta (CSR) dos arcos de saída do dígrafo.
+
+        A estrutura é indexada pelos índices de `mapa_vertices` e fica em cache.
+        Arcos com extremidades inexistentes no dígrafo são ignorados.
+
+        Args:
+            ordenada (bool): Se True, retorna a versão com os sucessores de cada
+                             vértice ordenados (usada pelas buscas determinísticas)
+
+        Returns:
+            CSR: Vetores offsets/vizinhos/ids_arestas (sucessores de cada vértice)
+        """
+        if ordenada:
+            # Vizinhos em ordem crescente de índice (= ordem dos rótulos)
+            return self.cache.obter('csr_ordenada', lambda: self.obter_csr().ordenada())
+        return self.cache.obter('csr', self._construir_csr)
+
+    def obter_csr_reversa(self):
+        """
+        Retorna a CSR dos arcos de entrada (predecessores de cada vértice), em cache.
+
+        As linhas saem em ordem crescente de índice, sem necessidade de ordenação.
+
+        Returns:
+            CSR: Vetores offsets/vizinhos/ids_arestas (predecessores de cada vértice)
+        """
+        return self.cache.obter('csr_reversa', lambda: self.obter_csr().transposta())
+
+    def vetores_extremidades(self):
+        """
+        Retorna os índices (posições em `vertices_ordenados`) das extremidades de
+        cada arco, na ordem de `arcos`. Os vetores ficam em cache e não devem ser
+        alterados.
+
+        Returns:
+            tuple: (origens, destinos): arrays com a origem e o destino de cada
+                   arco (-1 para vértices inexistentes no dígrafo)
+        """
+        if self._extremidades_carregadas is not None:
+            return self._extremidades_carregadas
+        return self.cache.obter('extremidades', self._construir_vetores_extremidades)
+
+    def _construir_vetores_extremidades(self):
+        tipo = tipo_indice(self.num_vertices)
+        posicao = self.mapa_vertices.get
+        origens = array(tipo, [posicao(o, -1) for o, _ in self.arcos])
+        destinos = array(tipo, [posicao(d, -1) for _, d in self.arcos])
+        return origens, destinos
+
+    def _construir_csr(self):
+        origens, destinos = self.vetores_extremidades()
+        return CSR.construir(self.num_vertices, origens, destinos, simetrico=False)
 
     def criar_lista_adjacencia(self):
         """
         Cria e retorna a lista de adjacência do dígrafo.
+        Adaptador sobre a representação CSR (ver obter_csr); a lista fica em cache,
+        e cada chamada devolve uma cópia dela, que pode ser alterada sem afetar
+        as seguintes.
         
         Returns:
             dict: Dicionário onde cada chave é um vértice e o valor é uma lista
                   de vértices que são alcançáveis a partir dele (destinos).
         """
-        lista_adj = {v: [] for v in self.vertices_ordenados}
-        for origem, destino in self.arcos:
-            if origem in lista_adj and destino in lista_adj:
-                lista_adj[origem].append(destino)
-        return lista_adj
+        return copiar_lista_adjacencia(self.cache.obter(
+            'lista_adjacencia',
+            lambda: self.obter_csr().para_lista_adjacencia(self.vertices_ordenados)
+        ))
 
-    def criar_matriz_adjacencia(self):
+    def criar_matriz_adjacencia(self, formato='lista'):
         """
         Item 16 - Cria e retorna a matriz de adjacência do dígrafo.
+        A matriz fica em cache, e cada chamada devolve uma cópia dela.
+        
+        Args:
+            formato (str): 'lista' (padrão) para uma lista de listas de 0/1,
+                           'bits' para uma MatrizBits (1 bit por célula, com
+                           operações de OR/AND entre linhas) ou 'numpy' para
+                           um ndarray de uint8 (requer NumPy)
         
         Returns:
-            list: Matriz onde matriz[i][j] = 1 se existe arco de i para j, 0 caso contrário
+            list, MatrizBits ou ndarray: Matriz onde matriz[i][j] = 1 se existe arco
+                                         de i para j, 0 caso contrário
+        
+        Raises:
+            ValueError: Se o formato for desconhecido
+            ImportError: Se formato='numpy' e o NumPy não estiver instalado
         """
+        if formato == 'lista':
+            return copiar_matriz(
+                self.cache.obter('matriz_adjacencia', self._construir_matriz_adjacencia)
+            )
+        if formato == 'bits':
+            return self.cache.obter(
+                'matriz_adjacencia_bits', lambda: MatrizBits.de_csr(self.obter_csr())
+            ).copia()
+        if formato == 'numpy':
+            return self.cache.obter(
+                'matriz_adjacencia_numpy', lambda: matriz_adjacencia_de_csr(self.obter_csr())
+            ).copy()
+        raise ValueError(f"Formato de matriz desconhecido: '{formato}'.")
+
+    def _construir_matriz_adjacencia(self):
         matriz_adj = [[0] * self.num_vertices for _ in range(self.num_vertices)]
         for origem, destino in self.arcos:
             idx_origem = self.mapa_vertices.get(origem)
@@ -49,7 +238,7 @@ class Digrafo:
                 matriz_adj[idx_origem][idx_destino] = 1
         return matriz_adj
 
-    def criar_matriz_incidencia(self):
+    def criar_matriz_incidencia(self, formato='lista'):
         """
         Cria e retorna a matriz de incidência do dígrafo.
         
@@ -58,9 +247,34 @@ class Digrafo:
         - Valor -1 indica que o vértice é o destino do arco
         - Valor 0 indica que o vértice não participa do arco
         
+        A matriz fica em cache; a densa é devolvida como cópia, e a esparsa
+        (somente leitura) é compartilhada.
+        
+        Args:
+            formato (str): 'lista' (padrão) para a matriz densa V x A, ou 'esparsa'
+                           para uma MatrizIncidenciaEsparsa (apenas os não nulos,
+                           com acesso por arco e por vértice)
+        
         Returns:
-            list: Matriz de incidência do dígrafo
+            list ou MatrizIncidenciaEsparsa: Matriz de incidência do dígrafo
+        
+        Raises:
+            ValueError: Se o formato for desconhecido
         """
+        if formato == 'lista':
+            return copiar_matriz(
+                self.cache.obter('matriz_incidencia', self._construir_matriz_incidencia)
+            )
+        if formato == 'esparsa':
+            return self.cache.obter(
+                'matriz_incidencia_esparsa',
+                lambda: MatrizIncidenciaEsparsa.de_extremidades(
+                    self.num_vertices, *self.vetores_extremidades(), orientada=True
+                )
+            )
+        raise ValueError(f"Formato de matriz desconhecido: '{formato}'.")
+
+    def _construir_matriz_incidencia(self):
         matriz_inc = [[0] * self.num_arcos for _ in range(self.num_vertices)]
         for i, (origem, destino) in enumerate(self.arcos):
             idx_origem = self.mapa_vertices.get(origem)
@@ -71,20 +285,139 @@ class Digrafo:
                 matriz_inc[idx_destino][i] = -1
         return matriz_inc
 
+    # =========================================================================
+    # GRAUS DE ENTRADA/SAÍDA E PREDECESSORES
+    # =========================================================================
+    # Os vetores de graus e a CSR reversa ficam no cache e são descartados, como
+    # as demais representações, quando o dígrafo muda.
+
+    def _obter_graus(self):
+        return self.cache.obter('graus', self._construir_graus)
+
+    def _construir_graus(self):
+        """
+        Conta, em uma única passada O(V + A) pelos arcos, os graus de entrada e de
+        saída de todos os vértices. Um laço conta uma vez em cada vetor.
+        """
+        n = self.num_vertices
+        tipo = tipo_indice(self.num_arcos)
+        graus_entrada = vetor_preenchido(tipo, 0, n)
+        graus_saida = vetor_preenchido(tipo, 0, n)
+        for u, v in zip(*self.vetores_extremidades()):
+            if u >= 0 and v >= 0:
+                graus_saida[u] += 1
+                graus_entrada[v] += 1
+        return graus_entrada, graus_saida
+
+    def vetor_graus_entrada(self):
+        """
+        Retorna o vetor de graus de entrada, indexado como `vertices_ordenados`.
+
+        Returns:
+            array: Posição i = número de arcos que chegam em vertices_ordenados[i]
+        """
+        return self._obter_graus()[0]
+
+    def vetor_graus_saida(self):
+        """
+        Retorna o vetor de graus de saída, indexado como `vertices_ordenados`.
+
+        Returns:
+            array: Posição i = número de arcos que saem de vertices_ordenados[i]
+        """
+        return self._obter_graus()[1]
+
+    def get_grau_entrada(self, vertice):
+        """
+        Retorna o grau de entrada de um vértice em O(1).
+
+        Raises:
+            ValueError: Se o vértice não existir no dígrafo
+        """
+        if vertice not in self.mapa_vertices:
+            raise ValueError(f"O vértice '{vertice}' não existe no dígrafo.")
+        return self.vetor_graus_entrada()[self.mapa_vertices[vertice]]
+
+    def get_grau_saida(self, vertice):
+        """
+        Retorna o grau de saída de um vértice em O(1).
+
+        Raises:
+            ValueError: Se o vértice não existir no dígrafo
+        """
+        if vertice not in self.mapa_vertices:
+            raise ValueError(f"O vértice '{vertice}' não existe no dígrafo.")
+        return self.vetor_graus_saida()[self.mapa_vertices[vertice]]
+
+    def histograma_graus(self, tipo='saida'):
+        """
+        Retorna a distribuição dos graus: quantos vértices têm cada grau.
+
+        Args:
+            tipo (str): 'entrada', 'saida' (padrão) ou 'total' (entrada + saída)
+
+        Returns:
+            list: Posição k = quantidade de vértices com grau k (até o grau máximo)
+
+        Raises:
+            ValueError: Se o tipo for desconhecido
+        """
+        graus_entrada, graus_saida = self._obter_graus()
+        if tipo == 'entrada':
+            graus = graus_entrada
+        elif tipo == 'saida':
+            graus = graus_saida
+        elif tipo == 'total':
+            graus = [e + s for e, s in zip(graus_entrada, graus_saida)]
+        else:
+            raise ValueError(f"Tipo de grau desconhecido: '{tipo}'.")
+
+        histograma = [0] * (max(graus, default=-1) + 1)
+        for grau in graus:
+            histograma[grau] += 1
+        return histograma
+
+    def predecessores(self, vertice):
+        """
+        Retorna os predecessores de um vértice (origens dos arcos que chegam nele).
+
+        Consulta a CSR reversa em cache (ver obter_csr_reversa) em O(grau de entrada),
+        sem percorrer a lista de arcos; arcos paralelos repetem o predecessor.
+
+        Args:
+            vertice (str): Vértice consultado
+
+        Returns:
+            list: Predecessores em ordem crescente de rótulo
+
+        Raises:
+            ValueError: Se o vértice não existir no dígrafo
+        """
+        if vertice not in self.mapa_vertices:
+            raise ValueError(f"O vértice '{vertice}' não existe no dígrafo.")
+        rotulos = self.vertices_ordenados
+        csr_reversa = self.obter_csr_reversa()
+        return [rotulos[u] for u in csr_reversa.vizinhos_de(self.mapa_vertices[vertice])]
+
     # =========================================================================
     # BUSCA EM LARGURA (BFS) PARA DÍGRAFOS
     # =========================================================================
     
-    def busca_em_largura(self, vertice_inicial):
+    def busca_em_largura(self, vertice_inicial, deterministico=True):
         """
         Realiza uma Busca em Largura (BFS) a partir de um vértice inicial em um dígrafo.
         
         A BFS em dígrafos segue apenas os arcos na direção correta (origem -> destino).
         Explora o dígrafo em camadas: primeiro visita todos os vértices alcançáveis
         diretamente do vértice inicial, depois os alcançáveis a partir desses, e assim por diante.
+        A busca roda em O(V + A) sobre a representação CSR (ver busca_largura.py).
         
         Args:
             vertice_inicial (str): Vértice de onde a busca deve começar
+            deterministico (bool): Se True (padrão), os vizinhos de cada vértice são
+                                   visitados em ordem crescente de rótulo, usando a
+                                   adjacência pré-ordenada; se False, segue a ordem de
+                                   inserção das arcos, sem custo de ordenação
             
         Returns:
             dict: Dicionário contendo:
@@ -96,38 +429,94 @@ class Digrafo:
         Raises:
             ValueError: Se o vértice inicial não existir no dígrafo
         """
-        if vertice_inicial not in self.vertices_ordenados:
+        if vertice_inicial not in self.mapa_vertices:
             raise ValueError(f"O vértice '{vertice_inicial}' não existe no dígrafo.")
+
+        csr = self.obter_csr(ordenada=deterministico)
+        resultado = busca_em_largura_csr(csr, self.mapa_vertices[vertice_inicial])
+        return resultado_bfs_com_rotulos(resultado, self.vertices_ordenados)
+
+    def busca_em_largura_direcional(self, vertice_inicial, alfa=ALFA_PADRAO, beta=BETA_PADRAO,
+                                    deterministico=True):
+        """
+        Realiza a BFS com otimização de direção a partir de um vértice inicial.
         
-        lista_adj = self.criar_lista_adjacencia()
+        Enquanto a fronteira é pequena, a busca segue os arcos de saída (top-down);
+        quando os arcos de saída da fronteira passam de 1/alfa dos arcos de entrada
+        dos vértices não visitados, cada vértice não visitado passa a procurar um
+        predecessor na fronteira (bottom-up), e a busca volta ao top-down quando a
+        fronteira encolhe abaixo de 1/beta dos vértices. Nos dígrafos de diâmetro
+        pequeno, os níveis intermediários tocam quase todos os arcos, e o passo
+        bottom-up evita examiná-los (ver busca_largura.py).
         
-        visitados = set()
-        fila = [vertice_inicial]
-        ordem_visitacao = []
-        distancias = {vertice_inicial: 0}
-        pais = {vertice_inicial: None}
+        Args:
+            vertice_inicial (str): Vértice de onde a busca deve começar
+            alfa (float): Limiar de troca para bottom-up (maior = troca mais cedo)
+            beta (float): Limiar de volta ao top-down (maior = volta mais tarde)
+            deterministico (bool): Se True (padrão), os níveis top-down visitam os
+                                   sucessores em ordem crescente de rótulo
         
-        while fila:
-            vertice_atual = fila.pop(0)
-            
-            if vertice_atual in visitados:
-                continue
-            
-            visitados.add(vertice_atual)
-            ordem_visitacao.append(vertice_atual)
-            
-            for vizinho in sorted(lista_adj[vertice_atual]):
-                if vizinho not in visitados and vizinho not in fila:
-                    fila.append(vizinho)
-                    distancias[vizinho] = distancias[vertice_atual] + 1
-                    pais[vizinho] = vertice_atual
+        Returns:
+            dict: As mesmas chaves de busca_em_largura (distâncias idênticas; a ordem
+                  dentro de um nível e os pais podem diferir nos níveis bottom-up) e:
+                - 'niveis': Lista com um dicionário por nível contendo 'nivel',
+                            'direcao' ('top-down' ou 'bottom-up'), 'fronteira',
+                            'arcos_examinados' e 'descobertos'
         
-        return {
-            'ordem_visitacao': ordem_visitacao,
-            'distancias': distancias,
-            'pais': pais,
-            'alcancaveis': visitados
-        }
+        Raises:
+            ValueError: Se o vértice inicial não existir no dígrafo ou os limiares
+                        não forem positivos
+        """
+        if vertice_inicial not in self.mapa_vertices:
+            raise ValueError(f"O vértice '{vertice_inicial}' não existe no dígrafo.")
+
+        resultado = busca_em_largura_direcional_csr(
+            self.obter_csr(ordenada=deterministico), self.obter_csr_reversa(),
+            self.mapa_vertices[vertice_inicial], alfa, beta
+        )
+        resultado_rotulado = resultado_bfs_com_rotulos(resultado, self.vertices_ordenados)
+        resultado_rotulado['niveis'] = resultado['niveis']
+        return resultado_rotulado
+
+    def busca_em_largura_multipla(self, fontes, modo='matriz', tamanho_lote=64):
+        """
+        Realiza a BFS a partir de várias fontes de uma só vez.
+        
+        No modo 'matriz', as buscas avançam juntas em lotes de `tamanho_lote` fontes
+        (uma máscara de bits por vértice, ver busca_largura.py), reaproveitando a
+        mesma CSR e a mesma varredura de fronteira por nível. No modo 'mais_proxima',
+        uma única BFS com todas as fontes na fila rotula cada vértice em O(V + A).
+        
+        Args:
+            fontes (list): Vértices de origem
+            modo (str): 'matriz' (padrão) ou 'mais_proxima'
+            tamanho_lote (int): Fontes processadas por máscara no modo 'matriz'
+        
+        Returns:
+            dict: No modo 'matriz':
+                - 'fontes': Lista das fontes (linhas da matriz)
+                - 'distancias': Lista com uma linha (array de inteiros compactos) por
+                                fonte; a coluna j é a distância ao vértice
+                                vertices_ordenados[j] (-1 se inalcançável)
+                  No modo 'mais_proxima' (apenas vértices alcançáveis):
+                - 'fonte_mais_proxima': Dicionário vértice -> fonte mais próxima
+                                        (empates: a que aparece primeiro em `fontes`)
+                - 'distancias': Dicionário vértice -> distância a essa fonte
+        
+        Raises:
+            ValueError: Se alguma fonte não existir no dígrafo ou o modo for desconhecido
+        """
+        mapa_vertices = self.mapa_vertices
+        for fonte in fontes:
+            if fonte not in mapa_vertices:
+                raise ValueError(f"O vértice '{fonte}' não existe no dígrafo.")
+        
+        # A ordem das adjacências só influi nos empates do modo 'mais_proxima'
+        csr = self.obter_csr(ordenada=(modo == 'mais_proxima'))
+        indices = [mapa_vertices[fonte] for fonte in fontes]
+        return resultado_bfs_multipla_com_rotulos(
+            csr, indices, self.vertices_ordenados, modo, tamanho_lote
+        )
         
     # =========================================================================
     # ITEM 20 - BUSCA EM PROFUNDIDADE (DFS) PARA DÍGRAFOS
@@ -146,64 +535,184 @@ class Digrafo:
                 - 'tipos_arcos': Dicionário classificando os arcos em 'arvore', 
                                  'retorno', 'avanco' e 'cruzamento'.
         """
-        lista_adj = self.criar_lista_adjacencia()
-        
-        # Inicialização das estruturas de dados
-        cores = {v: 'BRANCO' for v in self.vertices_ordenados}
-        pais = {v: None for v in self.vertices_ordenados}
-        tempo_entrada = {}
-        tempo_saida = {}
-        tipos_arcos = {
-            'arvore': [],
-            'retorno': [],
-            'avanco': [],
-            'cruzamento': []
+        resultado = busca_em_profundidade_csr(self.obter_csr(), classificar_arcos=True)
+        rotulos = self.vertices_ordenados
+        tempo_entrada = resultado['entrada']
+        tempo_saida = resultado['saida']
+        
+        return {
+            'pais': {rotulos[i]: (None if p < 0 else rotulos[p]) for i, p in enumerate(resultado['pais'])},
+            'tempo_entrada': {rotulos[i]: tempo_entrada[i] for i in resultado['ordem']},
+            'tempo_saida': {rotulos[i]: tempo_saida[i] for i in range(self.num_vertices)},
+            'tipos_arcos': {
+                tipo: [(rotulos[u], rotulos[v]) for u, v in arcos]
+                for tipo, arcos in resultado['tipos_arcos'].items()
+            }
         }
-        self.tempo = 0
-
-        def _dfs_visit(u):
-            """Função recursiva auxiliar que explora um vértice 'u'."""
-            self.tempo += 1
-            tempo_entrada[u] = self.tempo
-            cores[u] = 'CINZA'
-
-            for v in lista_adj[u]:
-                if cores[v] == 'BRANCO':
-                    # ARCO DE ÁRVORE: encontramos um novo vértice
-                    pais[v] = u
-                    tipos_arcos['arvore'].append((u, v))
-                    _dfs_visit(v)
-                elif cores[v] == 'CINZA':
-                    # ARCO DE RETORNO: encontramos um ciclo
-                    tipos_arcos['retorno'].append((u, v))
-                elif cores[v] == 'PRETO':
-                    # Pode ser AVANÇO ou CRUZAMENTO
-                    if tempo_entrada[u] < tempo_entrada[v]:
-                        tipos_arcos['avanco'].append((u, v))
-                    else:
-                        tipos_arcos['cruzamento'].append((u, v))
-            
-            cores[u] = 'PRETO'
-            self.tempo += 1
-            tempo_saida[u] = self.tempo
+    
+    # =========================================================================
+    # COMPONENTES FORTEMENTE CONEXAS E CONDENSAÇÃO
+    # =========================================================================
+
+    def componentes_fortemente_conexas(self):
+        """
+        Calcula as componentes fortemente conexas do dígrafo em O(V + A).
+        
+        Usa o algoritmo de Tarjan iterativo sobre a CSR (ver componentes_fortes.py):
+        não há recursão, e o resultado é um vetor compacto em vez de um dicionário
+        por vértice. O vetor fica em cache, e cada chamada devolve uma cópia dele.
+        
+        Returns:
+            dict: Dicionário contendo:
+                - 'componente': array com o ID da componente de cada vértice, na
+                                ordem de vertices_ordenados; os IDs seguem uma
+                                ordem topológica (arcos entre componentes vão do
+                                ID menor para o maior)
+                - 'num_componentes': Quantidade de componentes
+        """
+        componente, num_componentes = self._obter_componentes_fortes()
+        return {'componente': componente[:], 'num_componentes': num_componentes}
+
+    def _obter_componentes_fortes(self):
+        return self.cache.obter(
+            'componentes_fortes', lambda: componentes_fortemente_conexas_csr(self.obter_csr())
+        )
+
+    def componente_fortemente_conexa_de(self, vertice):
+        """
+        Retorna o ID da componente fortemente conexa de um vértice.
+        
+        Raises:
+            ValueError: Se o vértice não existir no dígrafo
+        """
+        if vertice not in self.mapa_vertices:
+            raise ValueError(f"O vértice '{vertice}' não existe no dígrafo.")
+        return self._obter_componentes_fortes()[0][self.mapa_vertices[vertice]]
+
+    def condensacao(self):
+        """
+        Constrói a condensação: o DAG que tem uma componente fortemente conexa por vértice.
+        
+        O vértice c da condensação representa a componente de ID c, e existe um arco
+        c -> d se algum arco do dígrafo liga um vértice de c a um vértice de d (sem
+        arcos repetidos). A CSR da condensação é montada junto com os arcos e já
+        fica no cache do novo dígrafo.
+        
+        Returns:
+            dict: Dicionário contendo:
+                - 'digrafo': Digrafo com vértices 0..num_componentes - 1, em ordem topológica
+                - 'tamanhos': array com o número de vértices de cada componente
+                - 'componente': array com a componente de cada vértice deste dígrafo
+        """
+        componente, num_componentes = self._obter_componentes_fortes()
+        tamanhos, csr, origens, destinos = condensacao_csr(
+            self.obter_csr(), componente, num_componentes
+        )
+        digrafo = Digrafo.de_csr(range(num_componentes), MapaIndices(num_componentes),
+                                 csr, origens, destinos)
+        return {'digrafo': digrafo, 'tamanhos': tamanhos, 'componente': componente[:]}
 
-        # Loop principal que garante que todos os vértices sejam visitados (para dígrafos desconexos)
-        for vertice in self.vertices_ordenados:
-            if cores[vertice] == 'BRANCO':
-                _dfs_visit(vertice)
+    # =========================================================================
+    # ORDENAÇÃO TOPOLÓGICA
+    # =========================================================================
+
+    def ordenacao_topologica(self, metodo='kahn'):
+        """
+        Calcula uma ordem topológica do dígrafo ou, se houver ciclo, um ciclo.
+        
+        Substitui a DFS completa com classificação de arcos para testar se o dígrafo
+        é acíclico: ambos os métodos rodam em O(V + A) sobre a CSR e param ao
+        encontrar um ciclo (ver ordenacao_topologica.py).
         
+        Args:
+            metodo (str): 'kahn' (padrão; remove fontes usando os graus de entrada)
+                          ou 'dfs' (ordem reversa de finalização; para no primeiro
+                          arco de retorno, sem precisar percorrer o resto do dígrafo)
+        
+        Returns:
+            dict: Dicionário contendo:
+                - 'eh_aciclico': Boolean indicando se o dígrafo é acíclico
+                - 'ordem': Lista de vértices em ordem topológica (None se houver ciclo)
+                - 'ciclo': Lista [v0, ..., vk] com arcos vi -> vi+1 e vk -> v0
+                           (None se o dígrafo for acíclico)
+        
+        Raises:
+            ValueError: Se o método for desconhecido
+        """
+        if metodo == 'kahn':
+            ordem, ciclo = ordenacao_kahn_csr(
+                self.obter_csr(), self.vetor_graus_entrada(), self.obter_csr_reversa()
+            )
+        elif metodo == 'dfs':
+            ordem, ciclo = ordenacao_dfs_csr(self.obter_csr())
+        else:
+            raise ValueError(f"Método de ordenação desconhecido: '{metodo}'.")
+
+        rotulos = self.vertices_ordenados
         return {
-            'pais': pais,
-            'tempo_entrada': tempo_entrada,
-            'tempo_saida': tempo_saida,
-            'tipos_arcos': tipos_arcos
+            'eh_aciclico': ciclo is None,
+            'ordem': None if ordem is None else [rotulos[v] for v in ordem],
+            'ciclo': None if ciclo is None else [rotulos[v] for v in ciclo]
         }
-    
+
+    def eh_aciclico(self):
+        """
+        Verifica se o dígrafo é acíclico (DAG), parando no primeiro ciclo encontrado.
+        """
+        _, ciclo = ordenacao_dfs_csr(self.obter_csr())
+        return ciclo is None
+
+    def iterar_ordenacao_topologica(self):
+        """
+        Gera a ordem topológica de Kahn sob demanda, para escalonadores que começam
+        a executar tarefas antes de a ordem completa estar pronta.
+        
+        Yields:
+            Vértices em ordem topológica
+        
+        Raises:
+            CicloEncontrado: (subclasse de ValueError) ao esgotar os vértices sem
+                             fonte por causa de um ciclo; o atributo `ciclo` traz
+                             os vértices do ciclo
+        """
+        rotulos = self.vertices_ordenados
+        gerador = gerar_ordenacao_kahn_csr(
+            self.obter_csr(), self.vetor_graus_entrada(), self.obter_csr_reversa()
+        )
+        try:
+            for v in gerador:
+                yield rotulos[v]
+        except CicloEncontrado as e:
+            raise CicloEncontrado(str(e), [rotulos[v] for v in e.ciclo]) from None
+
+    def camadas_topologicas(self):
+        """
+        Agrupa os vértices em camadas para execução paralela: a camada 0 tem as fontes
+        e cada vértice fica logo após a camada do seu predecessor mais tardio, então
+        os vértices de uma camada só dependem de camadas anteriores.
+        
+        Returns:
+            dict: Dicionário contendo:
+                - 'eh_aciclico': Boolean indicando se o dígrafo é acíclico
+                - 'camadas': Lista de listas de vértices (None se houver ciclo)
+                - 'ciclo': Um ciclo, como em ordenacao_topologica (None se acíclico)
+        """
+        camadas, ciclo = camadas_kahn_csr(
+            self.obter_csr(), self.vetor_graus_entrada(), self.obter_csr_reversa()
+        )
+        rotulos = self.vertices_ordenados
+        return {
+            'eh_aciclico': ciclo is None,
+            'camadas': None if camadas is None else [[rotulos[v] for v in camada]
+                                                     for camada in camadas],
+            'ciclo': None if ciclo is None else [rotulos[v] for v in ciclo]
+        }
+
     # =========================================================================
     # VERIFICAÇÃO DE DÍGRAFO BIPARTIDO
     # =========================================================================
     
-    def eh_bipartido(self):
+    def eh_bipartido(self, apenas_verificar=False):
         """
         Determina se o dígrafo é bipartido.
         
@@ -211,13 +720,24 @@ class Digrafo:
         é bipartido. Isso significa que podemos particionar os vértices em dois conjuntos
         de tal forma que todos os arcos conectem vértices de conjuntos diferentes.
         
+        A coloração roda sobre a vista do grafo subjacente (ver obter_vista_subjacente),
+        sem montar um novo Grafo.
+        
+        Args:
+            apenas_verificar (bool): Se True, retorna apenas o booleano (ver Grafo.eh_bipartido)
+        
         Returns:
-            dict: Dicionário contendo:
+            bool: Se apenas_verificar for True, indica se o dígrafo é bipartido
+            dict: Caso contrário, dicionário contendo:
                 - 'eh_bipartido': Boolean indicando se o dígrafo é bipartido
                 - 'particoes': Se bipartido, tupla com as duas partições
                 - 'coloracao': Dicionário com a coloração de cada vértice
-                - 'ciclo_impar': Se não for bipartido, informação sobre ciclo ímpar
+                - 'ciclo_impar': Se não for bipartido, os vértices de um ciclo ímpar
+                                 do grafo subjacente
         """
+        if apenas_verificar:
+            return self.obter_vista_subjacente().eh_bipartido(apenas_verificar=True)
+
         if not self.vertices_ordenados:
             return {
                 'eh_bipartido': True,
@@ -226,16 +746,26 @@ class Digrafo:
                 'ciclo_impar': None
             }
         
-        # Cria grafo subjacente (não-direcionado)
-        grafo_subjacente = self.obter_grafo_subjacente()
-        
-        # Usa a implementação de bipartição do grafo subjacente
-        return grafo_subjacente.eh_bipartido()
+        return self.obter_vista_subjacente().eh_bipartido()
     
     # =========================================================================
     # DETERMINAÇÃO DO GRAFO SUBJACENTE
     # =========================================================================
     
+    def obter_vista_subjacente(self):
+        """
+        Retorna uma vista não direcionada do dígrafo, sem copiar os arcos.
+        
+        A vista percorre sucessores e predecessores direto das CSRs do dígrafo,
+        descartando repetições, e oferece bipartição, conectividade e biconexidade
+        do grafo subjacente (ver vista_subjacente.py). Use obter_grafo_subjacente
+        quando for preciso um Grafo independente.
+        
+        Returns:
+            VistaSubjacente: Vista sobre este dígrafo
+        """
+        return VistaSubjacente(self)
+
     def obter_grafo_subjacente(self):
         """
         Determina o grafo subjacente do dígrafo.
@@ -0,0 +1,251 @@
+"""
+Formato binário em disco para grafos e dígrafos, carregado com `mmap` sem cópia.
+
+Layout do arquivo (inteiros do cabeçalho em little-endian):
+- cabeçalho (32 bytes): assinatura b'GRAFOBIN', versão, flags, quantidade de
+  seções, número de vértices e número de arestas/arcos;
+- tabela de seções (24 bytes cada): typecode, início e quantidade de itens;
+- seções, alinhadas em 8 bytes, na ordem de SECOES: rótulos (inteiros de 64 bits
+  ou texto UTF-8 concatenado + offsets), vetores da CSR (offsets, vizinhos,
+  ids_arestas), as extremidades de cada aresta (origens, destinos) e a CSR com
+  as linhas ordenadas usada pelas buscas determinísticas (vazia quando igual à
+  CSR original).
+
+Os vetores das seções ficam na ordem de bytes da máquina que gravou o arquivo
+(registrada nas flags). Na carga, o arquivo é mapeado somente para leitura e
+cada seção vira um `memoryview` convertido com `cast`: nada é copiado nem
+percorrido, e o mesmo arquivo pode ser compartilhado (pelo cache de páginas
+do sistema) entre vários processos.
+"""
+
+import mmap
+import struct
+import sys
+from array import array
+from bisect import bisect_left
+from collections.abc import Mapping, Sequence
+
+from csr import CSR, tipo_vetor
+from digrafo import Digrafo
+from grafo import Grafo
+
+ASSINATURA = b'GRAFOBIN'
+VERSAO_FORMATO = 1
+
+FLAG_DIRECIONADO = 1
+FLAG_ROTULOS_TEXTO = 2
+FLAG_BIG_ENDIAN = 4
+FLAG_CSR_JA_ORDENADA = 8
+
+SECOES = ('rotulos', 'offsets_rotulos', 'offsets', 'vizinhos', 'ids_arestas',
+          'origens', 'destinos', 'vizinhos_ordenados', 'ids_arestas_ordenados')
+
+_CABECALHO = struct.Struct('<8sHHIQQ')
+_SECAO = struct.Struct('<c7xQQ')
+_ALINHAMENTO = 8
+
+
+class RotulosMapeados(Sequence):
+    """
+    Sequência somente leitura dos rótulos ordenados, lida direto do arquivo mapeado.
+    """
+
+    def __init__(self, dados, offsets=None):
+        """
+        Args:
+            dados (memoryview): Rótulos inteiros ('q') ou bytes UTF-8 concatenados ('B')
+            offsets (memoryview, optional): Para rótulos de texto, n + 1 posições
+                                            delimitando cada rótulo em `dados`
+        """
+        self._dados = dados
+        self._offsets = offsets
+
+    def __len__(self):
+        if self._offsets is None:
+            return len(self._dados)
+        return len(self._offsets) - 1
+
+    def __getitem__(self, indice):
+        if isinstance(indice, slice):
+            return [self[i] for i in range(*indice.indices(len(self)))]
+        if self._offsets is None:
+            return self._dados[indice]
+        if indice < 0:
+            indice += len(self)
+        inicio, fim = self._offsets[indice], self._offsets[indice + 1]
+        return bytes(self._dados[inicio:fim]).decode('utf-8')
+
+    def __eq__(self, outra):
+        if isinstance(outra, (list, tuple, RotulosMapeados)):
+            return len(self) == len(outra) and all(a == b for a, b in zip(self, outra))
+        return NotImplemented
+
+    def __add__(self, outra):
+        return list(self) + list(outra)
+
+    def __repr__(self):
+        return f"RotulosMapeados({len(self)} rótulos)"
+
+
+class MapaRotulosMapeado(Mapping):
+    """
+    Mapeamento rótulo -> posição por busca binária na sequência ordenada de rótulos
+    (O(log V) por consulta, sem montar um dicionário).
+    """
+
+    def __init__(self, rotulos):
+        self._rotulos = rotulos
+
+    def __getitem__(self, rotulo):
+        try:
+            posicao = bisect_left(self._rotulos, rotulo)
+        except TypeError:
+            raise KeyError(rotulo) from None  # tipo incomparável com os rótulos
+        if posicao < len(self._rotulos) and self._rotulos[posicao] == rotulo:
+            return posicao
+        raise KeyError(rotulo)
+
+    def __iter__(self):
+        return iter(self._rotulos)
+
+    def __len__(self):
+        return len(self._rotulos)
+
+    def __repr__(self):
+        return f"MapaRotulosMapeado({len(self)} rótulos)"
+
+
+def _vetor_de_rotulos(rotulos):
+    if all(type(r) is int for r in rotulos):
+        return array('q', rotulos), None, False
+    if all(isinstance(r, str) for r in rotulos):
+        dados = bytearray()
+        offsets = array('q', [0])
+        for rotulo in rotulos:
+            dados += rotulo.encode('utf-8')
+            offsets.append(len(dados))
+        return array('B', dados), offsets, True
+    raise ValueError("O formato binário aceita apenas rótulos todos inteiros ou todos texto.")
+
+
+def salvar_binario(estrutura, caminho):
+    """
+    Grava um Grafo ou Digrafo no formato binário.
+
+    Args:
+        estrutura (Grafo ou Digrafo): Estrutura a gravar
+        caminho (str): Arquivo de destino
+
+    Raises:
+        ValueError: Se houver arestas com extremidades fora do conjunto de vértices
+                    ou rótulos de tipos não suportados
+    """
+    direcionado = isinstance(estrutura, Digrafo)
+    csr = estrutura.obter_csr()
+    csr_ordenada = estrutura.obter_csr(ordenada=True)
+    ja_ordenada = csr_ordenada.vizinhos == csr.vizinhos
+    origens, destinos = estrutura.vetores_extremidades()
+    if any(u < 0 for u in origens) or any(v < 0 for v in destinos):
+        raise ValueError("Arestas com vértices inexistentes não podem ser gravadas.")
+
+    rotulos, offsets_rotulos, rotulos_texto = _vetor_de_rotulos(estrutura.vertices_ordenados)
+    vetores = {
+        'rotulos': rotulos,
+        'offsets_rotulos': offsets_rotulos if offsets_rotulos is not None else array('q'),
+        'offsets': csr.offsets,
+        'vizinhos': csr.vizinhos,
+        'ids_arestas': csr.ids_arestas,
+        'origens': origens,
+        'destinos': destinos,
+        'vizinhos_ordenados': array(tipo_vetor(csr.vizinhos)) if ja_ordenada
+                              else csr_ordenada.vizinhos,
+        'ids_arestas_ordenados': array(tipo_vetor(csr.ids_arestas)) if ja_ordenada
+                                 else csr_ordenada.ids_arestas,
+    }
+
+    flags = (FLAG_DIRECIONADO if direcionado else 0) | (FLAG_ROTULOS_TEXTO if rotulos_texto else 0)
+    if sys.byteorder == 'big':
+        flags |= FLAG_BIG_ENDIAN
+    if ja_ordenada:
+        flags |= FLAG_CSR_JA_ORDENADA
+
+    # Calcula a posição de cada seção antes de gravar
+    posicao = _CABECALHO.size + _SECAO.size * len(SECOES)
+    tabela = []
+    for nome in SECOES:
+        vetor = vetores[nome]
+        posicao += -posicao % _ALINHAMENTO
+        tabela.append((tipo_vetor(vetor), posicao, len(vetor)))
+        posicao += len(vetor) * vetor.itemsize
+
+    with open(caminho, 'wb') as arquivo:
+        arquivo.write(_CABECALHO.pack(ASSINATURA, VERSAO_FORMATO, flags, len(SECOES),
+                                      estrutura.num_vertices, len(origens)))
+        for tipo, inicio, quantidade in tabela:
+            arquivo.write(_SECAO.pack(tipo.encode('ascii'), inicio, quantidade))
+        for nome, (_, inicio, _) in zip(SECOES, tabela):
+            arquivo.write(b'\0' * (inicio - arquivo.tell()))
+            arquivo.write(vetores[nome].tobytes())
+
+
+def carregar_binario(caminho):
+    """
+    Mapeia um arquivo do formato binário em memória e devolve a estrutura sem copiar os vetores.
+
+    A CSR já fica no cache da estrutura, então buscas (BFS, DFS, conexidade)
+    começam imediatamente; rótulos são lidos sob demanda do arquivo. A lista de
+    arestas e os rótulos só são copiados para objetos Python se forem pedidos
+    ou na primeira modificação da estrutura.
+
+    Args:
+        caminho (str): Arquivo gravado por `salvar_binario`
+
+    Returns:
+        Grafo ou Digrafo: Estrutura apoiada no arquivo mapeado
+
+    Raises:
+        ValueError: Se o arquivo não estiver no formato, a versão não for suportada
+                    ou tiver sido gravado com outra ordem de bytes
+    """
+    with open(caminho, 'rb') as arquivo:
+        mapa = mmap.mmap(arquivo.fileno(), 0, access=mmap.ACCESS_READ)
+    bruto = memoryview(mapa)
+
+    if len(bruto) < _CABECALHO.size:
+        raise ValueError(f"'{caminho}' não é um arquivo de grafo binário.")
+    assinatura, versao, flags, num_secoes, num_vertices, num_arestas = \
+        _CABECALHO.unpack_from(bruto, 0)
+    if assinatura != ASSINATURA:
+        raise ValueError(f"'{caminho}' não é um arquivo de grafo binário.")
+    if versao > VERSAO_FORMATO:
+        raise ValueError(f"Versão {versao} do formato binário não suportada "
+                         f"(máxima: {VERSAO_FORMATO}).")
+    if bool(flags & FLAG_BIG_ENDIAN) != (sys.byteorder == 'big'):
+        raise ValueError("O arquivo foi gravado em uma máquina com outra ordem de bytes.")
+
+    vetores = {}
+    for i, nome in enumerate(SECOES[:num_secoes]):
+        tipo, inicio, quantidade = _SECAO.unpack_from(bruto, _CABECALHO.size + i * _SECAO.size)
+        tipo = tipo.decode('ascii')
+        tamanho = quantidade * array(tipo).itemsize
+        if inicio + tamanho > len(bruto):
+            raise ValueError(f"'{caminho}' está truncado (seção '{nome}').")
+        vetores[nome] = bruto[inicio:inicio + tamanho].cast(tipo)
+    if len(vetores.get('origens', ())) != num_arestas:
+        raise ValueError(f"'{caminho}' está corrompido: número de arestas inconsistente.")
+
+    if flags & FLAG_ROTULOS_TEXTO:
+        rotulos = RotulosMapeados(vetores['rotulos'], vetores['offsets_rotulos'])
+    else:
+        rotulos = RotulosMapeados(vetores['rotulos'])
+    mapa_vertices = MapaRotulosMapeado(rotulos)
+    csr = CSR(num_vertices, vetores['offsets'], vetores['vizinhos'], vetores['ids_arestas'])
+    if flags & FLAG_CSR_JA_ORDENADA:
+        csr_ordenada = csr
+    else:
+        csr_ordenada = CSR(num_vertices, vetores['offsets'], vetores['vizinhos_ordenados'],
+                           vetores['ids_arestas_ordenados'])
+
+    classe = Digrafo if flags & FLAG_DIRECIONADO else Grafo
+    return classe.de_csr(rotulos, mapa_vertices, csr, vetores['origens'], vetores['destinos'],
+                         csr_ordenada=csr_ordenada)
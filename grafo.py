@@ -1,3 +1,22 @@
+from array import array
+
+from adjacencia_persistente import ListaAdjacenciaPersistente, MatrizAdjacenciaPersistente
+from cache_representacoes import CacheRepresentacoes, copiar_lista_adjacencia, copiar_matriz
+from busca_largura import (busca_em_largura_csr, resultado_bfs_com_rotulos,
+                           resultado_bfs_multipla_com_rotulos)
+from biconexidade import BlocosArestas, arvore_blocos_csr, decomposicao_biconexa_csr
+from bipartido import ciclo_impar_bfs, coloracao_bipartida_csr
+from busca_profundidade import busca_em_profundidade_csr
+from csr import CSR, tipo_indice
+from incidencia_esparsa import MatrizIncidenciaEsparsa
+from matriz_bits import MatrizBits
+from matriz_crescente import MatrizAdjacenciaCrescente
+from matriz_numpy import matriz_adjacencia_de_csr
+from tabela_rotulos import MapaTabelaRotulos, TabelaRotulos
+from uniao_busca import UniaoBusca
+from vista_mascarada import VistaMascarada, posicoes_arestas
+
+
 class Grafo:
     """
     Classe para representar um grafo e gerar as suas principais estruturas de dados:
@@ -9,29 +28,302 @@ class Grafo:
         """
         Inicializa o grafo com uma lista de vértices e uma lista de arestas.
         """
-        self.vertices_ordenados = sorted(list(vertices))
-        self.arestas = arestas
-        self.num_vertices = len(self.vertices_ordenados)
-        self.num_arestas = len(self.arestas)
-        # Cria um dicionário para mapear cada vértice a um índice (ex: 'A': 0, 'B': 1)
-        self.mapa_vertices = {vertice: i for i, vertice in enumerate(self.vertices_ordenados)}
+        # Armazenamento por IDs estáveis: cada vértice recebe um inteiro que não muda
+        # enquanto ele existir (IDs de vértices removidos não são reaproveitados) e
+        # cada aresta é uma posição de `_arestas_por_id` (None depois de removida)
+        self._rotulos = sorted(vertices)
+        self._id_por_rotulo = {vertice: i for i, vertice in enumerate(self._rotulos)}
+        self._arestas_por_id = list(arestas)
+        self._num_arestas = len(self._arestas_por_id)
+        # Grafos carregados de arquivo (ver de_extremidades) guardam as arestas como
+        # dois vetores de IDs; a lista de tuplas só é montada se alguém a pedir
+        self._extremidades_carregadas = None
+        # Visões derivadas (ordenação, mapa de índices, lista de arestas): montadas
+        # na primeira leitura e descartadas quando o conjunto correspondente muda
+        # Até a primeira mutação de vértices, IDs e posições coincidem: as visões são
+        # as próprias estruturas por ID, sem cópia (ver _separar_visoes_ordenadas)
+        self._vertices_ordenados = self._rotulos
+        self._mapa_vertices = self._id_por_rotulo
+        self._arestas = None
+        # Índices usados só pelas mutações, montados na primeira necessidade:
+        # - _incidencias: rótulo -> {id da aresta: None} (arestas que contêm o rótulo)
+        # - _contagem_arestas: tupla da aresta -> quantidade de cópias
+        self._incidencias = None
+        self._contagem_arestas = None
+        # Representações derivadas (CSR, listas, matrizes), válidas até a próxima mutação
+        self.cache = CacheRepresentacoes()
+        # Índices de grau e adjacência: montados na primeira consulta e, a partir daí,
+        # atualizados incrementalmente pelas operações de inclusão/exclusão
+        self._graus = None
+        self._indice_adjacencia = None
+        # Conectividade incremental opcional (ver ativar_conectividade_incremental):
+        # união e busca sobre os IDs estáveis, atualizada pelas inclusões e descartada
+        # (remontada na próxima consulta) pelas exclusões
+        self._conectividade_ativa = False
+        self._conectividade = None
+
+    @classmethod
+    def de_extremidades(cls, rotulos, origens, destinos):
+        """
+        Cria o grafo a partir de vetores de IDs, sem montar uma lista de tuplas.
+        Usado pelos carregadores de arquivos (ver carregadores.py).
+
+        Args:
+            rotulos (list | TabelaRotulos): Rótulo de cada ID de vértice (sem
+                repetições). Uma TabelaRotulos é guardada ordenada e serve, sem
+                cópia em listas e dicionários, de vertices_ordenados e mapa_vertices
+            origens (array): ID da primeira extremidade de cada aresta
+            destinos (array): ID da segunda extremidade de cada aresta
+
+        Returns:
+            Grafo: Grafo com as arestas na ordem dos vetores
+        """
+        # Os IDs internos seguem a ordem dos rótulos: renumera as extremidades
+        # (desnecessário se os rótulos já vierem ordenados, como em Matrix Market)
+        tipo = tipo_indice(len(rotulos))
+        if isinstance(rotulos, TabelaRotulos):
+            grafo = cls((), [])
+            tabela, posicoes = rotulos.ordenada()
+            grafo._rotulos = grafo._vertices_ordenados = tabela
+            grafo._id_por_rotulo = grafo._mapa_vertices = MapaTabelaRotulos(tabela)
+        else:
+            grafo = cls(rotulos, [])
+            posicoes = None
+            if grafo.vertices_ordenados != list(rotulos):
+                posicoes = array(tipo, (grafo.mapa_vertices[rotulo] for rotulo in rotulos))
+        if posicoes is None:
+            grafo._extremidades_carregadas = (array(tipo, origens), array(tipo, destinos))
+        else:
+            grafo._extremidades_carregadas = (
+                array(tipo, (posicoes[u] for u in origens)),
+                array(tipo, (posicoes[v] for v in destinos))
+            )
+        grafo._arestas_por_id = None
+        grafo._num_arestas = len(origens)
+        return grafo
+
+    @classmethod
+    def de_csr(cls, vertices_ordenados, mapa_vertices, csr, origens, destinos, csr_ordenada=None):
+        """
+        Cria o grafo sobre estruturas já prontas, sem copiá-las nem percorrê-las.
+        Usado por formato_binario.py para expor um arquivo mapeado em memória.
+
+        Args:
+            vertices_ordenados (Sequence): Rótulos em ordem crescente
+            mapa_vertices (Mapping): Rótulo -> posição em `vertices_ordenados`
+            csr (CSR): Adjacências simétricas indexadas pelas posições
+            origens (sequence): Posição da primeira extremidade de cada aresta
+            destinos (sequence): Posição da segunda extremidade de cada aresta
+            csr_ordenada (CSR, optional): Versão com as linhas ordenadas (ver obter_csr)
+
+        Returns:
+            Grafo: Grafo que lê diretamente as estruturas informadas
+        """
+        grafo = cls((), [])
+        grafo._rotulos = vertices_ordenados
+        grafo._id_por_rotulo = mapa_vertices
+        grafo._vertices_ordenados = vertices_ordenados
+        grafo._mapa_vertices = mapa_vertices
+        grafo._arestas_por_id = None
+        grafo._extremidades_carregadas = (origens, destinos)
+        grafo._num_arestas = len(origens)
+        grafo.cache.obter('csr', lambda: csr)
+        if csr_ordenada is not None:
+            grafo.cache.obter('csr_ordenada', lambda: csr_ordenada)
+        return grafo
+
+    def _obter_arestas_por_id(self):
+        if self._arestas_por_id is None:
+            if not isinstance(self._id_por_rotulo, dict):
+                # Rótulos somente leitura (ver de_csr): copia para poder modificá-los
+                self._rotulos = list(self._rotulos)
+                self._id_por_rotulo = {rotulo: i for i, rotulo in enumerate(self._rotulos)}
+            rotulos = self._rotulos
+            origens, destinos = self._extremidades_carregadas
+            self._arestas_por_id = [(rotulos[u], rotulos[v]) for u, v in zip(origens, destinos)]
+            self._extremidades_carregadas = None
+        return self._arestas_por_id
+
+    # =========================================================================
+    # VISÕES ORDENADAS SOBRE O ARMAZENAMENTO POR IDS
+    # =========================================================================
+
+    @property
+    def vertices_ordenados(self):
+        """
+        Lista dos vértices em ordem crescente (reconstruída só após mutações).
+        Os índices de vértice das representações (CSR, matrizes) são posições nesta lista.
+        """
+        if self._vertices_ordenados is None:
+            self._vertices_ordenados = sorted(self._id_por_rotulo)
+        return self._vertices_ordenados
+
+    @property
+    def mapa_vertices(self):
+        """
+        Dicionário vértice -> posição em `vertices_ordenados` (ex: 'A': 0, 'B': 1).
+        """
+        if self._mapa_vertices is None:
+            self._mapa_vertices = {
+                vertice: i for i, vertice in enumerate(self.vertices_ordenados)
+            }
+        return self._mapa_vertices
+
+    @property
+    def arestas(self):
+        """
+        Lista das arestas existentes, na ordem em que foram incluídas.
+        """
+        if self._arestas is None:
+            self._arestas = [a for a in self._obter_arestas_por_id() if a is not None]
+        return self._arestas
+
+    @property
+    def num_vertices(self):
+        return len(self._id_por_rotulo)
+
+    @property
+    def num_arestas(self):
+        return self._num_arestas
+
+    def id_vertice(self, vertice):
+        """
+        Retorna o ID inteiro estável do vértice.
+
+        Diferente da posição em `vertices_ordenados`, o ID não muda quando outros
+        vértices são incluídos ou excluídos.
+
+        Raises:
+            ValueError: Se o vértice não existir no grafo
+        """
+        if vertice not in self._id_por_rotulo:
+            raise ValueError(f"O vértice '{vertice}' não existe no grafo.")
+        return self._id_por_rotulo[vertice]
+
+    def aresta_por_id(self, id_aresta):
+        """
+        Retorna a aresta (v1, v2) com o ID estável informado.
+
+        Raises:
+            ValueError: Se não existir aresta com esse ID (ou se ela foi excluída)
+        """
+        arestas_por_id = self._obter_arestas_por_id()
+        if not 0 <= id_aresta < len(arestas_por_id) or arestas_por_id[id_aresta] is None:
+            raise ValueError(f"A aresta de ID {id_aresta} não existe no grafo.")
+        return arestas_por_id[id_aresta]
+
+    def _ids_estaveis_arestas(self):
+        """
+        Retorna o vetor posição em `arestas` -> ID estável, ou None quando os dois
+        coincidem (nenhuma aresta excluída). Os IDs das arestas na CSR e nos
+        vetores de extremidades são posições em `arestas`.
+        """
+        if self._arestas_por_id is None or len(self._arestas_por_id) == self._num_arestas:
+            return None
+        return array(tipo_indice(len(self._arestas_por_id)),
+                      (i for i, aresta in enumerate(self._arestas_por_id) if aresta is not None))
+
+    def obter_csr(self, ordenada=False):
+        """
+        Retorna a representação compacta (CSR) das adjacências do grafo.
+
+        A estrutura é indexada pelos índices de `mapa_vertices` e fica em cache
+        até a próxima modificação do grafo.
+        Arestas com extremidades inexistentes no grafo são ignoradas.
+
+        Args:
+            ordenada (bool): Se True, retorna a versão com os vizinhos de cada
+                             vértice ordenados (usada pelas buscas determinísticas)
+
+        Returns:
+            CSR: Vetores offsets/vizinhos/ids_arestas do grafo
+        """
+        if ordenada:
+            # Vizinhos em ordem crescente de índice (= ordem dos rótulos)
+            return self.cache.obter('csr_ordenada', lambda: self.obter_csr().ordenada())
+        return self.cache.obter('csr', self._construir_csr)
+
+    def vetores_extremidades(self):
+        """
+        Retorna os índices (posições em `vertices_ordenados`) das extremidades de
+        cada aresta, na ordem de `arestas`. Os vetores ficam em cache até a próxima
+        modificação e não devem ser alterados.
+
+        Returns:
+            tuple: (origens, destinos): arrays com as duas extremidades de cada
+                   aresta (-1 para vértices inexistentes no grafo)
+        """
+        if self._extremidades_carregadas is not None:
+            # Sem mutações desde a carga: os IDs ainda são as posições ordenadas
+            return self._extremidades_carregadas
+        return self.cache.obter('extremidades', self._construir_vetores_extremidades)
+
+    def _construir_vetores_extremidades(self):
+        tipo = tipo_indice(self.num_vertices)
+        posicao = self.mapa_vertices.get
+        origens = array(tipo, [posicao(v1, -1) for v1, _ in self.arestas])
+        destinos = array(tipo, [posicao(v2, -1) for _, v2 in self.arestas])
+        return origens, destinos
+
+    def _construir_csr(self):
+        origens, destinos = self.vetores_extremidades()
+        return CSR.construir(self.num_vertices, origens, destinos, simetrico=True)
 
     def criar_lista_adjacencia(self):
         """
         Cria e retorna a lista de adjacência do grafo.
+        Adaptador sobre a representação CSR (ver obter_csr); a lista fica em cache
+        até a próxima modificação do grafo, e cada chamada devolve uma cópia dela,
+        que pode ser alterada sem afetar as seguintes.
         """
-        lista_adj = {v: [] for v in self.vertices_ordenados}
-        for v1, v2 in self.arestas:
-            # Garante que os vértices existem na lista antes de adicionar
-            if v1 in lista_adj and v2 in lista_adj:
-                lista_adj[v1].append(v2)
-                lista_adj[v2].append(v1)
-        return lista_adj
+        return copiar_lista_adjacencia(self.cache.obter(
+            'lista_adjacencia',
+            lambda: self.obter_csr().para_lista_adjacencia(self.vertices_ordenados)
+        ))
 
-    def criar_matriz_adjacencia(self):
+    def criar_matriz_adjacencia(self, formato='lista'):
         """
         Cria e retorna a matriz de adjacência do grafo.
+        A matriz fica em cache até a próxima modificação do grafo, e cada chamada
+        devolve uma cópia dela (a persistente, que não muda, é compartilhada).
+
+        Args:
+            formato (str): 'lista' (padrão) para uma lista de listas de 0/1,
+                           'bits' para uma MatrizBits (1 bit por célula, com
+                           operações de OR/AND entre linhas), 'numpy' para
+                           um ndarray de uint8 (requer NumPy), 'persistente'
+                           para uma MatrizAdjacenciaPersistente, montada em
+                           O(V + E) e pronta para os itens 9 e 10, ou 'crescente'
+                           para uma MatrizAdjacenciaCrescente, alterada no lugar
+                           com inclusão/exclusão de vértice em O(V) amortizado
+                           (esta não fica em cache: cada chamada cria uma nova)
+
+        Raises:
+            ValueError: Se o formato for desconhecido
+            ImportError: Se formato='numpy' e o NumPy não estiver instalado
         """
+        if formato == 'lista':
+            return copiar_matriz(
+                self.cache.obter('matriz_adjacencia', self._construir_matriz_adjacencia)
+            )
+        if formato == 'bits':
+            return self.cache.obter(
+                'matriz_adjacencia_bits', lambda: MatrizBits.de_csr(self.obter_csr())
+            ).copia()
+        if formato == 'numpy':
+            return self.cache.obter(
+                'matriz_adjacencia_numpy', lambda: matriz_adjacencia_de_csr(self.obter_csr())
+            ).copy()
+        if formato == 'crescente':
+            return MatrizAdjacenciaCrescente.de_csr(self.obter_csr(), self.vertices_ordenados)
+        if formato == 'persistente':
+            return self.cache.obter(
+                'matriz_adjacencia_persistente',
+                lambda: MatrizAdjacenciaPersistente.de_csr(self.obter_csr(), self.vertices_ordenados)
+            )
+        raise ValueError(f"Formato de matriz desconhecido: '{formato}'.")
+
+    def _construir_matriz_adjacencia(self):
         matriz_adj = [[0] * self.num_vertices for _ in range(self.num_vertices)]
         for v1, v2 in self.arestas:
             # Usa o mapa de vértices para encontrar os índices corretos
@@ -42,10 +334,34 @@ class Grafo:
                 matriz_adj[idx2][idx1] = 1
         return matriz_adj
 
-    def criar_matriz_incidencia(self):
+    def criar_matriz_incidencia(self, formato='lista'):
         """
         Cria e retorna a matriz de incidência do grafo.
+        A matriz fica em cache até a próxima modificação do grafo; a densa é
+        devolvida como cópia, e a esparsa (somente leitura) é compartilhada.
+
+        Args:
+            formato (str): 'lista' (padrão) para a matriz densa V x E, ou 'esparsa'
+                           para uma MatrizIncidenciaEsparsa (apenas os não nulos,
+                           com acesso por aresta e por vértice)
+
+        Raises:
+            ValueError: Se o formato for desconhecido
         """
+        if formato == 'lista':
+            return copiar_matriz(
+                self.cache.obter('matriz_incidencia', self._construir_matriz_incidencia)
+            )
+        if formato == 'esparsa':
+            return self.cache.obter(
+                'matriz_incidencia_esparsa',
+                lambda: MatrizIncidenciaEsparsa.de_extremidades(
+                    self.num_vertices, *self.vetores_extremidades(), orientada=False
+                )
+            )
+        raise ValueError(f"Formato de matriz desconhecido: '{formato}'.")
+
+    def _construir_matriz_incidencia(self):
         matriz_inc = [[0] * self.num_arestas for _ in range(self.num_vertices)]
         for i, (v1, v2) in enumerate(self.arestas):
             idx1 = self.mapa_vertices.get(v1)
@@ -64,14 +380,70 @@ class Grafo:
     - total de arestas
     """
 
+    def _construir_indices(self):
+        """
+        Monta, em uma passada O(E), o vetor de graus e o índice de adjacência.
+
+        - _graus: vértice -> quantidade de arestas que contêm o vértice
+        - _indice_adjacencia: vértice -> {vizinho: multiplicidade da aresta}
+        """
+        self._graus = {v: 0 for v in self.vertices_ordenados}
+        self._indice_adjacencia = {v: {} for v in self.vertices_ordenados}
+        for v1, v2 in self.arestas:
+            self._registrar_aresta_indices(v1, v2)
+
+    def _registrar_aresta_indices(self, v1, v2):
+        graus = self._graus
+        indice = self._indice_adjacencia
+        graus[v1] = graus.get(v1, 0) + 1
+        vizinhos_v1 = indice.setdefault(v1, {})
+        vizinhos_v1[v2] = vizinhos_v1.get(v2, 0) + 1
+        if v1 != v2:
+            graus[v2] = graus.get(v2, 0) + 1
+            vizinhos_v2 = indice.setdefault(v2, {})
+            vizinhos_v2[v1] = vizinhos_v2.get(v1, 0) + 1
+
+    def _remover_aresta_indices(self, v1, v2):
+        # O(1): desfaz exatamente o que _registrar_aresta_indices fez para a aresta
+        graus = self._graus
+        indice = self._indice_adjacencia
+        for origem, destino in ((v1, v2), (v2, v1)) if v1 != v2 else ((v1, v2),):
+            graus[origem] -= 1
+            vizinhos = indice[origem]
+            vizinhos[destino] -= 1
+            if not vizinhos[destino]:
+                del vizinhos[destino]
+
+    def _obter_indices(self):
+        if self._graus is None:
+            self._construir_indices()
+        return self._graus, self._indice_adjacencia
+
     def get_grau_vertices(self):
         """
         Item 5 - Retorna o grau dos vértices.
+        O grau de v é o número de arestas que contêm v (lido do vetor de graus).
         """
-        grau_vertices = {}
-        for v in self.vertices_ordenados:
-            grau_vertices[f"d({v})"] = sum(v in aresta for aresta in self.arestas)
-        return grau_vertices
+        graus, _ = self._obter_indices()
+        return {f"d({v})": graus[v] for v in self.vertices_ordenados}
+
+    def get_grau(self, vertice):
+        """
+        Retorna o grau de um único vértice em O(1).
+
+        Args:
+            vertice (str): Vértice consultado
+
+        Returns:
+            int: Número de arestas que contêm o vértice
+
+        Raises:
+            ValueError: Se o vértice não existir no grafo
+        """
+        if vertice not in self._id_por_rotulo:
+            raise ValueError(f"O vértice '{vertice}' não existe no grafo.")
+        graus, _ = self._obter_indices()
+        return graus[vertice]
 
     def is_adjacente(
             self,
@@ -80,11 +452,31 @@ class Grafo:
     ) -> bool:
         """
         Item 6 - Verifica se os vertices são adjacentes.
+        Consulta O(1) no índice de adjacência (um vértice só é adjacente a si
+        mesmo se houver um laço).
+        """
+        _, indice = self._obter_indices()
+        vizinhos = indice.get(v1)
+        return vizinhos is not None and v2 in vizinhos
+
+    def sao_adjacentes(self, pares):
+        """
+        Verifica a adjacência de vários pares de vértices de uma só vez.
+
+        Args:
+            pares (iterable): Sequência de tuplas (v1, v2)
+
+        Returns:
+            list: Lista de booleanos, um para cada par, na mesma ordem da entrada
+
+        Exemplo:
+            >>> grafo = Grafo({'a', 'b', 'c'}, [('a', 'b')])
+            >>> grafo.sao_adjacentes([('a', 'b'), ('b', 'c')])
+            [True, False]
         """
-        for aresta in self.arestas:
-            if v1 in aresta and v2 in aresta:
-                return True
-        return False
+        _, indice = self._obter_indices()
+        vazio = {}
+        return [v2 in indice.get(v1, vazio) for v1, v2 in pares]
 
     def get_num_vertices(self) -> int:
         """
@@ -101,20 +493,71 @@ class Grafo:
     # =========================================================================
     # ITEM 9 - INCLUSÃO DE VÉRTICE
     # =========================================================================
+    #
+    # Os itens 9 e 10 não alteram a representação recebida: devolvem uma nova
+    # versão persistente (ver adjacencia_persistente.py) que compartilha com a
+    # anterior todas as linhas não afetadas. Uma lista/matriz comum é convertida
+    # uma única vez; passando de volta a versão devolvida, cada nova inclusão ou
+    # exclusão custa O(grau) em vez de O(V + E) (lista) ou O(V²) (matriz).
+
+    def _vizinhos_do_novo_vertice(self, novo_vertice, arestas_novas, existentes):
+        """
+        Valida as arestas de um vértice a incluir e retorna o outro extremo de cada uma.
+
+        Args:
+            novo_vertice (str): Vértice a incluir
+            arestas_novas (list): Tuplas (v1, v2) contendo o novo vértice (ou None)
+            existentes (container): Vértices existentes na representação
+
+        Returns:
+            list: Outro extremo de cada aresta, na ordem recebida (o próprio novo
+                  vértice, para um laço)
+
+        Raises:
+            ValueError: Se alguma aresta for inválida, não contiver o novo vértice
+                        ou conectar a um vértice inexistente
+        """
+        vizinhos = []
+        for aresta in arestas_novas or ():
+            if len(aresta) != 2:
+                raise ValueError(f"Aresta inválida: {aresta}. Deve ser uma tupla (v1, v2).")
+            
+            v1, v2 = aresta
+            
+            # Verifica se a aresta envolve o novo vértice
+            if novo_vertice not in aresta:
+                raise ValueError(
+                    f"Aresta {aresta} não conecta ao novo vértice '{novo_vertice}'."
+                )
+            
+            # Identifica o outro vértice da aresta
+            outro_vertice = v2 if v1 == novo_vertice else v1
+            
+            # Verifica se o outro vértice existe
+            if outro_vertice != novo_vertice and outro_vertice not in existentes:
+                raise ValueError(
+                    f"Não é possível adicionar aresta {aresta}: "
+                    f"vértice '{outro_vertice}' não existe no grafo."
+                )
+            vizinhos.append(outro_vertice)
+        return vizinhos
     
     def incluir_vertice_lista_adjacencia(self, lista_adj, novo_vertice, arestas_novas=None):
         """
         Inclui um novo vértice na representação de lista de adjacências.
         
         Args:
-            lista_adj (dict): Lista de adjacências atual do grafo
+            lista_adj (dict | ListaAdjacenciaPersistente): Lista de adjacências atual
+                                           (não é alterada)
             novo_vertice (str): Identificador do novo vértice a ser adicionado
             arestas_novas (list, optional): Lista de tuplas (novo_vertice, vertice_existente) 
                                            ou (vertice_existente, novo_vertice) representando 
                                            as arestas do novo vértice. Default: None (vértice isolado)
             
         Returns:
-            dict: Nova lista de adjacências com o vértice e suas arestas incluídos
+            ListaAdjacenciaPersistente: Nova lista de adjacências (mapeamento vértice ->
+                                        lista de vizinhos) com o vértice e suas arestas
+                                        incluídos; só as linhas dos vizinhos são copiadas
             
         Raises:
             ValueError: Se o vértice já existir na lista de adjacências ou se alguma aresta
@@ -128,48 +571,20 @@ class Grafo:
         if novo_vertice in lista_adj:
             raise ValueError(f"O vértice '{novo_vertice}' já existe no grafo.")
         
-        # Cria uma cópia da lista de adjacências
-        nova_lista = {v: vizinhos.copy() for v, vizinhos in lista_adj.items()}
-        nova_lista[novo_vertice] = []
-        
-        # Se há arestas a serem adicionadas, valida e adiciona
-        if arestas_novas:
-            for aresta in arestas_novas:
-                if len(aresta) != 2:
-                    raise ValueError(f"Aresta inválida: {aresta}. Deve ser uma tupla (v1, v2).")
-                
-                v1, v2 = aresta
-                
-                # Verifica se a aresta envolve o novo vértice
-                if novo_vertice not in aresta:
-                    raise ValueError(
-                        f"Aresta {aresta} não conecta ao novo vértice '{novo_vertice}'."
-                    )
-                
-                # Identifica o outro vértice da aresta
-                outro_vertice = v2 if v1 == novo_vertice else v1
-                
-                # Verifica se o outro vértice existe
-                if outro_vertice not in nova_lista:
-                    raise ValueError(
-                        f"Não é possível adicionar aresta {aresta}: "
-                        f"vértice '{outro_vertice}' não existe no grafo."
-                    )
-                
-                # Adiciona a aresta (bidirecional)
-                if outro_vertice not in nova_lista[novo_vertice]:
-                    nova_lista[novo_vertice].append(outro_vertice)
-                if novo_vertice not in nova_lista[outro_vertice]:
-                    nova_lista[outro_vertice].append(novo_vertice)
-        
-        return nova_lista
+        vizinhos = self._vizinhos_do_novo_vertice(novo_vertice, arestas_novas, lista_adj)
+        if not isinstance(lista_adj, ListaAdjacenciaPersistente):
+            lista_adj = ListaAdjacenciaPersistente.de_dicionario(lista_adj)
+        return lista_adj.incluir_vertice(novo_vertice, vizinhos)
 
     def incluir_vertice_matriz_adjacencia(self, matriz_adj, novo_vertice, arestas_novas=None):
         """
         Inclui um novo vértice na representação de matriz de adjacências.
         
         Args:
-            matriz_adj (list): Matriz de adjacências atual do grafo (lista de listas)
+            matriz_adj (list | MatrizAdjacenciaPersistente): Matriz de adjacências atual
+                                           (não é alterada). Uma lista de listas segue a
+                                           ordem de vertices_ordenados; uma matriz
+                                           persistente traz a sua própria ordem
             novo_vertice (str): Identificador do novo vértice a ser adicionado
             arestas_novas (list, optional): Lista de tuplas (novo_vertice, vertice_existente) 
                                            ou (vertice_existente, novo_vertice) representando 
@@ -177,9 +592,9 @@ class Grafo:
             
         Returns:
             tuple: (nova_matriz, novos_vertices_ordenados, novo_mapa_vertices)
-                - nova_matriz: Matriz de adjacências expandida
-                - novos_vertices_ordenados: Lista atualizada de vértices
-                - novo_mapa_vertices: Dicionário atualizado de mapeamento
+                - nova_matriz: MatrizAdjacenciaPersistente expandida
+                - novos_vertices_ordenados: Sequência ordenada dos vértices
+                - novo_mapa_vertices: Mapeamento vértice -> posição
                 
         Raises:
             ValueError: Se o vértice já existir no grafo ou se alguma aresta
@@ -192,53 +607,16 @@ class Grafo:
             ...     matriz, 'c', [('c', 'a')])
             >>> # nova_m será 3x3 com conexão entre 'a' e 'c'
         """
-        if novo_vertice in self.mapa_vertices:
+        persistente = isinstance(matriz_adj, MatrizAdjacenciaPersistente)
+        existentes = matriz_adj.vertices if persistente else self.mapa_vertices
+        if novo_vertice in existentes:
             raise ValueError(f"O vértice '{novo_vertice}' já existe no grafo.")
         
-        novos_vertices = sorted(self.vertices_ordenados + [novo_vertice])
-        novo_mapa = {v: i for i, v in enumerate(novos_vertices)}
-        novo_tamanho = len(novos_vertices)
-        
-        nova_matriz = [[0] * novo_tamanho for _ in range(novo_tamanho)]
-        
-        # Copia os valores da matriz original para a nova matriz
-        for i, v_orig in enumerate(self.vertices_ordenados):
-            for j, v_dest in enumerate(self.vertices_ordenados):
-                nova_pos_i = novo_mapa[v_orig]
-                nova_pos_j = novo_mapa[v_dest]
-                nova_matriz[nova_pos_i][nova_pos_j] = matriz_adj[i][j]
-        
-        # Se há arestas a serem adicionadas, valida e adiciona
-        if arestas_novas:
-            for aresta in arestas_novas:
-                if len(aresta) != 2:
-                    raise ValueError(f"Aresta inválida: {aresta}. Deve ser uma tupla (v1, v2).")
-                
-                v1, v2 = aresta
-                
-                # Verifica se a aresta envolve o novo vértice
-                if novo_vertice not in aresta:
-                    raise ValueError(
-                        f"Aresta {aresta} não conecta ao novo vértice '{novo_vertice}'."
-                    )
-                
-                # Identifica o outro vértice da aresta
-                outro_vertice = v2 if v1 == novo_vertice else v1
-                
-                # Verifica se o outro vértice existe
-                if outro_vertice not in novo_mapa:
-                    raise ValueError(
-                        f"Não é possível adicionar aresta {aresta}: "
-                        f"vértice '{outro_vertice}' não existe no grafo."
-                    )
-                
-                # Adiciona a aresta na matriz (bidirecional)
-                idx_novo = novo_mapa[novo_vertice]
-                idx_outro = novo_mapa[outro_vertice]
-                nova_matriz[idx_novo][idx_outro] = 1
-                nova_matriz[idx_outro][idx_novo] = 1
-        
-        return nova_matriz, novos_vertices, novo_mapa
+        vizinhos = self._vizinhos_do_novo_vertice(novo_vertice, arestas_novas, existentes)
+        if not persistente:
+            matriz_adj = MatrizAdjacenciaPersistente.de_matriz(matriz_adj, self.vertices_ordenados)
+        nova_matriz = matriz_adj.incluir_vertice(novo_vertice, vizinhos)
+        return nova_matriz, nova_matriz.vertices, nova_matriz.mapa_vertices
 
     # =========================================================================
     # ITEM 10 - EXCLUSÃO DE VÉRTICE
@@ -249,11 +627,13 @@ class Grafo:
         Exclui um vértice da representação de lista de adjacências.
         
         Args:
-            lista_adj (dict): Lista de adjacências atual do grafo
+            lista_adj (dict | ListaAdjacenciaPersistente): Lista de adjacências atual
+                                           (não é alterada)
             vertice_remover (str): Identificador do vértice a ser removido
             
         Returns:
-            dict: Nova lista de adjacências sem o vértice e suas conexões
+            ListaAdjacenciaPersistente: Nova lista de adjacências sem o vértice e suas
+                                        conexões; só as linhas dos vizinhos são copiadas
             
         Raises:
             ValueError: Se o vértice não existir na lista de adjacências
@@ -261,61 +641,182 @@ class Grafo:
         if vertice_remover not in lista_adj:
             raise ValueError(f"O vértice '{vertice_remover}' não existe no grafo.")
         
-        nova_lista = {}
-        for vertice, vizinhos in lista_adj.items():
-            if vertice != vertice_remover:
-                nova_lista[vertice] = [v for v in vizinhos if v != vertice_remover]
-        
-        return nova_lista
+        if not isinstance(lista_adj, ListaAdjacenciaPersistente):
+            lista_adj = ListaAdjacenciaPersistente.de_dicionario(lista_adj)
+        return lista_adj.excluir_vertice(vertice_remover)
 
     def excluir_vertice_matriz_adjacencia(self, matriz_adj, vertice_remover):
         """
         Exclui um vértice da representação de matriz de adjacências.
         
         Args:
-            matriz_adj (list): Matriz de adjacências atual do grafo (lista de listas)
+            matriz_adj (list | MatrizAdjacenciaPersistente): Matriz de adjacências atual
+                                           (não é alterada; ver incluir_vertice_matriz_adjacencia)
             vertice_remover (str): Identificador do vértice a ser removido
             
         Returns:
             tuple: (nova_matriz, novos_vertices_ordenados, novo_mapa_vertices)
-                - nova_matriz: Matriz de adjacências reduzida
-                - novos_vertices_ordenados: Lista atualizada de vértices
-                - novo_mapa_vertices: Dicionário atualizado de mapeamento
+                - nova_matriz: MatrizAdjacenciaPersistente reduzida
+                - novos_vertices_ordenados: Sequência ordenada dos vértices
+                - novo_mapa_vertices: Mapeamento vértice -> posição
                 
         Raises:
             ValueError: Se o vértice não existir no grafo
         """
-        if vertice_remover not in self.mapa_vertices:
+        persistente = isinstance(matriz_adj, MatrizAdjacenciaPersistente)
+        existentes = matriz_adj.vertices if persistente else self.mapa_vertices
+        if vertice_remover not in existentes:
             raise ValueError(f"O vértice '{vertice_remover}' não existe no grafo.")
         
-        idx_remover = self.mapa_vertices[vertice_remover]
-        novos_vertices = [v for v in self.vertices_ordenados if v != vertice_remover]
-        novo_mapa = {v: i for i, v in enumerate(novos_vertices)}
-        novo_tamanho = len(novos_vertices)
-        
-        nova_matriz = [[0] * novo_tamanho for _ in range(novo_tamanho)]
-        
-        idx_nova_linha = 0
-        for i in range(len(self.vertices_ordenados)):
-            if i == idx_remover:
-                continue
-            idx_nova_coluna = 0
-            for j in range(len(self.vertices_ordenados)):
-                if j == idx_remover:
-                    continue
-                nova_matriz[idx_nova_linha][idx_nova_coluna] = matriz_adj[i][j]
-                idx_nova_coluna += 1
-            idx_nova_linha += 1
-        
-        return nova_matriz, novos_vertices, novo_mapa
+        if not persistente:
+            matriz_adj = MatrizAdjacenciaPersistente.de_matriz(matriz_adj, self.vertices_ordenados)
+        nova_matriz = matriz_adj.excluir_vertice(vertice_remover)
+        return nova_matriz, nova_matriz.vertices, nova_matriz.mapa_vertices
 
     # =========================================================================
     # MÉTODOS PARA MODIFICAR O GRAFO DIRETAMENTE
     # =========================================================================
-    
+    #
+    # Todas as operações custam O(1) amortizado (inclusões) ou O(grau) (exclusões):
+    # nenhuma delas reordena os vértices nem percorre a lista de arestas. As visões
+    # ordenadas (vertices_ordenados, mapa_vertices, arestas) são apenas descartadas
+    # e remontadas na próxima leitura.
+
+    def _obter_incidencias(self):
+        if self._incidencias is None:
+            incidencias = {}
+            for id_aresta, aresta in enumerate(self._obter_arestas_por_id()):
+                if aresta is not None:
+                    v1, v2 = aresta
+                    incidencias.setdefault(v1, {})[id_aresta] = None
+                    incidencias.setdefault(v2, {})[id_aresta] = None
+            self._incidencias = incidencias
+        return self._incidencias
+
+    def _obter_contagem_arestas(self):
+        if self._contagem_arestas is None:
+            contagem = {}
+            for aresta in self._obter_arestas_por_id():
+                if aresta is not None:
+                    contagem[aresta] = contagem.get(aresta, 0) + 1
+            self._contagem_arestas = contagem
+        return self._contagem_arestas
+
+    def _separar_visoes_ordenadas(self):
+        # Visões entregues antes da mutação continuam válidas: as estruturas por ID
+        # compartilhadas com elas são copiadas uma única vez, antes de mudar
+        if self._rotulos is self._vertices_ordenados:
+            self._rotulos = list(self._rotulos)
+        if self._id_por_rotulo is self._mapa_vertices:
+            self._id_por_rotulo = dict(self._id_por_rotulo)
+
+    def _registrar_vertice(self, vertice):
+        self._obter_arestas_por_id()  # IDs deixam de coincidir com as posições ordenadas
+        self._separar_visoes_ordenadas()
+        id_vertice = len(self._rotulos)
+        self._rotulos.append(vertice)
+        self._id_por_rotulo[vertice] = id_vertice
+        self._vertices_ordenados = None
+        self._mapa_vertices = None
+        if self._graus is not None:
+            self._graus.setdefault(vertice, 0)
+            self._indice_adjacencia.setdefault(vertice, {})
+        if self._conectividade is not None:
+            self._conectividade.adicionar()  # elemento de índice id_vertice
+            # Arestas já existentes que citavam o rótulo passam a contar
+            for id_aresta in self._obter_incidencias().get(vertice, ()):
+                v1, v2 = self._arestas_por_id[id_aresta]
+                outro = self._id_por_rotulo.get(v2 if v1 == vertice else v1, -1)
+                if outro >= 0:
+                    self._conectividade.unir(id_vertice, outro)
+        return id_vertice
+
+    def _registrar_aresta(self, aresta):
+        arestas_por_id = self._obter_arestas_por_id()
+        id_aresta = len(arestas_por_id)
+        arestas_por_id.append(aresta)
+        self._num_arestas += 1
+        if self._arestas is not None:
+            self._arestas.append(aresta)
+        v1, v2 = aresta
+        if self._incidencias is not None:
+            self._incidencias.setdefault(v1, {})[id_aresta] = None
+            self._incidencias.setdefault(v2, {})[id_aresta] = None
+        if self._contagem_arestas is not None:
+            self._contagem_arestas[aresta] = self._contagem_arestas.get(aresta, 0) + 1
+        if self._graus is not None:
+            self._registrar_aresta_indices(v1, v2)
+        if self._conectividade is not None:
+            self._conectividade.unir(self._id_por_rotulo[v1], self._id_por_rotulo[v2])
+        return id_aresta
+
+    def _descartar_aresta(self, id_aresta):
+        arestas_por_id = self._obter_arestas_por_id()
+        aresta = arestas_por_id[id_aresta]
+        v1, v2 = aresta
+        arestas_por_id[id_aresta] = None
+        self._num_arestas -= 1
+        self._arestas = None
+        incidencias = self._obter_incidencias()
+        del incidencias[v1][id_aresta]
+        if v2 != v1:
+            del incidencias[v2][id_aresta]
+        if self._contagem_arestas is not None:
+            restantes = self._contagem_arestas[aresta] - 1
+            if restantes:
+                self._contagem_arestas[aresta] = restantes
+            else:
+                del self._contagem_arestas[aresta]
+        if self._graus is not None:
+            self._remover_aresta_indices(v1, v2)
+        # A união e busca não desfaz uniões: remonta na próxima consulta
+        self._conectividade = None
+
+    def _descartar_vertice(self, vertice):
+        incidencias = self._obter_incidencias()
+        for id_aresta in list(incidencias.get(vertice, ())):
+            self._descartar_aresta(id_aresta)
+        incidencias.pop(vertice, None)
+        self._separar_visoes_ordenadas()
+        # O ID não é reaproveitado: a posição fica marcada como vazia
+        self._rotulos[self._id_por_rotulo.pop(vertice)] = None
+        self._vertices_ordenados = None
+        self._mapa_vertices = None
+        if self._graus is not None:
+            self._graus.pop(vertice, None)
+            self._indice_adjacencia.pop(vertice, None)
+        self._conectividade = None
+
+    def _localizar_aresta(self, v1, v2, ignorar=()):
+        # Procura pela menor das duas listas de incidência: O(min(grau(v1), grau(v2)))
+        incidencias = self._obter_incidencias()
+        candidatas = incidencias.get(v1, {})
+        outras = incidencias.get(v2, {})
+        if len(outras) < len(candidatas):
+            candidatas = outras
+        for id_aresta in candidatas:
+            if id_aresta in ignorar:
+                continue
+            aresta = self._arestas_por_id[id_aresta]
+            if aresta == (v1, v2) or aresta == (v2, v1):
+                return id_aresta
+        raise ValueError(f"A aresta ({v1}, {v2}) não existe no grafo.")
+
+    def _validar_extremidades(self, arestas):
+        for aresta in arestas:
+            if len(aresta) != 2:
+                raise ValueError(f"Aresta inválida: {aresta}. Deve ser uma tupla (v1, v2).")
+            for vertice in aresta:
+                if vertice not in self._id_por_rotulo:
+                    raise ValueError(
+                        f"Não é possível adicionar aresta {aresta}: "
+                        f"vértice '{vertice}' não existe no grafo."
+                    )
+
     def incluir_vertice(self, novo_vertice, arestas_novas=None):
         """
         Inclui um novo vértice diretamente no grafo, modificando suas estruturas internas.
+        Custa O(1 + len(arestas_novas)) amortizado.
         
         Args:
             novo_vertice (str): Identificador do novo vértice a ser adicionado
@@ -323,6 +824,9 @@ class Grafo:
                                            ou (vertice_existente, novo_vertice) representando 
                                            as arestas do novo vértice. Default: None (vértice isolado)
         
+        Returns:
+            int: ID estável atribuído ao vértice
+        
         Raises:
             ValueError: Se o vértice já existir no grafo ou se alguma aresta
                        conectar a um vértice inexistente
@@ -330,9 +834,9 @@ class Grafo:
         Exemplo:
             >>> grafo = Grafo({'a', 'b'}, [('a', 'b')])
             >>> grafo.incluir_vertice('c', [('c', 'a')])
-            >>> # Grafo agora tem vértices {a, b, c} e arestas [(a,b), (c,a)]
+            >>> # Grafo agora tem vértices {a, b, c} e arestas [(a,b), (a,c)]
         """
-        if novo_vertice in self.vertices_ordenados:
+        if novo_vertice in self._id_por_rotulo:
             raise ValueError(f"O vértice '{novo_vertice}' já existe no grafo.")
         
         # Valida as arestas antes de modificar o grafo
@@ -353,31 +857,31 @@ class Grafo:
                 outro_vertice = v2 if v1 == novo_vertice else v1
                 
                 # Verifica se o outro vértice existe
-                if outro_vertice not in self.vertices_ordenados:
+                if outro_vertice not in self._id_por_rotulo:
                     raise ValueError(
                         f"Não é possível adicionar aresta {aresta}: "
                         f"vértice '{outro_vertice}' não existe no grafo."
                     )
         
         # Adiciona o vértice
-        self.vertices_ordenados = sorted(self.vertices_ordenados + [novo_vertice])
-        self.num_vertices = len(self.vertices_ordenados)
-        self.mapa_vertices = {vertice: i for i, vertice in enumerate(self.vertices_ordenados)}
+        id_vertice = self._registrar_vertice(novo_vertice)
+        self.cache.registrar_mutacao()
         
         # Adiciona as arestas
         if arestas_novas:
+            contagem = self._obter_contagem_arestas()
             for aresta in arestas_novas:
                 # Normaliza a aresta para evitar duplicatas (ex: (a,b) e (b,a))
                 aresta_normalizada = tuple(sorted(aresta))
-                if aresta_normalizada not in self.arestas:
-                    self.arestas.append(aresta_normalizada)
-            
-            self.num_arestas = len(self.arestas)
+                if aresta_normalizada not in contagem:
+                    self._registrar_aresta(aresta_normalizada)
+        
+        return id_vertice
     
     def excluir_vertice(self, vertice_remover):
         """
         Exclui um vértice diretamente do grafo, modificando suas estruturas internas.
-        Remove também todas as arestas conectadas a esse vértice.
+        Remove também todas as arestas conectadas a esse vértice, em O(grau).
         
         Args:
             vertice_remover (str): Identificador do vértice a ser removido
@@ -390,34 +894,208 @@ class Grafo:
             >>> grafo.excluir_vertice('b')
             >>> # Grafo agora tem vértices {a, c} e arestas [] (b conectava a e c)
         """
-        if vertice_remover not in self.vertices_ordenados:
+        if vertice_remover not in self._id_por_rotulo:
             raise ValueError(f"O vértice '{vertice_remover}' não existe no grafo.")
         
-        # Remove o vértice
-        self.vertices_ordenados = [v for v in self.vertices_ordenados if v != vertice_remover]
-        self.num_vertices = len(self.vertices_ordenados)
-        self.mapa_vertices = {vertice: i for i, vertice in enumerate(self.vertices_ordenados)}
+        self._descartar_vertice(vertice_remover)
+        self.cache.registrar_mutacao()
+
+    def incluir_aresta(self, v1, v2):
+        """
+        Inclui uma aresta entre dois vértices existentes em O(1) amortizado.
+        Arestas paralelas e laços são permitidos, como no construtor.
+        
+        Args:
+            v1 (str): Primeira extremidade
+            v2 (str): Segunda extremidade
+        
+        Returns:
+            int: ID estável da aresta
+        
+        Raises:
+            ValueError: Se alguma extremidade não existir no grafo
+        """
+        self._validar_extremidades([(v1, v2)])
+        id_aresta = self._registrar_aresta((v1, v2))
+        self.cache.registrar_mutacao()
+        return id_aresta
+
+    def excluir_aresta(self, v1, v2):
+        """
+        Exclui uma aresta entre v1 e v2 (em qualquer orientação) em O(min(grau(v1), grau(v2))).
+        Havendo arestas paralelas, remove a incluída primeiro.
+        
+        Returns:
+            int: ID da aresta removida
+        
+        Raises:
+            ValueError: Se não existir aresta entre v1 e v2
+        """
+        id_aresta = self._localizar_aresta(v1, v2)
+        self._descartar_aresta(id_aresta)
+        self.cache.registrar_mutacao()
+        return id_aresta
+
+    def incluir_vertices(self, vertices):
+        """
+        Inclui vários vértices isolados de uma vez (validação completa antes de modificar).
+        
+        Returns:
+            list: IDs estáveis atribuídos, na ordem da entrada
+        
+        Raises:
+            ValueError: Se algum vértice já existir ou estiver repetido na entrada
+        """
+        vertices = list(vertices)
+        vistos = set()
+        for vertice in vertices:
+            if vertice in self._id_por_rotulo or vertice in vistos:
+                raise ValueError(f"O vértice '{vertice}' já existe no grafo.")
+            vistos.add(vertice)
+        ids = [self._registrar_vertice(vertice) for vertice in vertices]
+        self.cache.registrar_mutacao()
+        return ids
+
+    def excluir_vertices(self, vertices):
+        """
+        Exclui vários vértices (e suas arestas) de uma vez, em O(soma dos graus).
+        
+        Raises:
+            ValueError: Se algum vértice não existir no grafo (nada é removido)
+        """
+        vertices = list(dict.fromkeys(vertices))
+        for vertice in vertices:
+            if vertice not in self._id_por_rotulo:
+                raise ValueError(f"O vértice '{vertice}' não existe no grafo.")
+        for vertice in vertices:
+            self._descartar_vertice(vertice)
+        self.cache.registrar_mutacao()
+
+    def incluir_arestas(self, arestas):
+        """
+        Inclui várias arestas de uma vez (validação completa antes de modificar).
+        
+        Returns:
+            list: IDs estáveis das arestas, na ordem da entrada
+        
+        Raises:
+            ValueError: Se alguma aresta for inválida ou tiver extremidade inexistente
+        """
+        arestas = [tuple(aresta) for aresta in arestas]
+        self._validar_extremidades(arestas)
+        ids = [self._registrar_aresta(aresta) for aresta in arestas]
+        self.cache.registrar_mutacao()
+        return ids
+
+    def excluir_arestas(self, arestas):
+        """
+        Exclui várias arestas de uma vez; cada par remove uma cópia da aresta.
+        
+        Returns:
+            list: IDs das arestas removidas, na ordem da entrada
         
-        # Remove todas as arestas que conectam ao vértice removido
-        self.arestas = [
-            aresta for aresta in self.arestas 
-            if vertice_remover not in aresta
-        ]
-        self.num_arestas = len(self.arestas)
+        Raises:
+            ValueError: Se algum par não corresponder a uma aresta existente (nada é removido)
+        """
+        ids = []
+        escolhidas = set()
+        for v1, v2 in arestas:
+            id_aresta = self._localizar_aresta(v1, v2, ignorar=escolhidas)
+            escolhidas.add(id_aresta)
+            ids.append(id_aresta)
+        for id_aresta in ids:
+            self._descartar_aresta(id_aresta)
+        self.cache.registrar_mutacao()
+        return ids
+
+    # Nomes em inglês da API de mutação
+    add_vertex = incluir_vertice
+    remove_vertex = excluir_vertice
+    add_edge = incluir_aresta
+    remove_edge = excluir_aresta
+    add_vertices = incluir_vertices
+    remove_vertices = excluir_vertices
+    add_edges = incluir_arestas
+    remove_edges = excluir_arestas
+
+    # =========================================================================
+    # SUBGRAFOS E MÁSCARAS (VISTAS SEM CÓPIA)
+    # =========================================================================
+    #
+    # As vistas compartilham a CSR do grafo e guardam só a máscara (ver
+    # vista_mascarada.py): criá-las custa O(máscara), o que permite simular a
+    # remoção de cada um de milhares de vértices sem reconstruir o grafo.
+
+    def subgrafo_induzido(self, vertices):
+        """
+        Retorna uma vista do subgrafo induzido pelos vértices informados.
+        
+        Args:
+            vertices (iterable): Vértices do subgrafo
+        
+        Returns:
+            VistaMascarada: Vista com esses vértices e as arestas entre eles
+        
+        Raises:
+            ValueError: Se algum vértice não existir no grafo
+        """
+        vertices = list(vertices)  # percorrido duas vezes: aceita geradores
+        mapa = self.mapa_vertices
+        for vertice in vertices:
+            if vertice not in mapa:
+                raise ValueError(f"O vértice '{vertice}' não existe no grafo.")
+        return VistaMascarada(self, visiveis=frozenset(mapa[v] for v in vertices))
+
+    def mascarar(self, vertices=(), arestas=()):
+        """
+        Retorna uma vista do grafo com os vértices (e suas arestas) e as arestas
+        informados ocultos, em O(máscara). A vista pode ser mascarada de novo.
+        
+        Args:
+            vertices (iterable): Vértices a ocultar
+            arestas (iterable): IDs estáveis das arestas a ocultar (ver aresta_por_id)
+        
+        Returns:
+            VistaMascarada: Vista sobre este grafo
+        
+        Raises:
+            ValueError: Se algum vértice ou aresta não existir no grafo
+        """
+        return VistaMascarada(self).mascarar(vertices, arestas)
+
+    def _posicoes_arestas(self, ids):
+        """
+        Converte IDs estáveis de arestas nas posições usadas pela CSR.
+        
+        Raises:
+            ValueError: Se algum ID não corresponder a uma aresta existente
+        """
+        ids = list(ids)
+        ids_estaveis = self.cache.obter('ids_estaveis_arestas', self._ids_estaveis_arestas)
+        posicoes = posicoes_arestas(ids_estaveis, ids)
+        for id_aresta, posicao in zip(ids, posicoes):
+            if not 0 <= posicao < self._num_arestas:
+                raise ValueError(f"A aresta de ID {id_aresta} não existe no grafo.")
+        return posicoes
 
     # =========================================================================
     # ITEM 13 - BUSCA EM LARGURA (BFS)
     # =========================================================================
     
-    def busca_em_largura(self, vertice_inicial):
+    def busca_em_largura(self, vertice_inicial, deterministico=True):
         """
         Realiza uma Busca em Largura (BFS) a partir de um vértice inicial.
         
         A BFS explora o grafo em camadas: primeiro visita todos os vizinhos diretos
         do vértice inicial, depois os vizinhos dos vizinhos, e assim por diante.
+        A busca roda em O(V + E) sobre a representação CSR (ver busca_largura.py).
         
         Args:
             vertice_inicial (str): Vértice de onde a busca deve começar
+            deterministico (bool): Se True (padrão), os vizinhos de cada vértice são
+                                   visitados em ordem crescente de rótulo, usando a
+                                   adjacência pré-ordenada; se False, segue a ordem de
+                                   inserção das arestas, sem custo de ordenação
             
         Returns:
             dict: Dicionário contendo:
@@ -429,38 +1107,52 @@ class Grafo:
         Raises:
             ValueError: Se o vértice inicial não existir no grafo
         """
-        if vertice_inicial not in self.vertices_ordenados:
+        if vertice_inicial not in self.mapa_vertices:
             raise ValueError(f"O vértice '{vertice_inicial}' não existe no grafo.")
+
+        csr = self.obter_csr(ordenada=deterministico)
+        resultado = busca_em_largura_csr(csr, self.mapa_vertices[vertice_inicial])
+        return resultado_bfs_com_rotulos(resultado, self.vertices_ordenados)
+
+    def busca_em_largura_multipla(self, fontes, modo='matriz', tamanho_lote=64):
+        """
+        Realiza a BFS a partir de várias fontes de uma só vez.
         
-        lista_adj = self.criar_lista_adjacencia()
+        No modo 'matriz', as buscas avançam juntas em lotes de `tamanho_lote` fontes
+        (uma máscara de bits por vértice, ver busca_largura.py), reaproveitando a
+        mesma CSR e a mesma varredura de fronteira por nível. No modo 'mais_proxima',
+        uma única BFS com todas as fontes na fila rotula cada vértice em O(V + E).
         
-        visitados = set()
-        fila = [vertice_inicial]
-        ordem_visitacao = []
-        distancias = {vertice_inicial: 0}
-        pais = {vertice_inicial: None}
+        Args:
+            fontes (list): Vértices de origem
+            modo (str): 'matriz' (padrão) ou 'mais_proxima'
+            tamanho_lote (int): Fontes processadas por máscara no modo 'matriz'
         
-        while fila:
-            vertice_atual = fila.pop(0)
-            
-            if vertice_atual in visitados:
-                continue
-            
-            visitados.add(vertice_atual)
-            ordem_visitacao.append(vertice_atual)
-            
-            for vizinho in sorted(lista_adj[vertice_atual]):
-                if vizinho not in visitados and vizinho not in fila:
-                    fila.append(vizinho)
-                    distancias[vizinho] = distancias[vertice_atual] + 1
-                    pais[vizinho] = vertice_atual
+        Returns:
+            dict: No modo 'matriz':
+                - 'fontes': Lista das fontes (linhas da matriz)
+                - 'distancias': Lista com uma linha (array de inteiros compactos) por
+                                fonte; a coluna j é a distância ao vértice
+                                vertices_ordenados[j] (-1 se inalcançável)
+                  No modo 'mais_proxima' (apenas vértices alcançáveis):
+                - 'fonte_mais_proxima': Dicionário vértice -> fonte mais próxima
+                                        (empates: a que aparece primeiro em `fontes`)
+                - 'distancias': Dicionário vértice -> distância a essa fonte
         
-        return {
-            'ordem_visitacao': ordem_visitacao,
-            'distancias': distancias,
-            'pais': pais,
-            'alcancaveis': visitados
-        }
+        Raises:
+            ValueError: Se alguma fonte não existir no grafo ou o modo for desconhecido
+        """
+        mapa_vertices = self.mapa_vertices
+        for fonte in fontes:
+            if fonte not in mapa_vertices:
+                raise ValueError(f"O vértice '{fonte}' não existe no grafo.")
+        
+        # A ordem das adjacências só influi nos empates do modo 'mais_proxima'
+        csr = self.obter_csr(ordenada=(modo == 'mais_proxima'))
+        indices = [mapa_vertices[fonte] for fonte in fontes]
+        return resultado_bfs_multipla_com_rotulos(
+            csr, indices, self.vertices_ordenados, modo, tamanho_lote
+        )
     
     # =========================================================================
     # ITEM 11 - VERIFICAR SE O GRAFO É CONEXO
@@ -469,24 +1161,138 @@ class Grafo:
         """
         Verifica se o grafo é conexo.
         Um grafo é conexo se existe um caminho entre qualquer par de vértices.
-        A verificação é feita realizando uma busca (BFS ou DFS) a partir de um
-        vértice arbitrário e checando se todos os outros vértices foram visitados.
+        As arestas são unidas em uma estrutura de união e busca (ver uniao_busca.py),
+        e a verificação para assim que resta uma única componente. Se os vetores de
+        extremidades ainda não existirem (nem em cache nem da carga do arquivo), cada
+        aresta é traduzida para índices só quando chega a sua vez: as restantes não
+        são examinadas, e nem os vetores nem a CSR são montados.
 
         Returns:
             bool: True se o grafo for conexo, False caso contrário.
         """
         if self.num_vertices == 0:
             return True  # Um grafo vazio é considerado conexo.
+        if self._conectividade_ativa:
+            return self.num_componentes_conexas() == 1
 
-        # Pega um vértice qualquer para iniciar a busca
-        vertice_inicial = self.vertices_ordenados[0]
-        
-        # Usa a busca em largura já implementada para encontrar todos os vértices alcançáveis
-        resultado_bfs = self.busca_em_largura(vertice_inicial)
-        vertices_alcancaveis = resultado_bfs['alcancaveis']
-        
-        # Se o número de vértices alcançáveis é igual ao total, o grafo é conexo
-        return len(vertices_alcancaveis) == self.num_vertices
+        extremidades = self._extremidades_carregadas or self.cache.consultar('extremidades')
+        if extremidades is None:
+            posicao = self.mapa_vertices.get
+            arestas = self.arestas
+            extremidades = ((posicao(v1, -1) for v1, _ in arestas),
+                            (posicao(v2, -1) for _, v2 in arestas))
+        uniao_busca = UniaoBusca(self.num_vertices)
+        uniao_busca.unir_pares(*extremidades, parar_quando_conexo=True)
+        return uniao_busca.num_componentes == 1
+
+    def componentes_conexas(self):
+        """
+        Calcula as componentes conexas com união e busca (compressão de caminho e
+        união por posto) sobre os vetores de extremidades das arestas, em
+        O(V + E α(V)). O resultado fica em cache até a próxima modificação, e cada
+        chamada devolve cópias dos vetores.
+
+        Returns:
+            dict: Dicionário contendo:
+                - 'componente': array com o rótulo (0 a num_componentes - 1) da
+                                componente de cada vértice, na ordem de
+                                vertices_ordenados; as componentes são numeradas
+                                na ordem do seu primeiro vértice
+                - 'tamanhos': array com o número de vértices de cada componente
+                - 'num_componentes': Quantidade de componentes
+        """
+        componentes = self._obter_componentes_conexas()
+        return {
+            'componente': componentes['componente'][:],
+            'tamanhos': componentes['tamanhos'][:],
+            'num_componentes': componentes['num_componentes']
+        }
+
+    def _obter_componentes_conexas(self):
+        return self.cache.obter('componentes_conexas', self._construir_componentes_conexas)
+
+    # Conectividade incremental (opcional)
+    #
+    # Com a estrutura ativa, incluir vértices e arestas custa O(α(V)) a mais por
+    # operação, e is_conexo, mesma_componente e num_componentes_conexas respondem
+    # em tempo praticamente constante. Excluir um vértice ou uma aresta pode
+    # desconectar o grafo, o que a união e busca não sabe desfazer: a estrutura é
+    # descartada e remontada em O(V + E α(V)) na consulta seguinte.
+
+    def ativar_conectividade_incremental(self):
+        """
+        Liga a manutenção incremental da conectividade e monta a estrutura inicial.
+        """
+        self._conectividade_ativa = True
+        self._obter_conectividade()
+
+    def desativar_conectividade_incremental(self):
+        """
+        Desliga a manutenção incremental e libera a estrutura.
+        """
+        self._conectividade_ativa = False
+        self._conectividade = None
+
+    def _obter_conectividade(self):
+        if self._conectividade is None:
+            # Um elemento por ID já atribuído (inclusive de vértices removidos)
+            uniao_busca = UniaoBusca(len(self._rotulos))
+            if self._extremidades_carregadas is not None:
+                uniao_busca.unir_pares(*self._extremidades_carregadas)
+            else:
+                # Arestas com extremidades fora do grafo são ignoradas (-1)
+                posicao = self._id_por_rotulo.get
+                arestas = [a for a in self._arestas_por_id if a is not None]
+                uniao_busca.unir_pares((posicao(v1, -1) for v1, _ in arestas),
+                                       (posicao(v2, -1) for _, v2 in arestas))
+            self._conectividade = uniao_busca
+        return self._conectividade
+
+    def num_componentes_conexas(self):
+        """
+        Retorna a quantidade de componentes conexas do grafo.
+        Com a conectividade incremental ativa, a resposta é O(1).
+        """
+        if not self._conectividade_ativa:
+            return self._obter_componentes_conexas()['num_componentes']
+        # IDs de vértices removidos continuam na estrutura como conjuntos unitários
+        ids_vazios = len(self._rotulos) - self.num_vertices
+        return self._obter_conectividade().num_componentes - ids_vazios
+
+    def mesma_componente(self, u, v):
+        """
+        Verifica se dois vértices estão na mesma componente conexa.
+        Com a conectividade incremental ativa, custa O(α(V)).
+
+        Args:
+            u (str): Primeiro vértice
+            v (str): Segundo vértice
+
+        Returns:
+            bool: True se existir caminho entre u e v
+
+        Raises:
+            ValueError: Se algum dos vértices não existir no grafo
+        """
+        for vertice in (u, v):
+            if vertice not in self._id_por_rotulo:
+                raise ValueError(f"O vértice '{vertice}' não existe no grafo.")
+        if self._conectividade_ativa:
+            return self._obter_conectividade().mesmo_conjunto(
+                self._id_por_rotulo[u], self._id_por_rotulo[v]
+            )
+        componente = self._obter_componentes_conexas()['componente']
+        return componente[self.mapa_vertices[u]] == componente[self.mapa_vertices[v]]
+
+    def _construir_componentes_conexas(self):
+        uniao_busca = UniaoBusca(self.num_vertices)
+        uniao_busca.unir_pares(*self.vetores_extremidades())
+        componente, tamanhos = uniao_busca.rotulos()
+        return {
+            'componente': componente,
+            'tamanhos': tamanhos,
+            'num_componentes': uniao_busca.num_componentes
+        }
 
     
     # =========================================================================
@@ -503,40 +1309,13 @@ class Grafo:
                 - 'pais': Dicionário que mapeia cada vértice ao seu pai na árvore DFS.
                 - 'arestas_retorno': Lista de tuplas representando as arestas de retorno.
         """
-        lista_adj = self.criar_lista_adjacencia()
-        visitados = set()
-        pais = {v: None for v in self.vertices_ordenados}
-        ordem_visitacao = []
-        arestas_retorno = []
-
-        def _dfs_recursiva(u, pai):
-            visitados.add(u)
-            ordem_visitacao.append(u)
-            pais[u] = pai
-
-            for v in lista_adj[u]:
-                if v == pai:
-                    continue  # Ignora a aresta que leva de volta ao pai imediato
-                
-                if v in visitados:
-                    # Se v já foi visitado e não é o pai, (u, v) é uma aresta de retorno
-                    # Adiciona de forma ordenada para evitar duplicatas como (A,B) e (B,A)
-                    aresta = tuple(sorted((u, v)))
-                    if aresta not in arestas_retorno:
-                        arestas_retorno.append(aresta)
-                else:
-                    # Se v não foi visitado, continua a busca a partir dele
-                    _dfs_recursiva(v, u)
+        resultado = busca_em_profundidade_csr(self.obter_csr(), nao_direcionado=True)
+        rotulos = self.vertices_ordenados
 
-        # Itera sobre todos os vértices para garantir que grafos desconexos sejam percorridos
-        for vertice in self.vertices_ordenados:
-            if vertice not in visitados:
-                _dfs_recursiva(vertice, None)
-        
         return {
-            'ordem_visitacao': ordem_visitacao,
-            'pais': pais,
-            'arestas_retorno': arestas_retorno
+            'ordem_visitacao': [rotulos[i] for i in resultado['ordem']],
+            'pais': {rotulos[i]: (None if p < 0 else rotulos[p]) for i, p in enumerate(resultado['pais'])},
+            'arestas_retorno': [(rotulos[u], rotulos[v]) for u, v in resultado['arestas_retorno']]
         }
 
     # =========================================================================
@@ -553,79 +1332,129 @@ class Grafo:
                 - 'articulacoes': Um conjunto com os pontos de articulação.
                 - 'blocos': Uma lista de conjuntos, onde cada conjunto representa um bloco.
         """
-        lista_adj = self.criar_lista_adjacencia()
-        visitados = set()
-        d = {}  # Tempo de descoberta (discovery time)
-        low = {} # Função low-point (lowpt)
-        pais = {v: None for v in self.vertices_ordenados}
+        resultado = busca_em_profundidade_csr(
+            self.obter_csr(), nao_direcionado=True, calcular_low=True
+        )
+        rotulos = self.vertices_ordenados
+        pais = resultado['pais']
+        d = resultado['entrada']  # Tempo de descoberta (discovery time)
+        low = resultado['low']    # Função low-point (lowpt)
+        saida = resultado['saida']
+
         articulacoes = set()
-        pilha_arestas = []
+        filhos_raiz = {}
+        bloco_da_aresta_pai = [-1] * self.num_vertices
         blocos = []
-        self.tempo = 0
-
-        def _dfs_biconectividade(u, p):
-            visitados.add(u)
-            pais[u] = p
-            self.tempo += 1
-            d[u] = low[u] = self.tempo
-            filhos_dfs = 0
-
-            for v in lista_adj[u]:
-                if v == p:
-                    continue
-
-                if v in visitados:
-                    # Aresta de retorno encontrada
-                    low[u] = min(low[u], d[v])
-                    if d[v] < d[u]: # Garante que a aresta só é adicionada uma vez
-                       pilha_arestas.append(tuple(sorted((u, v))))
+        inicio_bloco = []  # Filho que abre cada bloco (usado para ordenar a saída)
+
+        # Percorre as arestas de árvore (p, v) na ordem de descoberta: um novo bloco
+        # começa em v quando low[v] >= d[p]; caso contrário (p, v) pertence ao mesmo
+        # bloco da aresta que liga p ao seu pai
+        for v in resultado['ordem']:
+            p = pais[v]
+            if p < 0:
+                continue
+
+            if low[v] >= d[p]:
+                if pais[p] >= 0:
+                    articulacoes.add(p)
                 else:
-                    # Aresta de árvore
-                    filhos_dfs += 1
-                    pilha_arestas.append(tuple(sorted((u, v))))
-                    _dfs_biconectividade(v, u)
-
-                    # Após a recursão, atualiza o low-point de u
-                    low[u] = min(low[u], low[v])
-
-                    # Verifica a condição de articulação
-                    if (p is not None and low[v] >= d[u]) or (p is None and filhos_dfs > 1):
-                        articulacoes.add(u)
-                        
-                        # Extrai um bloco da pilha de arestas
-                        bloco_atual = set()
-                        aresta_topo = None
-                        while aresta_topo != tuple(sorted((u,v))):
-                            aresta_topo = pilha_arestas.pop()
-                            bloco_atual.add(aresta_topo[0])
-                            bloco_atual.add(aresta_topo[1])
-                        blocos.append(bloco_atual)
-
-        for vertice in self.vertices_ordenados:
-            if vertice not in visitados:
-                _dfs_biconectividade(vertice, None)
-                
-                # Se a pilha não estiver vazia ao final da DFS de uma componente,
-                # as arestas restantes formam um bloco.
-                if pilha_arestas:
-                    bloco_restante = set()
-                    while pilha_arestas:
-                        aresta = pilha_arestas.pop()
-                        bloco_restante.add(aresta[0])
-                        bloco_restante.add(aresta[1])
-                    if bloco_restante:
-                         blocos.append(bloco_restante)
-        
+                    filhos_raiz[p] = filhos_raiz.get(p, 0) + 1
+                bloco = len(blocos)
+                blocos.append({p})
+                inicio_bloco.append(v)
+            else:
+                bloco = bloco_da_aresta_pai[p]
+
+            bloco_da_aresta_pai[v] = bloco
+            blocos[bloco].add(v)
+
+        # A raiz da DFS só é articulação se tiver mais de um filho
+        articulacoes.update(raiz for raiz, filhos in filhos_raiz.items() if filhos > 1)
+
+        # Blocos listados na ordem em que se completam na DFS
+        ordem_blocos = sorted(range(len(blocos)), key=lambda b: saida[inicio_bloco[b]])
+
         return {
-            'articulacoes': articulacoes,
-            'blocos': blocos
+            'articulacoes': {rotulos[i] for i in articulacoes},
+            'blocos': [{rotulos[i] for i in blocos[b]} for b in ordem_blocos]
         }
     
+    def decomposicao_biconexa(self):
+        """
+        Calcula, em uma única DFS iterativa O(V + E), as articulações, as pontes,
+        os blocos (como listas de IDs de arestas) e a árvore de blocos e articulações.
+        
+        A DFS mantém uma pilha de IDs inteiros de arestas (sem tuplas por aresta) e
+        ignora a aresta de volta ao pai pelo ID, então arestas paralelas nunca são
+        pontes. Laços ficam fora dos blocos (ver biconexidade.py). Os IDs são os
+        IDs estáveis das arestas (ver incluir_aresta e aresta_por_id).
+        
+        O resultado fica em cache até a próxima modificação; cada chamada devolve
+        cópias do conjunto, da lista e dos vetores (a CSR da árvore, somente
+        leitura, é compartilhada).
+        
+        Returns:
+            dict: Dicionário contendo:
+                - 'articulacoes': Conjunto com os pontos de articulação
+                - 'pontes': array com os IDs das pontes
+                - 'blocos': Sequência compacta de blocos (BlocosArestas); cada bloco
+                            é um array com os IDs das suas arestas, na ordem em que
+                            os blocos se completam na DFS
+                - 'arvore_blocos': Dicionário com a árvore de blocos e articulações:
+                    - 'csr': CSR da árvore (nós 0..num_blocos - 1 são os blocos;
+                             o nó num_blocos + k é a articulação 'articulacoes'[k])
+                    - 'num_blocos': Quantidade de blocos
+                    - 'articulacoes': Lista com o vértice de cada nó de articulação
+        """
+        resultado = self.cache.obter('decomposicao_biconexa',
+                                     self._construir_decomposicao_biconexa)
+        blocos = resultado['blocos']
+        arvore = resultado['arvore_blocos']
+        return {
+            'articulacoes': set(resultado['articulacoes']),
+            'pontes': resultado['pontes'][:],
+            'blocos': BlocosArestas(blocos.inicio[:], blocos.arestas[:]),
+            'arvore_blocos': {
+                'csr': arvore['csr'],
+                'num_blocos': arvore['num_blocos'],
+                'articulacoes': list(arvore['articulacoes'])
+            }
+        }
+
+    def _construir_decomposicao_biconexa(self):
+        resultado = decomposicao_biconexa_csr(self.obter_csr())
+        blocos = resultado['blocos']
+        articulacao = resultado['articulacao']
+        arvore, nos_articulacao = arvore_blocos_csr(
+            blocos, articulacao, *self.vetores_extremidades()
+        )
+
+        pontes = resultado['pontes']
+        ids_estaveis = self._ids_estaveis_arestas()
+        if ids_estaveis is not None:
+            tipo = tipo_indice(len(ids_estaveis))
+            pontes = array(tipo, (ids_estaveis[e] for e in pontes))
+            blocos = BlocosArestas(blocos.inicio,
+                                   array(tipo, (ids_estaveis[e] for e in blocos.arestas)))
+
+        rotulos = self.vertices_ordenados
+        return {
+            'articulacoes': {rotulos[v] for v in nos_articulacao},
+            'pontes': pontes,
+            'blocos': blocos,
+            'arvore_blocos': {
+                'csr': arvore,
+                'num_blocos': len(blocos),
+                'articulacoes': [rotulos[v] for v in nos_articulacao]
+            }
+        }
+
     # =========================================================================
     # VERIFICAÇÃO DE GRAFO BIPARTIDO
     # =========================================================================
     
-    def eh_bipartido(self):
+    def eh_bipartido(self, apenas_verificar=False):
         """
         Determina se o grafo é bipartido usando uma coloração com 2 cores.
         
@@ -633,13 +1462,28 @@ class Grafo:
         de tal forma que vértices adjacentes tenham cores diferentes.
         Isso é equivalente a verificar se o grafo não contém ciclos ímpares.
         
+        A coloração é uma BFS em O(V + E) que guarda o pai de cada vértice: no
+        primeiro conflito, o ciclo ímpar é reconstruído pelo ancestral comum das
+        duas extremidades em O(comprimento do ciclo) (ver bipartido.py).
+        
+        Args:
+            apenas_verificar (bool): Se True, retorna apenas o booleano, sem guardar
+                                     a árvore da BFS nem montar partições, coloração
+                                     ou ciclo (para grafos muito grandes)
+        
         Returns:
-            dict: Dicionário contendo:
+            bool: Se apenas_verificar for True, indica se o grafo é bipartido
+            dict: Caso contrário, dicionário contendo:
                 - 'eh_bipartido': Boolean indicando se o grafo é bipartido
                 - 'particoes': Se bipartido, tupla com as duas partições (conjuntos de vértices)
                 - 'coloracao': Dicionário com a coloração de cada vértice (0 ou 1)
-                - 'ciclo_impar': Se não for bipartido, um ciclo ímpar encontrado
+                - 'ciclo_impar': Se não for bipartido, lista com os vértices de um ciclo
+                                 ímpar (cada um adjacente ao seguinte, e o último ao primeiro)
         """
+        if apenas_verificar:
+            _, _, conflito = coloracao_bipartida_csr(self.obter_csr(), registrar_pais=False)
+            return conflito is None
+
         if not self.vertices_ordenados:
             return {
                 'eh_bipartido': True,
@@ -648,78 +1492,27 @@ class Grafo:
                 'ciclo_impar': None
             }
         
-        lista_adj = self.criar_lista_adjacencia()
-        cores = {}  # -1: não visitado, 0: cor 0, 1: cor 1
-        
-        # Inicializa todas as cores como não visitadas
-        for v in self.vertices_ordenados:
-            cores[v] = -1
-        
-        def _bfs_bipartido(vertice_inicial):
-            """
-            Realiza BFS tentando colorir o grafo com duas cores.
-            Retorna True se conseguir, False caso contrário.
-            """
-            from collections import deque
-            
-            fila = deque([vertice_inicial])
-            cores[vertice_inicial] = 0
-            
-            while fila:
-                u = fila.popleft()
-                
-                for v in lista_adj[u]:
-                    if cores[v] == -1:
-                        # Vértice não visitado, atribui cor oposta
-                        cores[v] = 1 - cores[u]
-                        fila.append(v)
-                    elif cores[v] == cores[u]:
-                        # Conflito de cores - encontrou ciclo ímpar
-                        return False, self._encontrar_ciclo_impar(u, v, lista_adj)
-            
-            return True, None
-        
-        # Processa cada componente conexa separadamente
-        ciclo_impar_encontrado = None
-        
-        for vertice in self.vertices_ordenados:
-            if cores[vertice] == -1:
-                eh_bipartido_componente, ciclo = _bfs_bipartido(vertice)
-                if not eh_bipartido_componente:
-                    ciclo_impar_encontrado = ciclo
-                    break
-        
+        rotulos = self.vertices_ordenados
+        # -1: não visitado, 0: cor 0, 1: cor 1 (indexado por mapa_vertices)
+        cores, pais, conflito = coloracao_bipartida_csr(self.obter_csr())
+        coloracao = {rotulos[i]: cor for i, cor in enumerate(cores)}
+
         # Se encontrou ciclo ímpar, o grafo não é bipartido
-        if ciclo_impar_encontrado:
+        if conflito is not None:
             return {
                 'eh_bipartido': False,
                 'particoes': None,
-                'coloracao': cores,
-                'ciclo_impar': ciclo_impar_encontrado
+                'coloracao': coloracao,
+                'ciclo_impar': [rotulos[i] for i in ciclo_impar_bfs(pais, *conflito)]
             }
         
         # Separa os vértices nas duas partições
-        particao_0 = {v for v, cor in cores.items() if cor == 0}
-        particao_1 = {v for v, cor in cores.items() if cor == 1}
+        particao_0 = {rotulos[i] for i, cor in enumerate(cores) if cor == 0}
+        particao_1 = {rotulos[i] for i, cor in enumerate(cores) if cor == 1}
         
         return {
             'eh_bipartido': True,
             'particoes': (particao_0, particao_1),
-            'coloracao': cores,
+            'coloracao': coloracao,
             'ciclo_impar': None
         }
-    
-    def _encontrar_ciclo_impar(self, u, v, lista_adj):
-        """
-        Função auxiliar para encontrar um ciclo ímpar quando o grafo não é bipartido.
-        
-        Args:
-            u, v: Vértices que causaram o conflito de coloração
-            lista_adj: Lista de adjacência do grafo
-            
-        Returns:
-            list: Lista representando um ciclo ímpar
-        """
-        # Implementação simplificada - retorna os dois vértices conflitantes
-        # Uma implementação mais completa faria BFS/DFS para encontrar o ciclo exato
-        return [u, v]
@@ -0,0 +1,163 @@
+"""
+Matriz de incidência esparsa.
+
+Cada coluna da matriz de incidência (uma aresta/arco) tem no máximo duas
+entradas não nulas, então a forma densa V x E desperdiça quase todas as células.
+Aqui guardamos apenas os não nulos, em dois índices complementares:
+- por coluna (CSC): inicio_colunas / linhas / valores, na forma de triplas COO
+  (linha, coluna, valor) ordenadas por coluna, para obter as extremidades de
+  uma aresta em O(1);
+- por linha (CSR): inicio_linhas / colunas_linha / valores_linha, para obter
+  as arestas incidentes a um vértice em O(grau).
+
+Os valores seguem a matriz densa: 1 nos grafos; +1 (origem) e -1 (destino) nos
+dígrafos. A matriz densa só é montada quando pedida (ver para_densa).
+"""
+
+from array import array
+
+from csr import tipo_indice, vetor_preenchido
+
+
+class MatrizIncidenciaEsparsa:
+    """
+    Matriz de incidência num_vertices x num_arestas com armazenamento esparso.
+    """
+
+    def __init__(self, num_linhas, num_colunas, inicio_colunas, linhas, valores):
+        """
+        Inicializa a matriz a partir do índice por coluna (CSC) e monta o índice por linha.
+
+        Args:
+            num_linhas (int): Quantidade de vértices
+            num_colunas (int): Quantidade de arestas/arcos
+            inicio_colunas: Vetor com num_colunas + 1 posições; as entradas da
+                            coluna j ficam em [inicio_colunas[j], inicio_colunas[j + 1])
+            linhas: Vetor com a linha (vértice) de cada entrada não nula
+            valores: Vetor com o valor (1 ou -1) de cada entrada não nula
+        """
+        self.num_linhas = num_linhas
+        self.num_colunas = num_colunas
+        self.inicio_colunas = inicio_colunas
+        self.linhas = linhas
+        self.valores = valores
+        self._montar_indice_linhas()
+
+    @classmethod
+    def de_extremidades(cls, num_vertices, origens, destinos, orientada):
+        """
+        Monta a matriz em O(V + E) a partir dos vetores de extremidades das arestas.
+
+        Args:
+            num_vertices (int): Quantidade de vértices (linhas)
+            origens (sequence): Índice da primeira extremidade de cada aresta
+                                (valores negativos indicam vértice inexistente)
+            destinos (sequence): Índice da segunda extremidade de cada aresta
+            orientada (bool): Se True (dígrafo), a origem recebe +1 e o destino -1;
+                              se False (grafo), ambas as extremidades recebem 1
+
+        Returns:
+            MatrizIncidenciaEsparsa: Matriz construída
+        """
+        num_arestas = len(origens)
+        inicio_colunas = array(tipo_indice(2 * num_arestas), [0])
+        linhas = array(tipo_indice(num_vertices))
+        valores = array('b')
+        valor_destino = -1 if orientada else 1
+
+        for u, v in zip(origens, destinos):
+            if u >= 0:
+                linhas.append(u)
+                valores.append(1)
+            if v >= 0:
+                if v == u:
+                    # Laço: uma única célula; no dígrafo o -1 do destino prevalece
+                    valores[-1] = valor_destino
+                else:
+                    linhas.append(v)
+                    valores.append(valor_destino)
+            inicio_colunas.append(len(linhas))
+
+        return cls(num_vertices, num_arestas, inicio_colunas, linhas, valores)
+
+    def _montar_indice_linhas(self):
+        # Ordenação por contagem das entradas por linha, estável na ordem das colunas
+        inicio_linhas = vetor_preenchido(self.inicio_colunas.typecode, 0, self.num_linhas + 1)
+        for linha in self.linhas:
+            inicio_linhas[linha + 1] += 1
+        for i in range(self.num_linhas):
+            inicio_linhas[i + 1] += inicio_linhas[i]
+
+        total = len(self.linhas)
+        colunas_linha = vetor_preenchido(tipo_indice(self.num_colunas), 0, total)
+        valores_linha = vetor_preenchido('b', 0, total)
+        proxima = inicio_linhas[:self.num_linhas]
+        for coluna in range(self.num_colunas):
+            for k in range(self.inicio_colunas[coluna], self.inicio_colunas[coluna + 1]):
+                linha = self.linhas[k]
+                posicao = proxima[linha]
+                colunas_linha[posicao] = coluna
+                valores_linha[posicao] = self.valores[k]
+                proxima[linha] = posicao + 1
+
+        self.inicio_linhas = inicio_linhas
+        self.colunas_linha = colunas_linha
+        self.valores_linha = valores_linha
+
+    def num_nao_nulos(self):
+        """
+        Retorna a quantidade de entradas não nulas armazenadas.
+        """
+        return len(self.linhas)
+
+    def coluna(self, coluna):
+        """
+        Retorna as entradas não nulas de uma coluna (as extremidades de uma aresta).
+
+        Returns:
+            list: Pares (linha, valor), no máximo dois
+        """
+        inicio, fim = self.inicio_colunas[coluna], self.inicio_colunas[coluna + 1]
+        return list(zip(self.linhas[inicio:fim], self.valores[inicio:fim]))
+
+    def linha(self, linha):
+        """
+        Retorna as entradas não nulas de uma linha (as arestas incidentes a um vértice).
+
+        Returns:
+            list: Pares (coluna, valor) em ordem crescente de coluna
+        """
+        inicio, fim = self.inicio_linhas[linha], self.inicio_linhas[linha + 1]
+        return list(zip(self.colunas_linha[inicio:fim], self.valores_linha[inicio:fim]))
+
+    def obter(self, linha, coluna):
+        """
+        Retorna o valor da célula (linha, coluna), 0 se não houver incidência.
+        """
+        if not (0 <= linha < self.num_linhas and 0 <= coluna < self.num_colunas):
+            raise IndexError(f"Célula ({linha}, {coluna}) fora da matriz.")
+        for k in range(self.inicio_colunas[coluna], self.inicio_colunas[coluna + 1]):
+            if self.linhas[k] == linha:
+                return self.valores[k]
+        return 0
+
+    def __getitem__(self, chave):
+        return self.obter(*chave)
+
+    def triplas(self):
+        """
+        Itera sobre as entradas não nulas no formato COO (linha, coluna, valor),
+        em ordem de coluna.
+        """
+        for coluna in range(self.num_colunas):
+            for k in range(self.inicio_colunas[coluna], self.inicio_colunas[coluna + 1]):
+                yield self.linhas[k], coluna, self.valores[k]
+
+    def para_densa(self):
+        """
+        Converte para a matriz de incidência densa (lista de listas).
+        """
+        matriz_inc = [[0] * self.num_colunas for _ in range(self.num_linhas)]
+        for linha, coluna, valor in self.triplas():
+            matriz_inc[linha][coluna] = valor
+        return matriz_inc
@@ -191,6 +191,10 @@ def executar_analise_completa_grafo(grafo):
     for i, linha in enumerate(matriz_convertida):
         print(f" {vertices[i]:>2} | " + "  ".join(f"{val:>2}" for val in linha))
     
+    estatisticas_cache = grafo.cache.estatisticas()
+    print(f"\n♻️  Cache de representações: {estatisticas_cache['acertos']} acertos, "
+          f"{estatisticas_cache['falhas']} construções")
+    
     print("\n✅ Análise do grafo concluída!")
 
 def executar_analise_completa_digrafo(digrafo):
@@ -296,6 +300,10 @@ def executar_analise_completa_digrafo(digrafo):
     densidade = (digrafo.num_arcos / max_arcos * 100) if max_arcos > 0 else 0
     print(f"📊 Densidade do dígrafo: {densidade:.2f}%")
     
+    estatisticas_cache = digrafo.cache.estatisticas()
+    print(f"♻️  Cache de representações: {estatisticas_cache['acertos']} acertos, "
+          f"{estatisticas_cache['falhas']} construções")
+    
     print("\n✅ Análise do dígrafo concluída!")
 
 def main():
@@ -0,0 +1,195 @@
+"""
+Matriz de adjacência compactada em bits.
+
+Cada célula ocupa 1 bit de um único `bytearray` (as linhas ficam contíguas, com
+ceil(colunas / 8) bytes cada). Uma matriz 50.000 x 50.000 ocupa ~312 MB, contra
+dezenas de GB de uma lista de listas de inteiros Python.
+
+As operações de vizinhança (união/interseção de linhas) convertem cada linha em
+um único inteiro Python de precisão arbitrária e combinam as linhas com OR/AND
+bit a bit sobre esses inteiros, sem laço Python por coluna.
+"""
+
+
+def indices_de_bits(bits):
+    """
+    Retorna, em ordem crescente, as posições dos bits ligados de um inteiro.
+
+    Args:
+        bits (int): Inteiro usado como conjunto de bits
+
+    Returns:
+        list: Lista com os índices dos bits iguais a 1
+    """
+    indices = []
+    while bits:
+        menor = bits & -bits
+        indices.append(menor.bit_length() - 1)
+        bits ^= menor
+    return indices
+
+
+class LinhaBits:
+    """
+    Visão (sem cópia) de uma linha de MatrizBits, indexável e iterável como uma lista de 0/1.
+    """
+    __slots__ = ('_matriz', '_linha')
+
+    def __init__(self, matriz, linha):
+        self._matriz = matriz
+        self._linha = linha
+
+    def __len__(self):
+        return self._matriz.num_colunas
+
+    def __getitem__(self, coluna):
+        return self._matriz.obter(self._linha, coluna)
+
+    def __iter__(self):
+        matriz = self._matriz
+        inicio = self._linha * matriz.bytes_por_linha
+        dados = matriz.dados
+        for coluna in range(matriz.num_colunas):
+            yield (dados[inicio + (coluna >> 3)] >> (coluna & 7)) & 1
+
+    def __eq__(self, outra):
+        return list(self) == list(outra)
+
+    def __repr__(self):
+        return repr(list(self))
+
+
+class MatrizBits:
+    """
+    Matriz binária armazenada bit a bit, com acesso O(1) a cada célula.
+
+    Aceita as mesmas formas de acesso de uma lista de listas:
+    `matriz[i][j]`, `len(matriz)` e iteração linha a linha.
+    """
+
+    def __init__(self, num_linhas, num_colunas=None):
+        """
+        Cria uma matriz zerada.
+
+        Args:
+            num_linhas (int): Quantidade de linhas
+            num_colunas (int, optional): Quantidade de colunas. Default: quadrada
+        """
+        self.num_linhas = num_linhas
+        self.num_colunas = num_linhas if num_colunas is None else num_colunas
+        self.bytes_por_linha = (self.num_colunas + 7) // 8
+        self.dados = bytearray(self.num_linhas * self.bytes_por_linha)
+
+    @classmethod
+    def de_csr(cls, csr):
+        """
+        Monta a matriz de adjacência a partir de uma representação CSR.
+
+        Args:
+            csr (CSR): Estrutura de adjacência (simétrica para grafos)
+
+        Returns:
+            MatrizBits: Matriz num_vertices x num_vertices
+        """
+        matriz = cls(csr.num_vertices)
+        offsets = csr.offsets
+        vizinhos = csr.vizinhos
+        dados = matriz.dados
+        bytes_por_linha = matriz.bytes_por_linha
+        for i in range(csr.num_vertices):
+            base = i * bytes_por_linha
+            for j in vizinhos[offsets[i]:offsets[i + 1]]:
+                dados[base + (j >> 3)] |= 1 << (j & 7)
+        return matriz
+
+    def _validar(self, linha, coluna):
+        if not (0 <= linha < self.num_linhas and 0 <= coluna < self.num_colunas):
+            raise IndexError(f"Célula ({linha}, {coluna}) fora da matriz.")
+
+    def obter(self, linha, coluna):
+        """
+        Retorna o valor (0 ou 1) da célula (linha, coluna).
+        """
+        self._validar(linha, coluna)
+        return (self.dados[linha * self.bytes_por_linha + (coluna >> 3)] >> (coluna & 7)) & 1
+
+    def definir(self, linha, coluna, valor=1):
+        """
+        Liga (valor verdadeiro) ou desliga (valor falso) a célula (linha, coluna).
+        """
+        self._validar(linha, coluna)
+        posicao = linha * self.bytes_por_linha + (coluna >> 3)
+        mascara = 1 << (coluna & 7)
+        if valor:
+            self.dados[posicao] |= mascara
+        else:
+            self.dados[posicao] &= ~mascara & 0xFF
+
+    def __len__(self):
+        return self.num_linhas
+
+    def __getitem__(self, chave):
+        if isinstance(chave, tuple):
+            return self.obter(*chave)
+        if not 0 <= chave < self.num_linhas:
+            raise IndexError(f"Linha {chave} fora da matriz.")
+        return LinhaBits(self, chave)
+
+    def __setitem__(self, chave, valor):
+        linha, coluna = chave
+        self.definir(linha, coluna, valor)
+
+    def __iter__(self):
+        for linha in range(self.num_linhas):
+            yield LinhaBits(self, linha)
+
+    def __eq__(self, outra):
+        if isinstance(outra, MatrizBits):
+            return (self.num_linhas, self.num_colunas, self.dados) == \
+                   (outra.num_linhas, outra.num_colunas, outra.dados)
+        return self.para_lista() == [list(linha) for linha in outra]
+
+    def linha_como_inteiro(self, linha):
+        """
+        Retorna a linha como um inteiro Python cujo bit j é a coluna j.
+        """
+        inicio = linha * self.bytes_por_linha
+        return int.from_bytes(self.dados[inicio:inicio + self.bytes_por_linha], 'little')
+
+    def indices_linha(self, linha):
+        """
+        Retorna as colunas com valor 1 na linha (ex: os vizinhos de um vértice).
+        """
+        return indices_de_bits(self.linha_como_inteiro(linha))
+
+    def ou_linhas(self, *linhas):
+        """
+        Retorna o OR bit a bit das linhas informadas (união de vizinhanças), como inteiro.
+        """
+        resultado = 0
+        for linha in linhas:
+            resultado |= self.linha_como_inteiro(linha)
+        return resultado
+
+    def e_linhas(self, *linhas):
+        """
+        Retorna o AND bit a bit das linhas informadas (interseção de vizinhanças), como inteiro.
+        """
+        resultado = (1 << self.num_colunas) - 1
+        for linha in linhas:
+            resultado &= self.linha_como_inteiro(linha)
+        return resultado
+
+    def copia(self):
+        """
+        Retorna uma cópia independente da matriz (uma cópia do `bytearray`).
+        """
+        matriz = MatrizBits(self.num_linhas, self.num_colunas)
+        matriz.dados[:] = self.dados
+        return matriz
+
+    def para_lista(self):
+        """
+        Converte para a matriz tradicional (lista de listas de 0/1).
+        """
+        return [list(linha) for linha in self]
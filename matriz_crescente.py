@@ -0,0 +1,219 @@
+"""
+Matriz de adjacência com capacidade de sobra, alterada no lugar.
+
+Cada vértice ocupa um "slot" (linha e coluna) de uma matriz capacidade x capacidade,
+com uma linha `bytearray` por slot (1 byte por célula). Assim:
+- incluir um vértice usa o próximo slot livre, já alocado e zerado, e só liga as
+  células das suas arestas: O(grau). Quando os slots acabam, a capacidade dobra
+  (cada linha é estendida uma vez), o que custa O(V) amortizado por inclusão;
+- excluir um vértice limpa a sua coluna nas linhas dos vizinhos (encontrados com
+  `bytearray.find`, sem laço Python por célula) e marca o slot como lápide: O(V).
+  Quando as lápides passam de metade dos slots usados, a matriz é compactada em
+  O(V²), ou seja, O(V) amortizado por exclusão. Se, depois disso, os vértices
+  ocuparem menos de 1/4 da capacidade, ela cai pela metade (quantas vezes
+  precisar, sem ficar abaixo de CAPACIDADE_MINIMA), devolvendo a memória.
+
+Os slots seguem a ordem de inclusão, não a ordem dos rótulos; `para_lista` monta
+a matriz tradicional na ordem de `vertices_ordenados`.
+"""
+
+CAPACIDADE_MINIMA = 8
+
+# Marca dos slots de vértices excluídos, até a próxima compactação
+_LAPIDE = object()
+
+
+class MatrizAdjacenciaCrescente:
+    """
+    Matriz de adjacência (grafo não direcionado) que cresce por duplicação da
+    capacidade e exclui vértices com lápides e compactação periódica.
+    """
+
+    def __init__(self, capacidade=CAPACIDADE_MINIMA):
+        """
+        Cria uma matriz sem vértices.
+
+        Args:
+            capacidade (int): Quantidade de slots pré-alocados
+        """
+        self.capacidade = max(capacidade, CAPACIDADE_MINIMA)
+        self.linhas = [bytearray(self.capacidade) for _ in range(self.capacidade)]
+        self.rotulos = []
+        self.slot_de = {}
+        self.num_lapides = 0
+
+    @classmethod
+    def de_csr(cls, csr, vertices_ordenados):
+        """
+        Monta a matriz a partir de uma representação CSR, com o slot i para o
+        vértice vertices_ordenados[i] e a capacidade na menor potência de 2 que
+        comporta todos os vértices (as inclusões seguintes a dobram se preciso).
+
+        Args:
+            csr (CSR): Estrutura de adjacência simétrica
+            vertices_ordenados (list): Rótulo de cada índice da CSR
+
+        Returns:
+            MatrizAdjacenciaCrescente: Matriz com os vértices e arestas do grafo
+        """
+        capacidade = CAPACIDADE_MINIMA
+        while capacidade < csr.num_vertices:
+            capacidade *= 2
+        matriz = cls(capacidade)
+        matriz.rotulos = list(vertices_ordenados)
+        matriz.slot_de = {v: i for i, v in enumerate(matriz.rotulos)}
+        offsets = csr.offsets
+        vizinhos = csr.vizinhos
+        for i in range(csr.num_vertices):
+            linha = matriz.linhas[i]
+            for j in vizinhos[offsets[i]:offsets[i + 1]]:
+                linha[j] = 1
+        return matriz
+
+    @property
+    def num_vertices(self):
+        return len(self.slot_de)
+
+    def __contains__(self, vertice):
+        return vertice in self.slot_de
+
+    def _slot(self, vertice):
+        slot = self.slot_de.get(vertice)
+        if slot is None:
+            raise ValueError(f"O vértice '{vertice}' não existe na matriz.")
+        return slot
+
+    def _slots_ligados(self, slot):
+        """
+        Gera os slots com valor 1 na linha (vizinhos do vértice do slot).
+        """
+        linha = self.linhas[slot]
+        fim = len(self.rotulos)
+        j = linha.find(1, 0, fim)
+        while j >= 0:
+            yield j
+            j = linha.find(1, j + 1, fim)
+
+    # =========================================================================
+    # INCLUSÃO, EXCLUSÃO E COMPACTAÇÃO
+    # =========================================================================
+
+    def _crescer(self):
+        """
+        Dobra a capacidade: estende cada linha e pré-aloca as novas linhas zeradas.
+        """
+        nova_capacidade = 2 * self.capacidade
+        extensao = bytes(nova_capacidade - self.capacidade)
+        for linha in self.linhas:
+            linha.extend(extensao)
+        self.linhas.extend(bytearray(nova_capacidade)
+                           for _ in range(nova_capacidade - self.capacidade))
+        self.capacidade = nova_capacidade
+
+    def incluir_vertice(self, novo_vertice, vizinhos=()):
+        """
+        Inclui um vértice no próximo slot livre, ligado aos vizinhos informados.
+        Custa O(grau), mais O(V) amortizado quando a capacidade precisa dobrar.
+
+        Args:
+            novo_vertice: Rótulo do vértice
+            vizinhos (iterable): Vértices existentes (ou o próprio novo vértice, para um laço)
+
+        Raises:
+            ValueError: Se o vértice já existir ou algum vizinho não existir
+        """
+        if novo_vertice in self.slot_de:
+            raise ValueError(f"O vértice '{novo_vertice}' já existe na matriz.")
+        slots_vizinhos = [None if v == novo_vertice else self._slot(v) for v in vizinhos]
+
+        if len(self.rotulos) == self.capacidade:
+            self._crescer()
+        slot = len(self.rotulos)
+        self.rotulos.append(novo_vertice)
+        self.slot_de[novo_vertice] = slot
+        linha = self.linhas[slot]
+        for outro in slots_vizinhos:
+            if outro is None:
+                linha[slot] = 1
+            else:
+                linha[outro] = 1
+                self.linhas[outro][slot] = 1
+
+    def excluir_vertice(self, vertice):
+        """
+        Exclui um vértice, deixando uma lápide no seu slot. Custa O(V), e a
+        compactação periódica mantém o custo amortizado em O(V).
+
+        Raises:
+            ValueError: Se o vértice não existir
+        """
+        slot = self._slot(vertice)
+        linhas = self.linhas
+        for outro in self._slots_ligados(slot):
+            linhas[outro][slot] = 0
+        linhas[slot][:len(self.rotulos)] = bytes(len(self.rotulos))
+        del self.slot_de[vertice]
+        self.rotulos[slot] = _LAPIDE
+        self.num_lapides += 1
+        if 2 * self.num_lapides > len(self.rotulos):
+            self.compactar()
+
+    def compactar(self):
+        """
+        Remove as lápides, movendo os vértices restantes para os primeiros slots
+        (na ordem em que estavam), e reduz a capacidade à metade enquanto os
+        vértices ocuparem menos de 1/4 dela. Custa O(V²).
+        """
+        vivos = [s for s, rotulo in enumerate(self.rotulos) if rotulo is not _LAPIDE]
+        capacidade = self.capacidade
+        while capacidade > CAPACIDADE_MINIMA and 4 * len(vivos) < capacidade:
+            capacidade //= 2
+        complemento = bytes(capacidade - len(vivos))
+        novas_linhas = []
+        for s in vivos:
+            linha = bytearray(map(self.linhas[s].__getitem__, vivos))
+            linha.extend(complemento)
+            novas_linhas.append(linha)
+        novas_linhas.extend(bytearray(capacidade)
+                            for _ in range(capacidade - len(vivos)))
+        self.capacidade = capacidade
+        self.linhas = novas_linhas
+        self.rotulos = [self.rotulos[s] for s in vivos]
+        self.slot_de = {v: i for i, v in enumerate(self.rotulos)}
+        self.num_lapides = 0
+
+    # =========================================================================
+    # CONSULTAS
+    # =========================================================================
+
+    def existe_aresta(self, v1, v2):
+        """
+        Verifica em O(1) se existe aresta entre dois vértices.
+
+        Raises:
+            ValueError: Se algum dos vértices não existir
+        """
+        return self.linhas[self._slot(v1)][self._slot(v2)] == 1
+
+    def vizinhos(self, vertice):
+        """
+        Retorna os vizinhos do vértice, na ordem dos slots.
+
+        Raises:
+            ValueError: Se o vértice não existir
+        """
+        return [self.rotulos[j] for j in self._slots_ligados(self._slot(vertice))]
+
+    def vertices_ordenados(self):
+        """
+        Retorna os vértices em ordem crescente.
+        """
+        return sorted(self.slot_de)
+
+    def para_lista(self):
+        """
+        Converte para a matriz tradicional (lista de listas de 0/1), com linhas e
+        colunas na ordem de vertices_ordenados.
+        """
+        slots = [self.slot_de[v] for v in self.vertices_ordenados()]
+        return [list(map(self.linhas[s].__getitem__, slots)) for s in slots]
@@ -0,0 +1,108 @@
+"""
+Backend opcional em NumPy para as matrizes de adjacência.
+
+Quando o NumPy está instalado, as matrizes podem ser geradas como `ndarray`
+(uint8, valores 0/1) e as conversões lista <-> matriz são vetorizadas:
+- lista -> matriz: os índices (linha, coluna) são reunidos em dois vetores e
+  gravados de uma vez (scatter);
+- matriz -> lista: `nonzero` extrai as coordenadas das células iguais a 1, que
+  já saem agrupadas por linha e em ordem crescente de coluna.
+
+Sem o NumPy, o restante do projeto segue usando as listas de listas em Python
+puro; apenas o formato 'numpy' fica indisponível.
+"""
+
+try:
+    import numpy as np
+except ImportError:  # NumPy é opcional
+    np = None
+
+NUMPY_DISPONIVEL = np is not None
+
+
+def exigir_numpy():
+    """
+    Garante que o NumPy está disponível.
+
+    Raises:
+        ImportError: Se o NumPy não estiver instalado
+    """
+    if np is None:
+        raise ImportError("O formato 'numpy' requer o pacote NumPy (pip install numpy).")
+
+
+def matriz_adjacencia_de_csr(csr):
+    """
+    Monta a matriz de adjacência como ndarray a partir de uma representação CSR.
+
+    Args:
+        csr (CSR): Estrutura de adjacência (simétrica para grafos)
+
+    Returns:
+        numpy.ndarray: Matriz num_vertices x num_vertices de uint8
+    """
+    exigir_numpy()
+    n = csr.num_vertices
+    matriz = np.zeros((n, n), dtype=np.uint8)
+    # Linha de cada entrada de `vizinhos`: o índice i repetido grau(i) vezes
+    linhas = np.repeat(np.arange(n), np.diff(np.asarray(csr.offsets, dtype=np.intp)))
+    matriz[linhas, np.asarray(csr.vizinhos, dtype=np.intp)] = 1
+    return matriz
+
+
+def matriz_de_lista(lista_adj, vertices_ordenados):
+    """
+    Converte uma lista de adjacência em matriz ndarray com uma única gravação vetorizada.
+    Vértices e vizinhos fora de `vertices_ordenados` são ignorados.
+
+    Args:
+        lista_adj (dict): Lista de adjacência (vértice -> lista de vizinhos)
+        vertices_ordenados (list): Ordem dos vértices nas linhas/colunas
+
+    Returns:
+        numpy.ndarray: Matriz de uint8
+    """
+    exigir_numpy()
+    n = len(vertices_ordenados)
+    mapa_vertices = {vertice: i for i, vertice in enumerate(vertices_ordenados)}
+    linhas = []
+    colunas = []
+    for vertice, vizinhos in lista_adj.items():
+        idx_origem = mapa_vertices.get(vertice)
+        if idx_origem is None:
+            continue
+        for vizinho in vizinhos:
+            idx_destino = mapa_vertices.get(vizinho)
+            if idx_destino is not None:
+                linhas.append(idx_origem)
+                colunas.append(idx_destino)
+
+    matriz = np.zeros((n, n), dtype=np.uint8)
+    matriz[np.array(linhas, dtype=np.intp), np.array(colunas, dtype=np.intp)] = 1
+    return matriz
+
+
+def lista_de_matriz(matriz_adj, vertices_ordenados):
+    """
+    Converte uma matriz ndarray em lista de adjacência usando `nonzero`.
+
+    Args:
+        matriz_adj (numpy.ndarray): Matriz de adjacência (uint8 ou bool)
+        vertices_ordenados (list): Rótulo de cada linha/coluna
+
+    Returns:
+        dict: Dicionário rótulo -> lista de rótulos vizinhos (em ordem de coluna)
+    """
+    exigir_numpy()
+    n = len(vertices_ordenados)
+    linhas, colunas = np.nonzero(np.asarray(matriz_adj) == 1)
+    rotulos = np.empty(n, dtype=object)
+    for i, vertice in enumerate(vertices_ordenados):
+        rotulos[i] = vertice  # atribuição elemento a elemento preserva rótulos-tupla
+    # `nonzero` percorre em ordem de linha: basta cortar o vetor de colunas por linha
+    cortes = np.cumsum(np.bincount(linhas, minlength=n))[:-1]
+    vizinhos_por_linha = np.split(rotulos[colunas], cortes)
+    return {
+        vertice: vizinhos.tolist()
+        for vertice, vizinhos in zip(vertices_ordenados, vizinhos_por_linha)
+    }
@@ -0,0 +1,224 @@
+"""
+Ordenação topológica de dígrafos sobre a CSR, com detecção de ciclo.
+
+Duas variantes, ambas em O(V + A) e com o estado em vetores `array`:
+- Kahn: consome um vetor com os graus de entrada restantes; a fila é o próprio
+  vetor da ordem (percorrido por um cursor, como na BFS). Também gera a ordem
+  sob demanda e em camadas (nível = maior caminho desde uma fonte). Se a fila
+  esvaziar antes de todos os vértices saírem, os que sobraram contêm um ciclo,
+  encontrado andando pelos predecessores ainda não removidos;
+- DFS: busca iterativa com três estados por vértice; para no primeiro arco que
+  volta a um vértice ainda na pilha e devolve o ciclo formado pelo trecho da pilha.
+
+Ciclos são listas de índices [v0, v1, ..., vk] com arcos vi -> vi+1 e vk -> v0.
+"""
+
+from array import array
+
+from csr import tipo_indice, tipo_vetor
+
+NAO_VISITADO = 0
+NA_PILHA = 1
+FINALIZADO = 2
+
+
+class CicloEncontrado(ValueError):
+    """
+    Erro da ordenação topológica sob demanda: o dígrafo tem um ciclo.
+    O atributo `ciclo` guarda os vértices do ciclo encontrado.
+    """
+
+    def __init__(self, mensagem, ciclo):
+        super().__init__(mensagem)
+        self.ciclo = ciclo
+
+
+def _ciclo_entre_restantes(csr_reversa, restantes, inicio):
+    """
+    Encontra um ciclo entre os vértices que o algoritmo de Kahn não removeu.
+
+    Todo vértice restante tem algum predecessor também restante; andando sempre
+    para um deles, algum vértice se repete e o trecho entre as repetições é o
+    ciclo (percorrido ao contrário).
+    """
+    offsets = csr_reversa.offsets
+    predecessores = csr_reversa.vizinhos
+    posicao_no_caminho = {}
+    caminho = []
+    v = inicio
+    while v not in posicao_no_caminho:
+        posicao_no_caminho[v] = len(caminho)
+        caminho.append(v)
+        for u in predecessores[offsets[v]:offsets[v + 1]]:
+            if restantes[u]:
+                v = u
+                break
+    ciclo = caminho[posicao_no_caminho[v]:]
+    ciclo.reverse()
+    return ciclo
+
+
+def _ciclo_apos_kahn(csr_reversa, graus_restantes):
+    # Os vértices não removidos são exatamente os de grau restante positivo
+    restantes = bytearray(1 if grau else 0 for grau in graus_restantes)
+    return _ciclo_entre_restantes(csr_reversa, restantes, restantes.index(1))
+
+
+def gerar_ordenacao_kahn_csr(csr, graus_entrada, csr_reversa):
+    """
+    Gera a ordem topológica de Kahn sob demanda, um vértice por vez.
+
+    Cada vértice é produzido assim que seu grau de entrada restante zera, então
+    um escalonador pode começar a consumir a ordem antes de ela estar completa.
+
+    Args:
+        csr (CSR): Sucessores de cada vértice
+        graus_entrada (array): Grau de entrada de cada vértice (não é modificado)
+        csr_reversa (CSR): Predecessores de cada vértice (usados só se houver ciclo)
+
+    Yields:
+        int: Índice do próximo vértice na ordem
+
+    Raises:
+        CicloEncontrado: Quando a ordem esgota sem incluir todos os vértices
+    """
+    n = csr.num_vertices
+    offsets = csr.offsets
+    vizinhos = csr.vizinhos
+    graus = array(tipo_vetor(graus_entrada), graus_entrada)
+
+    ordem = array(tipo_indice(n), (v for v in range(n) if not graus[v]))
+    cabeca = 0
+    while cabeca < len(ordem):
+        u = ordem[cabeca]
+        cabeca += 1
+        yield u
+        for v in vizinhos[offsets[u]:offsets[u + 1]]:
+            graus[v] -= 1
+            if not graus[v]:
+                ordem.append(v)
+
+    if len(ordem) < n:
+        raise CicloEncontrado("O dígrafo contém um ciclo.", _ciclo_apos_kahn(csr_reversa, graus))
+
+
+def ordenacao_kahn_csr(csr, graus_entrada, csr_reversa):
+    """
+    Calcula a ordem topológica pelo algoritmo de Kahn.
+
+    Args:
+        csr (CSR): Sucessores de cada vértice
+        graus_entrada (array): Grau de entrada de cada vértice (não é modificado)
+        csr_reversa (CSR): Predecessores de cada vértice (usados só se houver ciclo)
+
+    Returns:
+        tuple: (ordem, ciclo): array com a ordem (None se houver ciclo) e a lista
+               com um ciclo (None se o dígrafo for acíclico)
+    """
+    ordem = array(tipo_indice(csr.num_vertices))
+    try:
+        ordem.extend(gerar_ordenacao_kahn_csr(csr, graus_entrada, csr_reversa))
+    except CicloEncontrado as e:
+        return None, e.ciclo
+    return ordem, None
+
+
+def camadas_kahn_csr(csr, graus_entrada, csr_reversa):
+    """
+    Agrupa a ordem topológica em camadas: a camada 0 tem as fontes, e cada vértice
+    fica na camada seguinte à do seu predecessor mais tardio. Os vértices de uma
+    mesma camada não dependem uns dos outros e podem ser processados em paralelo.
+
+    Args:
+        csr (CSR): Sucessores de cada vértice
+        graus_entrada (array): Grau de entrada de cada vértice (não é modificado)
+        csr_reversa (CSR): Predecessores de cada vértice (usados só se houver ciclo)
+
+    Returns:
+        tuple: (camadas, ciclo): lista de arrays de índices (None se houver ciclo)
+               e a lista com um ciclo (None se o dígrafo for acíclico)
+    """
+    n = csr.num_vertices
+    tipo = tipo_indice(n)
+    offsets = csr.offsets
+    vizinhos = csr.vizinhos
+    graus = array(tipo_vetor(graus_entrada), graus_entrada)
+
+    camadas = []
+    camada = array(tipo, (v for v in range(n) if not graus[v]))
+    removidos = 0
+    while camada:
+        camadas.append(camada)
+        removidos += len(camada)
+        proxima = array(tipo)
+        for u in camada:
+            for v in vizinhos[offsets[u]:offsets[u + 1]]:
+                graus[v] -= 1
+                if not graus[v]:
+                    proxima.append(v)
+        camada = proxima
+
+    if removidos < n:
+        return None, _ciclo_apos_kahn(csr_reversa, graus)
+    return camadas, None
+
+
+def ordenacao_dfs_csr(csr):
+    """
+    Calcula a ordem topológica pela DFS (ordem reversa de finalização).
+
+    A busca é iterativa e para no primeiro arco de retorno: o ciclo é o trecho da
+    pilha entre o destino do arco e o vértice atual.
+
+    Args:
+        csr (CSR): Sucessores de cada vértice
+
+    Returns:
+        tuple: (ordem, ciclo): array com a ordem (None se houver ciclo) e a lista
+               com um ciclo (None se o dígrafo for acíclico)
+    """
+    n = csr.num_vertices
+    tipo = tipo_indice(n)
+    offsets = csr.offsets
+    vizinhos = csr.vizinhos
+
+    estado = bytearray(n)
+    proximo = array(tipo_vetor(offsets), offsets[:n])
+    pilha = array(tipo)
+    finalizados = array(tipo)
+
+    for raiz in range(n):
+        if estado[raiz]:
+            continue
+        estado[raiz] = NA_PILHA
+        pilha.append(raiz)
+
+        while pilha:
+            u = pilha[-1]
+            posicao = proximo[u]
+            fim = offsets[u + 1]
+            while posicao < fim:
+                v = vizinhos[posicao]
+                posicao += 1
+                if estado[v] == NAO_VISITADO:
+                    break
+                if estado[v] == NA_PILHA:
+                    # Arco de retorno u -> v: v ... u está na pilha
+                    inicio_ciclo = len(pilha) - 1
+                    while pilha[inicio_ciclo] != v:
+                        inicio_ciclo -= 1
+                    return None, list(pilha[inicio_ciclo:])
+            else:
+                v = -1
+            proximo[u] = posicao
+
+            if v >= 0:
+                estado[v] = NA_PILHA
+                pilha.append(v)
+            else:
+                pilha.pop()
+                estado[u] = FINALIZADO
+                finalizados.append(u)
+
+    finalizados.reverse()
+    return finalizados, None
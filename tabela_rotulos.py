@@ -0,0 +1,307 @@
+"""
+Tabela compacta de rótulos de vértices (interning): rótulo <-> ID inteiro denso.
+
+Os algoritmos trabalham só com IDs (posições da CSR); os rótulos só aparecem na
+entrada e na saída. Guardá-los como objetos Python, com um dicionário rótulo ->
+ID, custa caro quando são longos (URLs, hashes): cada `str` tem ~50 bytes de
+cabeçalho e cada entrada de dicionário outras dezenas. A tabela guarda:
+- rótulos inteiros em um `array('q')` (8 bytes cada);
+- rótulos de texto como UTF-8 concatenado + offsets (o tamanho do texto + 8 bytes);
+- qualquer outro tipo em uma lista comum (a tabela passa a esse modo se um
+  rótulo não couber no modo atual);
+e, para a busca rótulo -> ID, um índice de endereçamento aberto (sondagem linear,
+ocupação de até 2/3) em um `array` com os IDs, mais os 32 bits baixos do hash de
+cada rótulo, para comparar e redimensionar sem reconstruir os objetos.
+
+Os IDs seguem a ordem de inclusão e não mudam. `ordenada` devolve uma cópia em
+ordem crescente, usada como `vertices_ordenados`/`mapa_vertices` de grafos e
+dígrafos carregados com rótulos compactos (ver carregadores.py).
+"""
+
+from array import array
+from collections.abc import Mapping, Sequence
+
+from csr import tipo_indice
+
+_MENOR_INT64 = -(1 << 63)
+_MAIOR_INT64 = (1 << 63) - 1
+_CAPACIDADE_INICIAL = 8
+_MASCARA_HASH = 0xFFFFFFFF
+
+
+class TabelaRotulos(Sequence):
+    """
+    Sequência de rótulos distintos (ID -> rótulo) com busca rótulo -> ID.
+    """
+
+    def __init__(self, rotulos=()):
+        """
+        Args:
+            rotulos (iterable): Rótulos iniciais; repetições recebem o mesmo ID
+        """
+        self._modo = None  # 'inteiros', 'texto' ou 'objetos'
+        self._valores = None
+        self._offsets = None
+        self._hashes = array('I')
+        self._indice = array('i', [-1]) * _CAPACIDADE_INICIAL
+        self._mascara = _CAPACIDADE_INICIAL - 1
+        for rotulo in rotulos:
+            self.internar(rotulo)
+
+    # =========================================================================
+    # ARMAZENAMENTO
+    # =========================================================================
+
+    def _cabe(self, rotulo):
+        if self._modo == 'inteiros':
+            return type(rotulo) is int and _MENOR_INT64 <= rotulo <= _MAIOR_INT64
+        if self._modo == 'texto':
+            return type(rotulo) is str
+        return True
+
+    def _escolher_modo(self, rotulo):
+        if type(rotulo) is int and _MENOR_INT64 <= rotulo <= _MAIOR_INT64:
+            self._modo = 'inteiros'
+            self._valores = array('q')
+        elif type(rotulo) is str:
+            self._modo = 'texto'
+            self._valores = bytearray()
+            self._offsets = array('q', [0])
+        else:
+            self._modo = 'objetos'
+            self._valores = []
+
+    def _para_objetos(self):
+        self._valores = list(self)
+        self._offsets = None
+        self._modo = 'objetos'
+
+    def _rotulo(self, id_rotulo):
+        if self._modo == 'texto':
+            offsets = self._offsets
+            return self._valores[offsets[id_rotulo]:offsets[id_rotulo + 1]].decode(
+                'utf-8', 'surrogatepass')
+        return self._valores[id_rotulo]
+
+    def _redimensionar(self):
+        capacidade = 2 * len(self._indice)
+        mascara = capacidade - 1
+        indice = array(tipo_indice(capacidade), [-1]) * capacidade
+        for id_rotulo, h in enumerate(self._hashes):
+            posicao = h & mascara
+            while indice[posicao] >= 0:
+                posicao = (posicao + 1) & mascara
+            indice[posicao] = id_rotulo
+        self._indice = indice
+        self._mascara = mascara
+
+    # =========================================================================
+    # RÓTULO -> ID
+    # =========================================================================
+
+    def _procurar(self, rotulo, h):
+        """
+        Retorna (ID do rótulo ou -1, posição do índice onde ele está ou entraria).
+        """
+        h &= _MASCARA_HASH
+        indice = self._indice
+        hashes = self._hashes
+        mascara = self._mascara
+        posicao = h & mascara
+        if self._modo == 'texto':
+            if not isinstance(rotulo, str):
+                # Só textos são iguais a textos: basta achar a posição livre
+                while indice[posicao] >= 0:
+                    posicao = (posicao + 1) & mascara
+                return -1, posicao
+            dados = self._valores
+            offsets = self._offsets
+            chave = rotulo.encode('utf-8', 'surrogatepass')
+            while True:
+                id_rotulo = indice[posicao]
+                if id_rotulo < 0:
+                    return -1, posicao
+                if (hashes[id_rotulo] == h
+                        and dados[offsets[id_rotulo]:offsets[id_rotulo + 1]] == chave):
+                    return id_rotulo, posicao
+                posicao = (posicao + 1) & mascara
+        valores = self._valores
+        while True:
+            id_rotulo = indice[posicao]
+            if id_rotulo < 0:
+                return -1, posicao
+            if hashes[id_rotulo] == h and valores[id_rotulo] == rotulo:
+                return id_rotulo, posicao
+            posicao = (posicao + 1) & mascara
+
+    def id_de(self, rotulo):
+        """
+        Retorna o ID do rótulo, ou -1 se ele não estiver na tabela.
+        """
+        if self._modo is None:
+            return -1
+        return self._procurar(rotulo, hash(rotulo))[0]
+
+    def internar(self, rotulo):
+        """
+        Retorna o ID do rótulo, incluindo-o na tabela (com o próximo ID) se necessário.
+        """
+        h = hash(rotulo)
+        if self._modo is None:
+            self._escolher_modo(rotulo)
+        id_rotulo, posicao = self._procurar(rotulo, h)
+        if id_rotulo >= 0:
+            return id_rotulo
+        if not self._cabe(rotulo):
+            self._para_objetos()
+        id_rotulo = len(self._hashes)
+        if self._modo == 'texto':
+            self._valores += rotulo.encode('utf-8', 'surrogatepass')
+            self._offsets.append(len(self._valores))
+        else:
+            self._valores.append(rotulo)
+        self._hashes.append(h & _MASCARA_HASH)
+        self._indice[posicao] = id_rotulo
+        if 3 * len(self._hashes) > 2 * len(self._indice):
+            self._redimensionar()
+        return id_rotulo
+
+    # =========================================================================
+    # TRADUÇÃO EM LOTE
+    # =========================================================================
+
+    def ids_de(self, rotulos, internar=False):
+        """
+        Traduz vários rótulos para IDs.
+
+        Args:
+            rotulos (iterable): Rótulos a traduzir
+            internar (bool): Se True, inclui os rótulos ausentes em vez de falhar
+
+        Returns:
+            array: ID de cada rótulo, na ordem recebida
+
+        Raises:
+            KeyError: Se internar for False e algum rótulo não estiver na tabela
+        """
+        traduzir = self.internar if internar else self.id_de
+        ids = array('q')
+        for rotulo in rotulos:
+            id_rotulo = traduzir(rotulo)
+            if id_rotulo < 0:
+                raise KeyError(rotulo)
+            ids.append(id_rotulo)
+        return ids
+
+    def rotulos_de(self, ids):
+        """
+        Traduz vários IDs para rótulos.
+
+        Args:
+            ids (iterable): IDs da tabela
+
+        Returns:
+            list: Rótulo de cada ID, na ordem recebida
+        """
+        return [self[id_rotulo] for id_rotulo in ids]
+
+    def ordenada(self):
+        """
+        Retorna a tabela com os rótulos em ordem crescente.
+
+        Returns:
+            tuple: (tabela, posicoes): a tabela ordenada (esta mesma, se já estiver
+                   em ordem) e um array ID antigo -> ID novo (None se nada mudou)
+        """
+        ordem = sorted(range(len(self)), key=self._rotulo)
+        if all(antigo == novo for novo, antigo in enumerate(ordem)):
+            return self, None
+        posicoes = array('q', bytes(8 * len(ordem)))
+        for novo, antigo in enumerate(ordem):
+            posicoes[antigo] = novo
+        return TabelaRotulos(self._rotulo(antigo) for antigo in ordem), posicoes
+
+    def bytes_ocupados(self):
+        """
+        Estima a memória dos vetores da tabela (sem os objetos do modo 'objetos').
+        """
+        total = self._hashes.itemsize * len(self._hashes) + self._indice.itemsize * len(self._indice)
+        if self._modo == 'texto':
+            total += len(self._valores) + self._offsets.itemsize * len(self._offsets)
+        elif self._modo == 'inteiros':
+            total += self._valores.itemsize * len(self._valores)
+        elif self._modo == 'objetos':
+            total += 8 * len(self._valores)
+        return total
+
+    # =========================================================================
+    # SEQUÊNCIA ID -> RÓTULO
+    # =========================================================================
+
+    def __len__(self):
+        return len(self._hashes)
+
+    def __getitem__(self, id_rotulo):
+        if isinstance(id_rotulo, slice):
+            return [self._rotulo(i) for i in range(*id_rotulo.indices(len(self)))]
+        if id_rotulo < 0:
+            id_rotulo += len(self)
+        if not 0 <= id_rotulo < len(self):
+            raise IndexError("ID de rótulo fora da tabela.")
+        return self._rotulo(id_rotulo)
+
+    def __iter__(self):
+        if self._modo == 'texto':
+            dados = self._valores
+            offsets = self._offsets
+            for i in range(len(self)):
+                yield dados[offsets[i]:offsets[i + 1]].decode('utf-8', 'surrogatepass')
+        elif self._modo is not None:
+            yield from self._valores
+
+    def __contains__(self, rotulo):
+        return self.id_de(rotulo) >= 0
+
+    def __eq__(self, outra):
+        if isinstance(outra, (list, tuple, TabelaRotulos)):
+            return len(self) == len(outra) and all(a == b for a, b in zip(self, outra))
+        return NotImplemented
+
+    def __add__(self, outra):
+        return list(self) + list(outra)
+
+    def __repr__(self):
+        return f"TabelaRotulos({len(self)} rótulos)"
+
+
+class MapaTabelaRotulos(Mapping):
+    """
+    Mapeamento rótulo -> ID sobre uma TabelaRotulos, sem montar um dicionário.
+    """
+
+    def __init__(self, tabela):
+        self._tabela = tabela
+
+    def __getitem__(self, rotulo):
+        try:
+            id_rotulo = self._tabela.id_de(rotulo)
+        except TypeError:
+            raise KeyError(rotulo) from None  # rótulo não hasheável
+        if id_rotulo < 0:
+            raise KeyError(rotulo)
+        return id_rotulo
+
+    def __contains__(self, rotulo):
+        try:
+            return self._tabela.id_de(rotulo) >= 0
+        except TypeError:
+            return False
+
+    def __iter__(self):
+        return iter(self._tabela)
+
+    def __len__(self):
+        return len(self._tabela)
+
+    def __repr__(self):
+        return f"MapaTabelaRotulos({len(self)} rótulos)"
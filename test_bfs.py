@@ -365,6 +365,165 @@ def teste_item_19_comparacao_grafo_vs_digrafo():
     print("✅ Teste passou!")
 
 
+# ==============================================================================
+# TESTES DO MOTOR DE BFS LINEAR (CSR)
+# ==============================================================================
+
+def teste_motor_bfs_modo_deterministico():
+    print("\n" + "="*80)
+    print("TESTE MOTOR BFS.1 - Modo determinístico x ordem de inserção")
+    print("="*80)
+    
+    # Arestas inseridas fora de ordem alfabética a partir de 'a'
+    vertices = {'a', 'b', 'c', 'd'}
+    arestas = [('a', 'd'), ('a', 'c'), ('a', 'b')]
+    grafo = Grafo(vertices, arestas)
+    
+    deterministico = grafo.busca_em_largura('a')
+    insercao = grafo.busca_em_largura('a', deterministico=False)
+    
+    print(f"Ordem determinística: {deterministico['ordem_visitacao']}")
+    print(f"Ordem de inserção: {insercao['ordem_visitacao']}")
+    
+    assert deterministico['ordem_visitacao'] == ['a', 'b', 'c', 'd'], "Vizinhos deveriam sair em ordem alfabética"
+    assert insercao['ordem_visitacao'] == ['a', 'd', 'c', 'b'], "Vizinhos deveriam seguir a ordem das arestas"
+    assert deterministico['distancias'] == insercao['distancias'], "Distâncias independem da ordem"
+    assert deterministico['alcancaveis'] == insercao['alcancaveis']
+    
+    print("✅ Teste passou!")
+
+
+def teste_motor_bfs_caminho_longo():
+    print("\n" + "="*80)
+    print("TESTE MOTOR BFS.2 - BFS linear em caminho longo")
+    print("="*80)
+    
+    # Caminho com 50.000 vértices: a versão com fila em lista seria quadrática
+    n = 50000
+    vertices = set(range(n))
+    arestas = [(i, i + 1) for i in range(n - 1)]
+    grafo = Grafo(vertices, arestas)
+    
+    resultado = grafo.busca_em_largura(0)
+    
+    print(f"Vértices alcançados: {len(resultado['alcancaveis'])}")
+    print(f"Distância até {n - 1}: {resultado['distancias'][n - 1]}")
+    
+    assert len(resultado['ordem_visitacao']) == n
+    assert resultado['distancias'][n - 1] == n - 1
+    assert resultado['pais'][n - 1] == n - 2
+    assert grafo.is_conexo() is True
+    
+    digrafo = Digrafo(vertices, arestas)
+    resultado_digrafo = digrafo.busca_em_largura(n // 2)
+    assert len(resultado_digrafo['alcancaveis']) == n - n // 2, "Só alcança o sufixo do caminho"
+    
+    print("✅ Teste passou!")
+
+
+def teste_motor_bfs_multiplas_fontes():
+    print("\n" + "="*80)
+    print("TESTE MOTOR BFS.3 - BFS de várias fontes (matriz de distâncias)")
+    print("="*80)
+    
+    # Lote de 2 fontes força mais de uma máscara para as 3 fontes
+    vertices = {'a', 'b', 'c', 'd', 'e', 'f'}
+    arestas = [('a', 'b'), ('b', 'c'), ('c', 'd'), ('a', 'e')]
+    grafo = Grafo(vertices, arestas)
+    
+    resultado = grafo.busca_em_largura_multipla(['a', 'd', 'f'], tamanho_lote=2)
+    matriz = [list(linha) for linha in resultado['distancias']]
+    
+    print(f"Fontes: {resultado['fontes']}")
+    print(f"Distâncias: {matriz}")
+    
+    assert resultado['fontes'] == ['a', 'd', 'f']
+    for fonte, linha in zip(resultado['fontes'], matriz):
+        individual = grafo.busca_em_largura(fonte)['distancias']
+        esperada = [individual.get(v, -1) for v in grafo.vertices_ordenados]
+        assert linha == esperada, f"Linha de '{fonte}' difere da BFS individual"
+    assert matriz[2] == [-1, -1, -1, -1, -1, 0], "'f' isolado só alcança a si mesmo"
+    
+    digrafo = Digrafo({1, 2, 3}, [(1, 2), (2, 3)])
+    linhas = digrafo.busca_em_largura_multipla([3, 1])['distancias']
+    assert [list(linha) for linha in linhas] == [[-1, -1, 0], [0, 1, 2]]
+    
+    try:
+        grafo.busca_em_largura_multipla(['a', 'z'])
+        assert False, "Deveria ter lançado ValueError"
+    except ValueError as e:
+        print(f"✅ Exceção capturada: {e}")
+    
+    print("✅ Teste passou!")
+
+
+def teste_motor_bfs_fonte_mais_proxima():
+    print("\n" + "="*80)
+    print("TESTE MOTOR BFS.4 - BFS de várias fontes (fonte mais próxima)")
+    print("="*80)
+    
+    # Caminho a-b-c-d-e com fontes nas pontas: 'c' empata e fica com a primeira fonte
+    vertices = {'a', 'b', 'c', 'd', 'e', 'x'}
+    arestas = [('a', 'b'), ('b', 'c'), ('c', 'd'), ('d', 'e')]
+    grafo = Grafo(vertices, arestas)
+    
+    resultado = grafo.busca_em_largura_multipla(['a', 'e'], modo='mais_proxima')
+    
+    print(f"Fonte mais próxima: {resultado['fonte_mais_proxima']}")
+    print(f"Distâncias: {resultado['distancias']}")
+    
+    assert resultado['fonte_mais_proxima'] == {'a': 'a', 'b': 'a', 'c': 'a', 'd': 'e', 'e': 'e'}
+    assert resultado['distancias'] == {'a': 0, 'b': 1, 'c': 2, 'd': 1, 'e': 0}
+    assert 'x' not in resultado['distancias'], "Vértice inalcançável fica de fora"
+    
+    try:
+        grafo.busca_em_largura_multipla(['a'], modo='todas')
+        assert False, "Deveria ter lançado ValueError"
+    except ValueError as e:
+        print(f"✅ Exceção capturada: {e}")
+    
+    print("✅ Teste passou!")
+
+
+def teste_motor_bfs_direcional():
+    print("\n" + "="*80)
+    print("TESTE MOTOR BFS.5 - BFS com otimização de direção em dígrafo")
+    print("="*80)
+    
+    # Estrela: 0 -> 1..40, e cada folha aponta para o sumidouro 41
+    folhas = list(range(1, 41))
+    arcos = [(0, f) for f in folhas] + [(f, 41) for f in folhas] + [(41, 42)]
+    digrafo = Digrafo(set(range(43)), arcos)
+    
+    comum = digrafo.busca_em_largura(0)
+    # alfa = 2: o nível 0 (40 arcos de saída x 81 de entrada) ainda é top-down
+    direcional = digrafo.busca_em_largura_direcional(0, alfa=2)
+    direcoes = [nivel['direcao'] for nivel in direcional['niveis']]
+    
+    for nivel in direcional['niveis']:
+        print(f"Nível {nivel['nivel']}: {nivel}")
+    
+    assert direcional['distancias'] == comum['distancias'], "Distâncias iguais às da BFS comum"
+    assert direcional['alcancaveis'] == comum['alcancaveis']
+    assert direcoes == ['top-down', 'bottom-up', 'top-down', 'top-down'], "Troca e volta de direção"
+    # No bottom-up, 41 para no primeiro predecessor da fronteira: um arco em vez de 40
+    assert direcional['niveis'][1]['arcos_examinados'] < 40
+    assert direcional['pais'][41] == 1
+    
+    # alfa mínimo nunca troca: todos os níveis top-down, mesma ordem da BFS comum
+    so_top_down = digrafo.busca_em_largura_direcional(0, alfa=1e-9)
+    assert all(nivel['direcao'] == 'top-down' for nivel in so_top_down['niveis'])
+    assert so_top_down['ordem_visitacao'] == comum['ordem_visitacao']
+    
+    try:
+        digrafo.busca_em_largura_direcional(0, beta=0)
+        assert False, "Deveria ter lançado ValueError"
+    except ValueError as e:
+        print(f"✅ Exceção capturada: {e}")
+    
+    print("✅ Teste passou!")
+
+
 # ==============================================================================
 # FUNÇÃO PRINCIPAL - EXECUTA TODOS OS TESTES
 # ==============================================================================
@@ -399,6 +558,13 @@ def executar_todos_os_testes():
     teste_item_19_bfs_digrafo_componentes_separadas()
     teste_item_19_comparacao_grafo_vs_digrafo()
     
+    # Motor de BFS linear
+    teste_motor_bfs_modo_deterministico()
+    teste_motor_bfs_caminho_longo()
+    teste_motor_bfs_multiplas_fontes()
+    teste_motor_bfs_fonte_mais_proxima()
+    teste_motor_bfs_direcional()
+    
     print("\n" + "="*80)
     print("FIM DA BATERIA DE TESTES DE BFS E INCLUSÃO/EXCLUSÃO DE VÉRTICES")
     print("="*80)
@@ -0,0 +1,263 @@
+"""
+Testes automatizados para os carregadores de arquivos
+- Lista de arestas CSV/TSV (inclusive gzip), com comentários, cabeçalho e buffer pequeno
+- Lista de adjacências em texto
+- Matrix Market e SNAP
+- Formato binário mapeado em memória
+"""
+
+import gzip
+import os
+import tempfile
+
+from carregadores import (carregar_lista_adjacencia, carregar_lista_arestas,
+                          carregar_matrix_market, carregar_snap)
+from digrafo import Digrafo
+from formato_binario import carregar_binario, salvar_binario
+from grafo import Grafo
+from tabela_rotulos import TabelaRotulos
+
+def imprimir_separador_teste(titulo):
+    """Imprime um separador para testes individuais."""
+    print("\n" + "="*60)
+    print(titulo.center(60))
+    print("="*60 + "\n")
+
+def escrever_arquivo(diretorio, nome, conteudo):
+    """Grava o conteúdo em um arquivo temporário (gzip se o nome terminar em .gz)."""
+    caminho = os.path.join(diretorio, nome)
+    abrir = gzip.open if nome.endswith('.gz') else open
+    with abrir(caminho, 'wt', encoding='utf-8') as arquivo:
+        arquivo.write(conteudo)
+    return caminho
+
+def teste_lista_arestas_csv_gzip():
+    """Testa o carregamento de CSV compactado, com comentário e cabeçalho."""
+    imprimir_separador_teste("TESTE - LISTA DE ARESTAS CSV (GZIP)")
+
+    conteudo = "# exportação de teste\norigem,destino\nA,B\nB,C\n\nC,A\nC,D\n"
+    with tempfile.TemporaryDirectory() as diretorio:
+        caminho = escrever_arquivo(diretorio, 'arestas.csv.gz', conteudo)
+        # Buffer de 4 caracteres força linhas quebradas entre blocos
+        grafo = carregar_lista_arestas(caminho, cabecalho=True, tamanho_buffer=4)
+
+    print(f"Vértices: {grafo.vertices_ordenados}")
+    print(f"Arestas: {grafo.arestas}")
+    assert isinstance(grafo, Grafo)
+    assert grafo.vertices_ordenados == ['A', 'B', 'C', 'D']
+    assert grafo.arestas == [('A', 'B'), ('B', 'C'), ('C', 'A'), ('C', 'D')]
+    assert grafo.is_conexo()
+
+    print("✅ Teste passou!")
+
+def teste_lista_arestas_tsv_digrafo():
+    """Testa o carregamento de TSV como dígrafo, com rótulos inteiros."""
+    imprimir_separador_teste("TESTE - LISTA DE ARESTAS TSV (DÍGRAFO)")
+
+    with tempfile.TemporaryDirectory() as diretorio:
+        caminho = escrever_arquivo(diretorio, 'arcos.tsv', "10\t2\n2\t3\n3\t10\n")
+        digrafo = carregar_lista_arestas(caminho, direcionado=True, tipo_rotulo=int)
+
+        caminho_invalido = escrever_arquivo(diretorio, 'invalido.tsv', "1\t2\n3\n")
+        try:
+            carregar_lista_arestas(caminho_invalido)
+            assert False, "Deveria ter lançado ValueError"
+        except ValueError as e:
+            print(f"✅ Exceção capturada: {e}")
+
+    print(f"Lista de adjacência: {digrafo.criar_lista_adjacencia()}")
+    assert digrafo.vertices_ordenados == [2, 3, 10], "Rótulos inteiros em ordem numérica"
+    assert digrafo.criar_lista_adjacencia() == {2: [3], 3: [10], 10: [2]}
+
+    print("✅ Teste passou!")
+
+def teste_lista_adjacencia():
+    """Testa a lista de adjacências simétrica (cada aresta em uma ou nas duas linhas)."""
+    imprimir_separador_teste("TESTE - LISTA DE ADJACÊNCIAS")
+
+    original = Grafo({'a', 'b', 'c', 'd'}, [('a', 'b'), ('b', 'c'), ('c', 'c')])
+    linhas = [f"{v}: {' '.join(vizinhos)}" for v, vizinhos in
+              original.criar_lista_adjacencia().items()]
+    with tempfile.TemporaryDirectory() as diretorio:
+        caminho = escrever_arquivo(diretorio, 'adjacencias.txt', "\n".join(linhas))
+        grafo = carregar_lista_adjacencia(caminho)
+        # Aresta listada em uma linha só ((a, b) só aparece na linha de 'a') e
+        # paralelas: vale o maior número de ocorrências entre as duas linhas
+        uma_linha = carregar_lista_adjacencia(
+            escrever_arquivo(diretorio, 'uma_linha.txt', "b: c\na: b\n"))
+        paralelas = carregar_lista_adjacencia(
+            escrever_arquivo(diretorio, 'paralelas.txt', "x: y y\ny: x\n"))
+
+    print(f"Arestas de uma linha só: {uma_linha.arestas}")
+    assert sorted(tuple(sorted(a)) for a in uma_linha.arestas) == [('a', 'b'), ('b', 'c')]
+    assert paralelas.num_arestas == 2
+
+    print(f"Arestas carregadas: {grafo.arestas}")
+    assert grafo.vertices_ordenados == ['a', 'b', 'c', 'd'], "'d' é um vértice isolado"
+    assert sorted(tuple(sorted(a)) for a in grafo.arestas) == [('a', 'b'), ('b', 'c'), ('c', 'c')]
+    assert grafo.criar_lista_adjacencia() == original.criar_lista_adjacencia()
+
+    print("✅ Teste passou!")
+
+def teste_matrix_market_e_snap():
+    """Testa os formatos Matrix Market (simétrica) e SNAP (dirigido)."""
+    imprimir_separador_teste("TESTE - MATRIX MARKET E SNAP")
+
+    matrix_market = ("%%MatrixMarket matrix coordinate pattern symmetric\n"
+                     "% comentário\n4 4 2\n2 1\n3 2\n")
+    snap = ("# Directed graph (each unordered pair of nodes is saved once)\n"
+            "# FromNodeId\tToNodeId\n0\t1\n1\t2\n5\t0\n")
+    cabecalho_mm = "%%MatrixMarket matrix coordinate pattern general\n3 3 2\n1 2\n"
+    erros_matrix_market = {
+        'zero.mtx': cabecalho_mm + "0 1\n",
+        'acima.mtx': cabecalho_mm + "2 4\n",
+        'malformada.mtx': cabecalho_mm + "3\n",
+    }
+    with tempfile.TemporaryDirectory() as diretorio:
+        caminho_mm = escrever_arquivo(diretorio, 'm.mtx', matrix_market)
+        grafo = carregar_matrix_market(caminho_mm)
+        digrafo_simetrico = carregar_matrix_market(caminho_mm, direcionado=True)
+        digrafo = carregar_snap(escrever_arquivo(diretorio, 'snap.txt.gz', snap))
+
+        # Índices fora de 1..n e entradas malformadas são rejeitados com o número da linha
+        for nome, conteudo in erros_matrix_market.items():
+            try:
+                carregar_matrix_market(escrever_arquivo(diretorio, nome, conteudo))
+                assert False, f"Deveria ter lançado ValueError ({nome})"
+            except ValueError as e:
+                print(f"✅ Exceção capturada: {e}")
+                assert "Linha 3" in str(e)
+
+        # SNAP: a mesma mensagem dos demais carregadores (linha de dados 2)
+        for nome, conteudo in {'um_token.txt': "0 1\n7\n", 'texto.txt': "0 1\n7 x\n"}.items():
+            try:
+                carregar_snap(escrever_arquivo(diretorio, nome, "# Directed\n" + conteudo))
+                assert False, f"Deveria ter lançado ValueError ({nome})"
+            except ValueError as e:
+                print(f"✅ Exceção capturada: {e}")
+                assert "Linha 2 inválida" in str(e)
+
+    print(f"Matrix Market: {type(grafo).__name__} {grafo.vertices_ordenados} {grafo.arestas}")
+    assert isinstance(grafo, Grafo), "Matriz simétrica vira grafo"
+    assert grafo.vertices_ordenados == [1, 2, 3, 4], "Vértice 4 isolado incluído"
+    assert grafo.arestas == [(2, 1), (3, 2)]
+
+    print(f"SNAP: {type(digrafo).__name__} {digrafo.arcos}")
+    assert digrafo.arcos == [(0, 1), (1, 2), (5, 0)]
+    assert digrafo.busca_em_largura(5)['ordem_visitacao'] == [5, 0, 1, 2]
+
+    # Matriz simétrica lida como dígrafo: o triângulo guardado é espelhado
+    assert digrafo_simetrico.arcos == [(2, 1), (1, 2), (3, 2), (2, 3)]
+
+    print("✅ Teste passou!")
+
+def teste_formato_binario():
+    """Testa a gravação e a carga mapeada em memória (sem cópia) do formato binário."""
+    imprimir_separador_teste("TESTE - FORMATO BINÁRIO MAPEADO EM MEMÓRIA")
+
+    grafo = Grafo({'A', 'B', 'C', 'D', 'É'}, [('C', 'A'), ('A', 'B'), ('B', 'C'), ('D', 'É')])
+    digrafo = Digrafo({1, 2, 3}, [(3, 1), (1, 2)])
+    with tempfile.TemporaryDirectory() as diretorio:
+        caminho_grafo = os.path.join(diretorio, 'grafo.bin')
+        caminho_digrafo = os.path.join(diretorio, 'digrafo.bin')
+        salvar_binario(grafo, caminho_grafo)
+        salvar_binario(digrafo, caminho_digrafo)
+        carregado = carregar_binario(caminho_grafo)
+        digrafo_carregado = carregar_binario(caminho_digrafo)
+
+        caminho_invalido = escrever_arquivo(diretorio, 'invalido.bin', "nada aqui")
+        try:
+            carregar_binario(caminho_invalido)
+            assert False, "Deveria ter lançado ValueError"
+        except ValueError as e:
+            print(f"✅ Exceção capturada: {e}")
+
+    # A CSR do grafo carregado é uma visão do arquivo, não uma cópia
+    assert isinstance(carregado.obter_csr().vizinhos, memoryview)
+    print(f"Vértices: {list(carregado.vertices_ordenados)}")
+    assert carregado.vertices_ordenados == grafo.vertices_ordenados
+    assert carregado.busca_em_largura('A') == grafo.busca_em_largura('A')
+    assert carregado.criar_lista_adjacencia() == grafo.criar_lista_adjacencia()
+    assert carregado.determinar_articulacoes_blocos() == grafo.determinar_articulacoes_blocos()
+    assert carregado.arestas == grafo.arestas
+
+    # Modificações copiam os dados para a memória e seguem funcionando
+    carregado.excluir_vertice('A')
+    assert carregado.vertices_ordenados == ['B', 'C', 'D', 'É']
+    assert carregado.arestas == [('B', 'C'), ('D', 'É')]
+
+    assert isinstance(digrafo_carregado, Digrafo)
+    assert digrafo_carregado.arcos == [(3, 1), (1, 2)]
+    assert digrafo_carregado.busca_em_largura(3)['ordem_visitacao'] == [3, 1, 2]
+
+    print("✅ Teste passou!")
+
+def teste_rotulos_compactos():
+    """Testa a tabela de rótulos (interning) e a carga com rótulos compactos."""
+    imprimir_separador_teste("TESTE - TABELA DE RÓTULOS COMPACTOS")
+
+    tabela = TabelaRotulos(['https://b.org/x', 'https://a.org/y', 'https://b.org/x', 'ç'])
+    assert list(tabela) == ['https://b.org/x', 'https://a.org/y', 'ç'], "Repetições recebem o mesmo ID"
+    assert list(tabela.ids_de(['ç', 'https://b.org/x'])) == [2, 0]
+    assert tabela.rotulos_de([1, 2]) == ['https://a.org/y', 'ç']
+    assert tabela.internar('novo') == 3 and 'novo' in tabela and 'outro' not in tabela
+    try:
+        tabela.ids_de(['ausente'])
+        assert False, "Deveria ter lançado KeyError"
+    except KeyError as e:
+        print(f"✅ Exceção capturada: {e}")
+    # Rótulo de outro tipo: a tabela passa a guardar objetos e mantém os IDs
+    assert tabela.internar(7) == 4 and tabela.id_de('ç') == 2 and tabela[4] == 7
+
+    inteiros = TabelaRotulos(range(1000, 0, -1))
+    ordenada, posicoes = inteiros.ordenada()
+    assert list(ordenada) == list(range(1, 1001)) and posicoes[0] == 999
+    assert ordenada.ordenada() == (ordenada, None), "Tabela já ordenada não é copiada"
+
+    conteudo = "".join(f"https://exemplo.com/{i % 37}/pagina,https://exemplo.com/{i % 11}/pagina\n"
+                       for i in range(200))
+    with tempfile.TemporaryDirectory() as diretorio:
+        caminho = escrever_arquivo(diretorio, 'urls.csv', conteudo)
+        comum = carregar_lista_arestas(caminho)
+        compacto = carregar_lista_arestas(caminho, rotulos_compactos=True)
+        digrafo = carregar_lista_arestas(caminho, direcionado=True, rotulos_compactos=True)
+        digrafo_comum = carregar_lista_arestas(caminho, direcionado=True)
+
+    assert isinstance(compacto.vertices_ordenados, TabelaRotulos)
+    print(f"Vértices: {len(compacto.vertices_ordenados)}; "
+          f"tabela: {compacto.vertices_ordenados.bytes_ocupados()} bytes")
+    assert compacto.vertices_ordenados == comum.vertices_ordenados
+    assert compacto.mapa_vertices['https://exemplo.com/5/pagina'] == \
+           comum.mapa_vertices['https://exemplo.com/5/pagina']
+    assert compacto.arestas == comum.arestas
+    assert compacto.decomposicao_biconexa()['articulacoes'] == \
+           comum.decomposicao_biconexa()['articulacoes']
+    assert digrafo.vertices_ordenados == digrafo_comum.vertices_ordenados
+    assert digrafo.criar_lista_adjacencia() == digrafo_comum.criar_lista_adjacencia()
+    assert digrafo.componentes_fortemente_conexas()['num_componentes'] == \
+           digrafo_comum.componentes_fortemente_conexas()['num_componentes']
+
+    # Modificações copiam os rótulos para estruturas comuns e seguem funcionando
+    compacto.incluir_vertice('https://exemplo.com/novo', [('https://exemplo.com/novo',
+                                                            'https://exemplo.com/3/pagina')])
+    comum.incluir_vertice('https://exemplo.com/novo', [('https://exemplo.com/novo',
+                                                         'https://exemplo.com/3/pagina')])
+    assert compacto.criar_lista_adjacencia() == comum.criar_lista_adjacencia()
+
+    print("✅ Teste passou!")
+
+def executar_todos_os_testes():
+    """Executa toda a bateria de testes dos carregadores."""
+    teste_lista_arestas_csv_gzip()
+    teste_lista_arestas_tsv_digrafo()
+    teste_lista_adjacencia()
+    teste_matrix_market_e_snap()
+    teste_formato_binario()
+    teste_rotulos_compactos()
+
+    print("\n" + "="*80)
+    print("TODOS OS TESTES DOS CARREGADORES FORAM CONCLUÍDOS".center(80))
+    print("="*80)
+
+if __name__ == "__main__":
+    executar_todos_os_testes()
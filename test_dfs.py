@@ -9,6 +9,7 @@ Testes para validar as implementações de:
 
 from grafo import Grafo
 from digrafo import Digrafo
+from uniao_busca import UniaoBusca
 
 
 # ==============================================================================
@@ -60,6 +61,52 @@ def teste_item_11_grafo_vazio_e_unitario():
     
     print("✅ Teste passou!")
 
+def teste_item_11_componentes_conexas():
+    print("\n" + "="*80)
+    print("TESTE 11.4 - Componentes conexas por união e busca")
+    print("="*80)
+    
+    vertices = {'a', 'b', 'c', 'd', 'e', 'f'}
+    arestas = [('a', 'b'), ('d', 'c'), ('b', 'a'), ('e', 'e'), ('c', 'e')]
+    grafo = Grafo(vertices, arestas)
+    
+    resultado = grafo.componentes_conexas()
+    print(f"Componentes: {dict(zip(grafo.vertices_ordenados, resultado['componente']))}")
+    print(f"Tamanhos: {list(resultado['tamanhos'])}")
+    
+    assert list(resultado['componente']) == [0, 0, 1, 1, 1, 2], "Numeradas pelo primeiro vértice"
+    assert list(resultado['tamanhos']) == [2, 3, 1]
+    assert resultado['num_componentes'] == 3
+    assert grafo.is_conexo() is False
+    
+    grafo.incluir_arestas([('b', 'c'), ('e', 'f')])
+    assert grafo.componentes_conexas()['num_componentes'] == 1, "Cache invalidado pela mutação"
+    assert grafo.is_conexo() is True
+    
+    print("✅ Teste passou!")
+
+def teste_item_11_uniao_busca():
+    print("\n" + "="*80)
+    print("TESTE 11.5 - Estrutura de união e busca")
+    print("="*80)
+    
+    # Caminho 0-1-2-...-9 unido em ordem: a parada antecipada ignora os pares finais
+    uniao_busca = UniaoBusca(10)
+    origens = list(range(9)) + [0, 5]
+    destinos = list(range(1, 10)) + [9, 2]
+    processados = uniao_busca.unir_pares(origens, destinos, parar_quando_conexo=True)
+    print(f"Pares processados até ficar conexo: {processados}")
+    assert processados == 9 and uniao_busca.num_componentes == 1
+    assert uniao_busca.tamanho_conjunto(7) == 10
+    
+    elemento = uniao_busca.adicionar()
+    assert elemento == 10 and uniao_busca.num_componentes == 2
+    assert not uniao_busca.mesmo_conjunto(0, 10)
+    assert uniao_busca.unir(10, 3) is True and uniao_busca.unir(3, 10) is False
+    assert uniao_busca.mesmo_conjunto(0, 10) and uniao_busca.num_componentes == 1
+    
+    print("✅ Teste passou!")
+
 # ==============================================================================
 # TESTES ITEM 14 - BUSCA EM PROFUNDIDADE (DFS) EM GRAFOS
 # ==============================================================================
@@ -214,6 +261,53 @@ def teste_item_15_grafo_complexo():
     print("✅ Teste passou!")
     
 
+def teste_item_15_pontes_blocos_arestas():
+    print("\n" + "="*80)
+    print("TESTE 15.4 - Pontes, blocos por aresta e árvore de blocos (passada única)")
+    print("="*80)
+
+    # Triângulo ligado pela ponte (c, d); (d, e) é paralela e o laço em 'f' não forma bloco
+    vertices = {'a', 'b', 'c', 'd', 'e', 'f'}
+    arestas = [('a', 'b'), ('b', 'c'), ('c', 'a'), ('c', 'd'),
+               ('d', 'e'), ('d', 'e'), ('e', 'f'), ('f', 'f')]
+    grafo = Grafo(vertices, arestas)
+
+    resultado = grafo.decomposicao_biconexa()
+    pontes = [grafo.aresta_por_id(e) for e in resultado['pontes']]
+    blocos = [sorted(grafo.aresta_por_id(e) for e in bloco) for bloco in resultado['blocos']]
+
+    print(f"Articulações: {resultado['articulacoes']}")
+    print(f"Pontes: {pontes}")
+    print(f"Blocos: {blocos}")
+
+    assert resultado['articulacoes'] == {'c', 'd', 'e'}
+    # A aresta paralela (d, e) não é ponte
+    assert sorted(pontes) == [('c', 'd'), ('e', 'f')]
+    assert sorted(blocos) == [
+        [('a', 'b'), ('b', 'c'), ('c', 'a')],
+        [('c', 'd')],
+        [('d', 'e'), ('d', 'e')],
+        [('e', 'f')]
+    ]
+
+    # Árvore de blocos: 4 blocos + 3 articulações, ligados em caminho
+    arvore = resultado['arvore_blocos']
+    assert arvore['num_blocos'] == 4
+    assert sorted(arvore['articulacoes']) == ['c', 'd', 'e']
+    assert arvore['csr'].num_vertices == 7
+    assert arvore['csr'].num_entradas() == 2 * 6
+    for k, articulacao in enumerate(arvore['articulacoes']):
+        assert arvore['csr'].grau(arvore['num_blocos'] + k) == 2, articulacao
+
+    # IDs estáveis continuam valendo após exclusões
+    grafo.excluir_aresta('a', 'b')
+    resultado = grafo.decomposicao_biconexa()
+    pontes = sorted(grafo.aresta_por_id(e) for e in resultado['pontes'])
+    assert pontes == [('b', 'c'), ('c', 'a'), ('c', 'd'), ('e', 'f')]
+    assert resultado['articulacoes'] == {'c', 'd', 'e'}
+
+    print("✅ Teste passou!")
+
 # ==============================================================================
 # TESTES ITEM 20 - BUSCA EM PROFUNDIDADE (DFS) EM DÍGRAFOS
 # ==============================================================================
@@ -298,6 +392,65 @@ def teste_item_20_dfs_digrafo_desconexo():
     print("✅ Teste passou!")
 
 
+# ==============================================================================
+# TESTES DO MOTOR DE DFS ITERATIVO (SEM RECURSÃO)
+# ==============================================================================
+
+def teste_motor_dfs_cadeia_profunda():
+    print("\n" + "="*80)
+    print("TESTE MOTOR DFS.1 - DFS em cadeia muito além do limite de recursão")
+    print("="*80)
+    
+    # Caminho 0 - 1 - ... - (n-1): a versão recursiva estouraria o limite (~1000)
+    n = 100000
+    vertices = set(range(n))
+    arestas = [(i, i + 1) for i in range(n - 1)]
+    
+    grafo = Grafo(vertices, arestas)
+    resultado = grafo.busca_em_profundidade()
+    print(f"Vértices visitados: {len(resultado['ordem_visitacao'])}")
+    assert resultado['ordem_visitacao'] == list(range(n)), "Deveria descer pelo caminho em ordem"
+    assert resultado['pais'][n - 1] == n - 2
+    assert resultado['arestas_retorno'] == []
+    
+    biconexao = grafo.determinar_articulacoes_blocos()
+    print(f"Articulações: {len(biconexao['articulacoes'])}, Blocos: {len(biconexao['blocos'])}")
+    assert biconexao['articulacoes'] == set(range(1, n - 1)), "Todo vértice interno é articulação"
+    assert len(biconexao['blocos']) == n - 1, "Cada aresta do caminho é um bloco"
+    
+    digrafo = Digrafo(vertices, arestas)
+    resultado_digrafo = digrafo.busca_em_profundidade_completa()
+    assert resultado_digrafo['tempo_entrada'][n - 1] == n
+    assert resultado_digrafo['tempo_saida'][n - 1] == n + 1
+    assert resultado_digrafo['tempo_saida'][0] == 2 * n
+    assert len(resultado_digrafo['tipos_arcos']['arvore']) == n - 1
+    
+    print("✅ Teste passou!")
+
+def teste_motor_dfs_ciclo_longo_lowpt():
+    print("\n" + "="*80)
+    print("TESTE MOTOR DFS.2 - lowpt em ciclo longo")
+    print("="*80)
+    
+    # Ciclo com 20.000 vértices: um único bloco, sem articulações
+    n = 20000
+    vertices = set(range(n))
+    arestas = [(i, (i + 1) % n) for i in range(n)]
+    grafo = Grafo(vertices, arestas)
+    
+    resultado = grafo.determinar_articulacoes_blocos()
+    dfs = grafo.busca_em_profundidade()
+    
+    print(f"Articulações: {len(resultado['articulacoes'])}, Blocos: {len(resultado['blocos'])}")
+    print(f"Arestas de retorno: {dfs['arestas_retorno']}")
+    
+    assert resultado['articulacoes'] == set()
+    assert resultado['blocos'] == [vertices]
+    assert dfs['arestas_retorno'] == [(0, n - 1)], "Apenas a aresta que fecha o ciclo é de retorno"
+    
+    print("✅ Teste passou!")
+
+
 # ==============================================================================
 # FUNÇÃO PRINCIPAL - EXECUTA TODOS OS TESTES DE DFS
 # ==============================================================================
@@ -315,6 +468,8 @@ def executar_todos_os_testes_dfs():
     teste_item_11_grafo_conexo()
     teste_item_11_grafo_desconexo()
     teste_item_11_grafo_vazio_e_unitario()
+    teste_item_11_componentes_conexas()
+    teste_item_11_uniao_busca()
     
     # Testes Item 14
     teste_item_14_dfs_arvore()
@@ -325,11 +480,16 @@ def executar_todos_os_testes_dfs():
     teste_item_15_ponte_e_articulacao()
     teste_item_15_sem_articulacoes()
     teste_item_15_grafo_complexo()
+    teste_item_15_pontes_blocos_arestas()
     
     # Testes Item 20
     teste_item_20_dfs_digrafo_cadeia()
     teste_item_20_dfs_digrafo_classificacao_arcos()
     teste_item_20_dfs_digrafo_desconexo()
+    
+    # Motor de DFS iterativo
+    teste_motor_dfs_cadeia_profunda()
+    teste_motor_dfs_ciclo_longo_lowpt()
 
     print("\n" + "="*80)
     print("FIM DA BATERIA DE TESTES DE DFS E ALGORITMOS RELACIONADOS")
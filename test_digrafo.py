@@ -215,6 +215,53 @@ def teste_digrafo_bipartido():
     
     print("✅ Teste 4 passou!")
 
+def teste_vista_subjacente():
+    """Testa a vista não direcionada (sem cópia) sobre o dígrafo."""
+    imprimir_separador_teste("TESTE - VISTA DO GRAFO SUBJACENTE")
+    
+    # A <-> B é uma só aresta no subjacente; C -> A e C -> B fecham um triângulo
+    vertices = {'A', 'B', 'C', 'D', 'E'}
+    arcos = [('A', 'B'), ('B', 'A'), ('C', 'A'), ('C', 'B'), ('D', 'C'), ('E', 'E')]
+    digrafo = Digrafo(vertices, arcos)
+    vista = digrafo.obter_vista_subjacente()
+    
+    # Vizinhos: sucessores e predecessores, sem repetições
+    assert vista.vizinhos('A') == ['B', 'C']
+    assert vista.vizinhos('C') == ['A', 'B', 'D']
+    
+    # Bipartição: o triângulo A, B, C é um ciclo ímpar
+    resultado = vista.eh_bipartido()
+    print(f"Ciclo ímpar encontrado: {resultado['ciclo_impar']}")
+    assert not resultado['eh_bipartido']
+    assert sorted(resultado['ciclo_impar']) == ['A', 'B', 'C']
+    assert digrafo.eh_bipartido(apenas_verificar=True) is False
+    
+    # Conectividade: E só tem um laço
+    assert not vista.is_conexo()
+    componentes = vista.componentes_conexas()
+    assert componentes['num_componentes'] == 2
+    assert list(componentes['tamanhos']) == [4, 1]
+    
+    # Biconexidade: C é articulação e (C, D) é a única ponte (A <-> B não é ponte)
+    blocos = vista.determinar_articulacoes_blocos()
+    print(f"Articulações: {blocos['articulacoes']}")
+    print(f"Blocos: {blocos['blocos']}")
+    assert blocos['articulacoes'] == {'C'}
+    assert sorted(sorted(b) for b in blocos['blocos']) == [['A', 'B', 'C'], ['C', 'D']]
+    pontes = [digrafo.arcos[i] for i in vista.decomposicao_biconexa()['pontes']]
+    assert pontes == [('D', 'C')]
+    
+    # A vista reaproveita os vetores de extremidades em cache no dígrafo
+    origens, destinos = digrafo.vetores_extremidades()
+    assert digrafo.vetores_extremidades()[0] is origens
+    assert list(origens) == [0, 1, 2, 2, 3, 4] and list(destinos) == [1, 0, 0, 1, 2, 4]
+    
+    # Mesmas respostas do Grafo materializado
+    grafo = digrafo.obter_grafo_subjacente()
+    assert grafo.determinar_articulacoes_blocos()['articulacoes'] == blocos['articulacoes']
+    assert Digrafo({'A', 'B'}, [('A', 'B'), ('B', 'A')]).eh_bipartido()['particoes'] == ({'A'}, {'B'})
+    print("✅ Teste passou!")
+
 def teste_casos_especiais():
     """Testa casos especiais e edge cases para dígrafos."""
     imprimir_separador_teste("TESTE - CASOS ESPECIAIS DÍGRAFO")
@@ -260,6 +307,189 @@ def teste_casos_especiais():
     
     print("✅ Teste 3 passou!")
 
+def teste_matriz_adjacencia_bits():
+    """Testa a matriz de adjacência em bits de um dígrafo (não simétrica)."""
+    imprimir_separador_teste("TESTE - MATRIZ DE ADJACÊNCIA EM BITS (DÍGRAFO)")
+    
+    vertices = {'A', 'B', 'C'}
+    arcos = [('A', 'B'), ('B', 'C'), ('C', 'C')]
+    digrafo = Digrafo(vertices, arcos)
+    
+    matriz_bits = digrafo.criar_matriz_adjacencia(formato='bits')
+    print(f"Matriz em bits: {matriz_bits.para_lista()}")
+    assert matriz_bits == digrafo.criar_matriz_adjacencia()
+    assert matriz_bits[0][1] == 1 and matriz_bits[1][0] == 0
+    assert matriz_bits[2][2] == 1, "Auto-loop na diagonal"
+    acertos = digrafo.cache.acertos
+    matriz_bits[0, 2] = 1
+    assert digrafo.criar_matriz_adjacencia(formato='bits')[0][2] == 0, "Cópia independente"
+    assert digrafo.cache.acertos == acertos + 1, "Resultado em cache"
+    
+    print("✅ Teste passou!")
+
+def teste_matriz_incidencia_esparsa():
+    """Testa a matriz de incidência esparsa de um dígrafo (orientação +1/-1)."""
+    imprimir_separador_teste("TESTE - MATRIZ DE INCIDÊNCIA ESPARSA (DÍGRAFO)")
+    
+    vertices = {'A', 'B', 'C'}
+    arcos = [('A', 'B'), ('C', 'B'), ('B', 'A')]
+    digrafo = Digrafo(vertices, arcos)
+    
+    esparsa = digrafo.criar_matriz_incidencia(formato='esparsa')
+    print(f"Triplas (linha, coluna, valor): {list(esparsa.triplas())}")
+    assert esparsa.para_densa() == digrafo.criar_matriz_incidencia()
+    assert esparsa.coluna(1) == [(2, 1), (1, -1)], "C é origem (+1), B é destino (-1)"
+    assert esparsa.linha(1) == [(0, -1), (1, -1), (2, 1)]
+    
+    try:
+        digrafo.criar_matriz_incidencia(formato='bits')
+        assert False, "Deveria ter lançado ValueError"
+    except ValueError as e:
+        print(f"✅ Exceção capturada: {e}")
+    
+    print("✅ Teste passou!")
+
+def teste_graus_e_predecessores():
+    """Testa os graus de entrada/saída, os histogramas e os predecessores (CSR reversa)."""
+    imprimir_separador_teste("TESTE - GRAUS DE ENTRADA/SAÍDA E PREDECESSORES")
+    
+    vertices = {'A', 'B', 'C', 'D'}
+    arcos = [('C', 'B'), ('A', 'B'), ('B', 'C'), ('B', 'B'), ('A', 'B')]
+    digrafo = Digrafo(vertices, arcos)
+    
+    print(f"Graus de entrada: {list(digrafo.vetor_graus_entrada())}")
+    print(f"Graus de saída: {list(digrafo.vetor_graus_saida())}")
+    assert list(digrafo.vetor_graus_entrada()) == [0, 4, 1, 0], "Laço e arco paralelo contam"
+    assert list(digrafo.vetor_graus_saida()) == [2, 2, 1, 0]
+    assert digrafo.get_grau_entrada('B') == 4 and digrafo.get_grau_saida('D') == 0
+    
+    assert digrafo.histograma_graus('entrada') == [2, 1, 0, 0, 1]
+    assert digrafo.histograma_graus() == [1, 1, 2]
+    assert digrafo.histograma_graus('total') == [1, 0, 2, 0, 0, 0, 1]
+    
+    print(f"Predecessores de B: {digrafo.predecessores('B')}")
+    assert digrafo.predecessores('B') == ['A', 'A', 'B', 'C']
+    assert digrafo.predecessores('A') == []
+    # A CSR reversa é a transposta da CSR de saída
+    reversa = digrafo.obter_csr_reversa().para_lista_adjacencia(digrafo.vertices_ordenados)
+    for vertice, sucessores in digrafo.criar_lista_adjacencia().items():
+        for sucessor in sucessores:
+            assert vertice in reversa[sucessor]
+    
+    for consulta in (lambda: digrafo.predecessores('Z'),
+                     lambda: digrafo.get_grau_entrada('Z'),
+                     lambda: digrafo.histograma_graus('misto')):
+        try:
+            consulta()
+            assert False, "Deveria ter lançado ValueError"
+        except ValueError as e:
+            print(f"✅ Exceção capturada: {e}")
+    
+    print("✅ Teste passou!")
+
+def teste_componentes_fortemente_conexas():
+    """Testa as componentes fortemente conexas (Tarjan iterativo) e a condensação."""
+    imprimir_separador_teste("TESTE - COMPONENTES FORTEMENTE CONEXAS E CONDENSAÇÃO")
+    
+    # Ciclos {A, B, C} e {D, E}, ligados por C -> D (duas vezes) e B -> E; F isolado
+    vertices = {'A', 'B', 'C', 'D', 'E', 'F'}
+    arcos = [('A', 'B'), ('B', 'C'), ('C', 'A'), ('C', 'D'), ('C', 'D'),
+             ('B', 'E'), ('D', 'E'), ('E', 'D')]
+    digrafo = Digrafo(vertices, arcos)
+    
+    resultado = digrafo.componentes_fortemente_conexas()
+    componente = resultado['componente']
+    print(f"Componentes: {dict(zip(digrafo.vertices_ordenados, componente))}")
+    assert resultado['num_componentes'] == 3
+    assert componente[0] == componente[1] == componente[2], "A, B e C no mesmo ciclo"
+    assert componente[3] == componente[4] != componente[0]
+    assert digrafo.componente_fortemente_conexa_de('F') not in (componente[0], componente[3])
+    # IDs em ordem topológica: {A, B, C} vem antes de {D, E}
+    assert componente[0] < componente[3]
+    
+    condensacao = digrafo.condensacao()
+    dag = condensacao['digrafo']
+    print(f"Condensação: {dag.vertices_ordenados} {dag.arcos}")
+    print(f"Tamanhos: {list(condensacao['tamanhos'])}")
+    assert isinstance(dag, Digrafo)
+    assert list(dag.vertices_ordenados) == [0, 1, 2]
+    assert dag.arcos == [(componente[0], componente[3])], "Arcos paralelos e internos descartados"
+    assert sorted(condensacao['tamanhos']) == [1, 2, 3]
+    assert condensacao['tamanhos'][componente[0]] == 3
+    assert dag.componentes_fortemente_conexas()['num_componentes'] == 3, "Condensação é acíclica"
+    assert dag.busca_em_largura(componente[0])['alcancaveis'] == {componente[0], componente[3]}
+    
+    # Caminho longo em ciclo: sem recursão, uma única componente
+    n = 50000
+    ciclo = Digrafo(set(range(n)), [(i, (i + 1) % n) for i in range(n)])
+    assert ciclo.componentes_fortemente_conexas()['num_componentes'] == 1
+    
+    try:
+        digrafo.componente_fortemente_conexa_de('Z')
+        assert False, "Deveria ter lançado ValueError"
+    except ValueError as e:
+        print(f"✅ Exceção capturada: {e}")
+    
+    print("✅ Teste passou!")
+
+def teste_ordenacao_topologica():
+    """Testa as ordenações topológicas (Kahn e DFS), o gerador, as camadas e os ciclos."""
+    imprimir_separador_teste("TESTE - ORDENAÇÃO TOPOLÓGICA")
+    
+    # Dependências de compilação: cada arco vai da dependência para quem a usa
+    vertices = {'base', 'util', 'rede', 'app', 'docs'}
+    arcos = [('base', 'util'), ('base', 'rede'), ('util', 'app'), ('rede', 'app')]
+    dag = Digrafo(vertices, arcos)
+    
+    for metodo in ('kahn', 'dfs'):
+        resultado = dag.ordenacao_topologica(metodo)
+        print(f"Ordem ({metodo}): {resultado['ordem']}")
+        assert resultado['eh_aciclico'] and resultado['ciclo'] is None
+        posicao = {v: i for i, v in enumerate(resultado['ordem'])}
+        assert sorted(posicao) == sorted(vertices)
+        assert all(posicao[u] < posicao[v] for u, v in arcos)
+    assert dag.ordenacao_topologica()['ordem'] == ['base', 'docs', 'util', 'rede', 'app']
+    assert list(dag.iterar_ordenacao_topologica()) == dag.ordenacao_topologica()['ordem']
+    assert dag.eh_aciclico()
+    
+    camadas = dag.camadas_topologicas()['camadas']
+    print(f"Camadas: {camadas}")
+    assert camadas == [['base', 'docs'], ['util', 'rede'], ['app']]
+    
+    # Ciclos entre util, rede e app: nenhuma ordem, e um ciclo válido é devolvido
+    ciclico = Digrafo(vertices, arcos + [('util', 'rede'), ('app', 'util')])
+    for metodo in ('kahn', 'dfs'):
+        resultado = ciclico.ordenacao_topologica(metodo)
+        print(f"Ciclo ({metodo}): {resultado['ciclo']}")
+        assert not resultado['eh_aciclico'] and resultado['ordem'] is None
+        ciclo = resultado['ciclo']
+        assert set(ciclo) <= {'app', 'rede', 'util'} and len(ciclo) >= 2
+        assert all((ciclo[i], ciclo[(i + 1) % len(ciclo)]) in ciclico.arcos
+                   for i in range(len(ciclo)))
+    assert not ciclico.eh_aciclico()
+    assert ciclico.camadas_topologicas()['camadas'] is None
+    
+    # O gerador entrega as fontes antes de descobrir o ciclo
+    gerados = []
+    try:
+        for vertice in ciclico.iterar_ordenacao_topologica():
+            gerados.append(vertice)
+        assert False, "Deveria ter lançado CicloEncontrado"
+    except ValueError as e:
+        print(f"✅ Exceção capturada: {e} {e.ciclo}")
+        assert set(e.ciclo) <= {'app', 'rede', 'util'}
+    assert gerados == ['base', 'docs']
+    
+    assert Digrafo({'a'}, [('a', 'a')]).ordenacao_topologica('dfs')['ciclo'] == ['a']
+    
+    try:
+        dag.ordenacao_topologica('bfs')
+        assert False, "Deveria ter lançado ValueError"
+    except ValueError as e:
+        print(f"✅ Exceção capturada: {e}")
+    
+    print("✅ Teste passou!")
+
 def executar_todos_os_testes():
     """Executa toda a bateria de testes para a classe Digrafo."""
     imprimir_cabecalho_teste("BATERIA DE TESTES PARA A CLASSE DIGRAFO")
@@ -269,7 +499,13 @@ def executar_todos_os_testes():
     teste_busca_profundidade()
     teste_grafo_subjacente()
     teste_digrafo_bipartido()
+    teste_vista_subjacente()
     teste_casos_especiais()
+    teste_matriz_adjacencia_bits()
+    teste_matriz_incidencia_esparsa()
+    teste_graus_e_predecessores()
+    teste_componentes_fortemente_conexas()
+    teste_ordenacao_topologica()
     
     imprimir_cabecalho_teste("TODOS OS TESTES DA CLASSE DIGRAFO FORAM CONCLUÍDOS")
 
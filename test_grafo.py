@@ -5,7 +5,11 @@ Testes automatizados para a classe Grafo
 - Verificação de grafo bipartido
 """
 
+import random
+
 from grafo import Grafo
+from matriz_numpy import NUMPY_DISPONIVEL
+from utils import converter_lista_para_matriz, converter_matriz_para_lista
 
 def imprimir_cabecalho_teste(titulo):
     """Imprime um cabeçalho formatado para os testes."""
@@ -139,6 +143,34 @@ def teste_grafo_bipartido():
         print(f"Partição 2: {sorted(resultado5['particoes'][1])}")
     print("✅ Teste 5 passou!")
 
+def teste_ciclo_impar_certificado():
+    """Testa o ciclo ímpar reconstruído pela árvore da BFS e o modo só verificação."""
+    imprimir_separador_teste("TESTE - CICLO ÍMPAR CERTIFICADO")
+    
+    # Ciclo de 5 vértices com uma cauda: o conflito aparece longe da raiz
+    vertices = {'A', 'B', 'C', 'D', 'E', 'F'}
+    arestas = [('F', 'A'), ('A', 'B'), ('B', 'C'), ('C', 'D'), ('D', 'E'), ('E', 'A')]
+    grafo = Grafo(vertices, arestas)
+    
+    resultado = grafo.eh_bipartido()
+    ciclo = resultado['ciclo_impar']
+    print(f"Ciclo ímpar encontrado: {ciclo}")
+    assert not resultado['eh_bipartido']
+    assert len(ciclo) == 5 and set(ciclo) == {'A', 'B', 'C', 'D', 'E'}
+    pares = {frozenset(aresta) for aresta in arestas}
+    for i, v in enumerate(ciclo):
+        assert frozenset((v, ciclo[(i + 1) % len(ciclo)])) in pares
+    
+    # Laço: o próprio vértice é um ciclo ímpar
+    grafo_laco = Grafo({'A', 'B'}, [('A', 'B'), ('B', 'B')])
+    assert grafo_laco.eh_bipartido()['ciclo_impar'] == ['B']
+    
+    # Modo só verificação: apenas o booleano
+    assert grafo.eh_bipartido(apenas_verificar=True) is False
+    assert Grafo({'A', 'B', 'C'}, [('A', 'B'), ('B', 'C')]).eh_bipartido(apenas_verificar=True) is True
+    assert Grafo(set(), []).eh_bipartido(apenas_verificar=True) is True
+    print("✅ Teste passou!")
+
 def teste_casos_especiais():
     """Testa casos especiais e edge cases."""
     imprimir_separador_teste("TESTE - CASOS ESPECIAIS")
@@ -177,6 +209,441 @@ def teste_casos_especiais():
         print(f"Partição 2: {sorted(resultado3['particoes'][1])}")
     print("✅ Teste 3 passou!")
 
+def teste_representacao_csr():
+    """Testa a representação CSR compartilhada pelos algoritmos."""
+    imprimir_separador_teste("TESTE - REPRESENTAÇÃO CSR")
+    
+    # Caminho A---B---C com o vértice D isolado
+    vertices = {'A', 'B', 'C', 'D'}
+    arestas = [('A', 'B'), ('B', 'C')]
+    grafo = Grafo(vertices, arestas)
+    
+    csr = grafo.obter_csr()
+    print(f"offsets: {list(csr.offsets)}")
+    print(f"vizinhos: {list(csr.vizinhos)}")
+    print(f"ids_arestas: {list(csr.ids_arestas)}")
+    
+    assert list(csr.offsets) == [0, 1, 3, 4, 4], "Offsets incorretos"
+    assert list(csr.vizinhos_de(grafo.mapa_vertices['B'])) == [0, 2], "Vizinhos de B deveriam ser A e C"
+    assert list(csr.arestas_de(grafo.mapa_vertices['B'])) == [0, 1], "B incide nas arestas 0 e 1"
+    assert csr.grau(grafo.mapa_vertices['D']) == 0, "D deveria estar isolado"
+    assert grafo.obter_csr() is csr, "A CSR deveria ser construída uma única vez"
+    
+    # A lista de adjacência é um adaptador sobre a CSR
+    assert grafo.criar_lista_adjacencia() == {'A': ['B'], 'B': ['A', 'C'], 'C': ['B'], 'D': []}
+    
+    # Modificar o grafo descarta a CSR anterior
+    grafo.incluir_vertice('E', [('E', 'D')])
+    assert grafo.obter_csr() is not csr, "A CSR deveria ser reconstruída após modificação"
+    assert grafo.criar_lista_adjacencia()['D'] == ['E']
+    
+    print("✅ Teste passou!")
+
+def teste_cache_representacoes():
+    """Testa o reaproveitamento e a invalidação do cache de representações."""
+    imprimir_separador_teste("TESTE - CACHE DE REPRESENTAÇÕES")
+    
+    vertices = {'A', 'B', 'C'}
+    arestas = [('A', 'B'), ('B', 'C')]
+    grafo = Grafo(vertices, arestas)
+    
+    lista1 = grafo.criar_lista_adjacencia()
+    matriz1 = grafo.criar_matriz_adjacencia()
+    inicial = grafo.cache.estatisticas()
+    lista2 = grafo.criar_lista_adjacencia()
+    matriz2 = grafo.criar_matriz_adjacencia()
+    
+    estatisticas = grafo.cache.estatisticas()
+    print(f"Estatísticas após consultas repetidas: {estatisticas}")
+    
+    assert lista1 == lista2 and matriz1 == matriz2
+    assert estatisticas['acertos'] == inicial['acertos'] + 2, "Consultas repetidas deveriam ser acertos"
+    assert estatisticas['falhas'] == inicial['falhas'], "Sem mutação, nada deveria ser reconstruído"
+    
+    # Cada chamada devolve uma cópia: alterá-la não muda as próximas
+    lista1['A'].append('zzz')
+    matriz1[0][2] = 9
+    grafo.criar_matriz_adjacencia(formato='bits')[0, 2] = 1
+    componentes = grafo.componentes_conexas()
+    componentes['componente'][0] = 7
+    grafo.decomposicao_biconexa()['articulacoes'].add('zzz')
+    assert grafo.criar_lista_adjacencia() == {'A': ['B'], 'B': ['A', 'C'], 'C': ['B']}
+    assert grafo.criar_matriz_adjacencia() == [[0, 1, 0], [1, 0, 1], [0, 1, 0]]
+    assert grafo.criar_matriz_adjacencia(formato='bits')[0][2] == 0
+    assert list(grafo.componentes_conexas()['componente']) == [0, 0, 0]
+    assert grafo.decomposicao_biconexa()['articulacoes'] == {'B'}
+    
+    versao_anterior = grafo.cache.versao
+    grafo.incluir_vertice('D', [('D', 'C')])
+    assert grafo.cache.versao == versao_anterior + 1, "Mutação deveria incrementar a versão"
+    
+    acertos, falhas = grafo.cache.acertos, grafo.cache.falhas
+    lista3 = grafo.criar_lista_adjacencia()
+    assert grafo.cache.falhas > falhas and grafo.cache.acertos == acertos, \
+        "Mutação deveria invalidar o cache"
+    assert lista3['D'] == ['C']
+    
+    grafo.excluir_vertice('A')
+    assert grafo.cache.versao == versao_anterior + 2
+    assert 'A' not in grafo.criar_lista_adjacencia()
+    
+    # is_conexo reaproveita as extremidades em cache e, sem elas, não as monta
+    extremidades = grafo.vetores_extremidades()
+    assert grafo.vetores_extremidades() is extremidades
+    assert grafo.is_conexo() and grafo.cache.consultar('extremidades') is extremidades
+    grafo.incluir_aresta('B', 'D')
+    assert grafo.cache.consultar('extremidades') is None
+    assert grafo.is_conexo() and grafo.cache.consultar('extremidades') is None
+    
+    print("✅ Teste passou!")
+
+def teste_indices_grau_adjacencia():
+    """Testa o vetor de graus e o índice de adjacência mantidos incrementalmente."""
+    imprimir_separador_teste("TESTE - ÍNDICES DE GRAU E ADJACÊNCIA")
+    
+    vertices = {'A', 'B', 'C', 'D'}
+    arestas = [('A', 'B'), ('B', 'C'), ('C', 'D'), ('A', 'C')]
+    grafo = Grafo(vertices, arestas)
+    
+    print(f"Graus: {grafo.get_grau_vertices()}")
+    assert grafo.get_grau('C') == 3, "C participa de 3 arestas"
+    assert grafo.get_grau_vertices() == {'d(A)': 2, 'd(B)': 2, 'd(C)': 3, 'd(D)': 1}
+    
+    pares = [('A', 'B'), ('B', 'A'), ('A', 'D'), ('D', 'C'), ('A', 'Z')]
+    respostas = grafo.sao_adjacentes(pares)
+    print(f"Adjacências em lote {pares}: {respostas}")
+    assert respostas == [True, True, False, True, False]
+    
+    # Inclusão e exclusão atualizam os índices sem reconstruí-los
+    grafo.incluir_vertice('E', [('E', 'A'), ('D', 'E')])
+    assert grafo.get_grau('E') == 2
+    assert grafo.get_grau('A') == 3
+    assert grafo.is_adjacente('A', 'E') and grafo.is_adjacente('E', 'D')
+    
+    grafo.excluir_vertice('C')
+    print(f"Graus após excluir C: {grafo.get_grau_vertices()}")
+    assert grafo.get_grau_vertices() == {'d(A)': 2, 'd(B)': 1, 'd(D)': 1, 'd(E)': 2}
+    assert not grafo.is_adjacente('B', 'C')
+    
+    try:
+        grafo.get_grau('C')
+        assert False, "Deveria ter lançado ValueError"
+    except ValueError as e:
+        print(f"✅ Exceção capturada: {e}")
+    
+    print("✅ Teste passou!")
+
+def teste_matriz_adjacencia_bits():
+    """Testa a matriz de adjacência compactada em bits."""
+    imprimir_separador_teste("TESTE - MATRIZ DE ADJACÊNCIA EM BITS")
+    
+    vertices = {'A', 'B', 'C', 'D'}
+    arestas = [('A', 'B'), ('B', 'C'), ('C', 'D'), ('A', 'C')]
+    grafo = Grafo(vertices, arestas)
+    
+    matriz = grafo.criar_matriz_adjacencia()
+    matriz_bits = grafo.criar_matriz_adjacencia(formato='bits')
+    print(f"Matriz em bits: {matriz_bits.para_lista()}")
+    assert matriz_bits == matriz
+    assert len(matriz_bits) == 4 and len(matriz_bits.dados) == 4, "1 byte por linha"
+    assert matriz_bits[0][1] == 1 and matriz_bits[0, 3] == 0
+    assert list(matriz_bits[2]) == [1, 1, 0, 1]
+    assert matriz_bits.indices_linha(2) == [0, 1, 3]
+    
+    # Vizinhos de A ou de D; vizinhos comuns de A e D
+    assert matriz_bits.ou_linhas(0, 3) == 0b0110
+    assert matriz_bits.e_linhas(0, 3) == 0b0100
+    
+    # Conversões em utils
+    lista = grafo.criar_lista_adjacencia()
+    convertida = converter_lista_para_matriz(lista, grafo.vertices_ordenados, formato='bits')
+    assert convertida == matriz_bits
+    assert converter_matriz_para_lista(convertida, grafo.vertices_ordenados) == \
+           converter_matriz_para_lista(matriz, grafo.vertices_ordenados)
+    
+    try:
+        grafo.criar_matriz_adjacencia(formato='csv')
+        assert False, "Deveria ter lançado ValueError"
+    except ValueError as e:
+        print(f"✅ Exceção capturada: {e}")
+    
+    print("✅ Teste passou!")
+
+def teste_matriz_incidencia_esparsa():
+    """Testa a matriz de incidência esparsa (acesso por aresta e por vértice)."""
+    imprimir_separador_teste("TESTE - MATRIZ DE INCIDÊNCIA ESPARSA")
+    
+    vertices = {'A', 'B', 'C', 'D'}
+    arestas = [('A', 'B'), ('B', 'C'), ('C', 'D'), ('A', 'C'), ('D', 'D')]
+    grafo = Grafo(vertices, arestas)
+    
+    esparsa = grafo.criar_matriz_incidencia(formato='esparsa')
+    print(f"Não nulos: {esparsa.num_nao_nulos()} (densa teria {4 * 5} células)")
+    assert esparsa.num_nao_nulos() == 9, "Laço em D ocupa uma única célula"
+    assert esparsa.para_densa() == grafo.criar_matriz_incidencia()
+    
+    # Coluna = extremidades da aresta; linha = arestas incidentes ao vértice
+    assert esparsa.coluna(3) == [(0, 1), (2, 1)]
+    assert esparsa.linha(2) == [(1, 1), (2, 1), (3, 1)]
+    assert esparsa[0, 0] == 1 and esparsa[3, 0] == 0
+    
+    print("✅ Teste passou!")
+
+def teste_backend_numpy():
+    """Testa o backend opcional em NumPy (ou o erro claro quando ele não está instalado)."""
+    imprimir_separador_teste("TESTE - BACKEND NUMPY (OPCIONAL)")
+    
+    vertices = {'A', 'B', 'C', 'D'}
+    arestas = [('A', 'B'), ('B', 'C'), ('C', 'D'), ('A', 'C')]
+    grafo = Grafo(vertices, arestas)
+    
+    if not NUMPY_DISPONIVEL:
+        print("NumPy não instalado: verificando apenas a mensagem de erro")
+        try:
+            grafo.criar_matriz_adjacencia(formato='numpy')
+            assert False, "Deveria ter lançado ImportError"
+        except ImportError as e:
+            print(f"✅ Exceção capturada: {e}")
+        print("✅ Teste passou!")
+        return
+    
+    matriz = grafo.criar_matriz_adjacencia()
+    matriz_np = grafo.criar_matriz_adjacencia(formato='numpy')
+    print(f"Matriz ndarray ({matriz_np.dtype}):\n{matriz_np}")
+    assert matriz_np.tolist() == matriz
+    
+    lista = grafo.criar_lista_adjacencia()
+    convertida = converter_lista_para_matriz(lista, grafo.vertices_ordenados, formato='numpy')
+    assert convertida.tolist() == matriz
+    assert converter_matriz_para_lista(matriz_np, grafo.vertices_ordenados) == \
+           converter_matriz_para_lista(matriz, grafo.vertices_ordenados)
+    
+    print("✅ Teste passou!")
+
+def teste_matriz_crescente():
+    """Testa a matriz com capacidade de sobra, lápides e compactação."""
+    imprimir_separador_teste("TESTE - MATRIZ DE ADJACÊNCIA CRESCENTE")
+    
+    vertices = {'A', 'B', 'C', 'D'}
+    arestas = [('A', 'B'), ('B', 'C'), ('C', 'D'), ('A', 'C')]
+    grafo = Grafo(vertices, arestas)
+    
+    matriz = grafo.criar_matriz_adjacencia(formato='crescente')
+    assert matriz.para_lista() == grafo.criar_matriz_adjacencia()
+    assert matriz is not grafo.criar_matriz_adjacencia(formato='crescente'), "Não deveria vir do cache"
+    
+    # Inclusões e exclusões intercaladas, conferidas contra o próprio Grafo
+    random.seed(7)
+    for i in range(60):
+        novo = f"N{i:02d}"
+        existentes = grafo.vertices_ordenados
+        escolhidos = random.sample(existentes, min(3, len(existentes)))
+        grafo.incluir_vertice(novo, [(novo, v) for v in escolhidos])
+        matriz.incluir_vertice(novo, escolhidos)
+        if i % 3 == 2:
+            removido = random.choice(grafo.vertices_ordenados)
+            grafo.excluir_vertice(removido)
+            matriz.excluir_vertice(removido)
+        assert matriz.vertices_ordenados() == grafo.vertices_ordenados
+        assert matriz.para_lista() == grafo.criar_matriz_adjacencia(), f"Matriz divergente no passo {i}"
+    
+    print(f"Vértices: {matriz.num_vertices}; capacidade: {matriz.capacidade}; "
+          f"lápides: {matriz.num_lapides}")
+    assert matriz.capacidade >= matriz.num_vertices
+    assert 2 * matriz.num_lapides <= len(matriz.rotulos), "Lápides deveriam ter sido compactadas"
+    
+    v = grafo.vertices_ordenados[0]
+    assert sorted(matriz.vizinhos(v)) == sorted(set(grafo.criar_lista_adjacencia()[v]))
+    matriz.incluir_vertice('laco', ['laco', v])
+    assert matriz.existe_aresta('laco', 'laco') and matriz.existe_aresta(v, 'laco')
+    
+    for invalido in (lambda: matriz.incluir_vertice(v), lambda: matriz.excluir_vertice('Z'),
+                     lambda: matriz.incluir_vertice('Z', ['inexistente'])):
+        try:
+            invalido()
+            assert False, "Deveria ter lançado ValueError"
+        except ValueError as e:
+            print(f"✅ Exceção capturada: {e}")
+    assert 'Z' not in matriz, "Inclusão inválida não deveria alterar a matriz"
+    
+    # de_csr começa na menor potência de 2 que comporta os vértices
+    grande = Grafo(set(range(40)), [(i, i + 1) for i in range(39)])
+    matriz = grande.criar_matriz_adjacencia(formato='crescente')
+    assert matriz.capacidade == 64 and len(matriz.linhas) == 64
+    
+    # Exclusões em massa: a compactação devolve a capacidade que sobrou
+    for i in range(36):
+        matriz.excluir_vertice(i)
+    print(f"Após excluir 36 de 40 vértices: capacidade {matriz.capacidade}")
+    assert matriz.capacidade == 16, "4 vértices vivos em 64 slots: a capacidade deveria cair duas vezes"
+    assert len(matriz.linhas) == matriz.capacidade
+    assert all(len(linha) == matriz.capacidade for linha in matriz.linhas)
+    assert matriz.para_lista() == [[0, 1, 0, 0], [1, 0, 1, 0], [0, 1, 0, 1], [0, 0, 1, 0]]
+    for i in range(10):
+        matriz.incluir_vertice(100 + i, [39])
+    assert matriz.num_vertices == 14 and matriz.capacidade >= 14
+    
+    print("✅ Teste passou!")
+
+def teste_api_mutacao():
+    """Testa a API de inclusão/exclusão de arestas e vértices com IDs estáveis."""
+    imprimir_separador_teste("TESTE - API DE MUTAÇÃO (IDS ESTÁVEIS)")
+    
+    grafo = Grafo({'B', 'C'}, [('B', 'C')])
+    id_b = grafo.id_vertice('B')
+    
+    ids = grafo.incluir_vertices(['D', 'A'])
+    assert grafo.vertices_ordenados == ['A', 'B', 'C', 'D'], "Visão ordenada após inclusões"
+    assert grafo.id_vertice('B') == id_b, "O ID não muda com a inclusão de outros vértices"
+    assert ids == [grafo.id_vertice('D'), grafo.id_vertice('A')]
+    
+    ids_arestas = grafo.incluir_arestas([('A', 'B'), ('C', 'D'), ('A', 'B')])
+    print(f"Arestas: {grafo.arestas} (IDs incluídos: {ids_arestas})")
+    assert grafo.num_arestas == 4 and grafo.get_grau('A') == 2
+    
+    # Remove uma das arestas paralelas (a incluída primeiro), em qualquer orientação
+    assert grafo.excluir_aresta('B', 'A') == ids_arestas[0]
+    assert grafo.arestas == [('B', 'C'), ('C', 'D'), ('A', 'B')]
+    assert grafo.is_adjacente('A', 'B') and grafo.get_grau('B') == 2
+    
+    grafo.excluir_vertices(['C'])
+    assert grafo.arestas == [('A', 'B')]
+    assert grafo.mapa_vertices == {'A': 0, 'B': 1, 'D': 2}
+    assert grafo.id_vertice('B') == id_b
+    assert grafo.criar_lista_adjacencia() == {'A': ['B'], 'B': ['A'], 'D': []}
+    
+    # Operações em lote validam tudo antes de modificar
+    try:
+        grafo.excluir_arestas([('A', 'B'), ('A', 'B')])
+        assert False, "Deveria ter lançado ValueError"
+    except ValueError as e:
+        print(f"✅ Exceção capturada: {e}")
+    assert grafo.num_arestas == 1, "Nenhuma aresta deveria ter sido removida"
+    
+    # Nomes em inglês
+    grafo.add_edge('A', 'D')
+    grafo.remove_vertex('A')
+    assert grafo.vertices_ordenados == ['B', 'D'] and grafo.num_arestas == 0
+    
+    print("✅ Teste passou!")
+
+def teste_visoes_ordenadas_compartilhadas():
+    """Testa que as visões ordenadas não duplicam os rótulos e sobrevivem a mutações."""
+    imprimir_separador_teste("TESTE - VISÕES ORDENADAS SEM CÓPIA")
+    
+    grafo = Grafo({'C', 'A', 'B'}, [('A', 'B'), ('B', 'C')])
+    vertices = grafo.vertices_ordenados
+    mapa = grafo.mapa_vertices
+    assert vertices is grafo._rotulos and mapa is grafo._id_por_rotulo, \
+        "Antes de mutações, as visões deveriam ser as próprias estruturas por ID"
+    
+    grafo.incluir_vertice('AA', [('AA', 'C')])
+    grafo.excluir_vertice('B')
+    assert vertices == ['A', 'B', 'C'] and dict(mapa) == {'A': 0, 'B': 1, 'C': 2}, \
+        "Visões entregues antes da mutação não deveriam mudar"
+    assert grafo.vertices_ordenados == ['A', 'AA', 'C']
+    assert grafo.mapa_vertices == {'A': 0, 'AA': 1, 'C': 2}
+    assert grafo.id_vertice('AA') == 3 and grafo.arestas == [('AA', 'C')]
+    
+    print("✅ Teste passou!")
+
+def teste_conectividade_incremental():
+    """Testa a conectividade mantida durante as inclusões e remontada após exclusões."""
+    imprimir_separador_teste("TESTE - CONECTIVIDADE INCREMENTAL")
+    
+    grafo = Grafo({'a', 'b', 'c'}, [('a', 'b')])
+    grafo.ativar_conectividade_incremental()
+    assert grafo.num_componentes_conexas() == 2
+    assert grafo.mesma_componente('a', 'b') and not grafo.mesma_componente('a', 'c')
+    
+    # Cada inclusão atualiza a estrutura, sem recalcular o grafo inteiro
+    grafo.incluir_vertice('d', [('d', 'c')])
+    assert grafo.num_componentes_conexas() == 2 and not grafo.is_conexo()
+    grafo.incluir_vertice('e', [('e', 'a'), ('e', 'd')])
+    print(f"Após incluir 'e': {grafo.num_componentes_conexas()} componente(s)")
+    assert grafo.is_conexo() and grafo.mesma_componente('b', 'c')
+    grafo.incluir_vertices(['f'])
+    assert grafo.num_componentes_conexas() == 2
+    grafo.incluir_aresta('f', 'b')
+    assert grafo.is_conexo()
+    
+    # Excluir 'e' separa {a, b, f} de {c, d}: a estrutura é remontada
+    grafo.excluir_vertice('e')
+    print(f"Após excluir 'e': {grafo.num_componentes_conexas()} componente(s)")
+    assert grafo.num_componentes_conexas() == 2
+    assert not grafo.mesma_componente('a', 'd') and grafo.mesma_componente('f', 'a')
+    grafo.excluir_aresta('c', 'd')
+    assert grafo.num_componentes_conexas() == 3
+    assert grafo.num_componentes_conexas() == grafo.componentes_conexas()['num_componentes']
+    
+    grafo.desativar_conectividade_incremental()
+    assert not grafo.mesma_componente('c', 'd') and not grafo.is_conexo()
+    
+    try:
+        grafo.mesma_componente('a', 'z')
+        assert False, "Deveria ter lançado ValueError"
+    except ValueError as e:
+        print(f"✅ Exceção capturada: {e}")
+    
+    # Arestas para vértices inexistentes são ignoradas, como em is_conexo
+    pendente = Grafo({'a', 'b'}, [('a', 'c'), ('a', 'b')])
+    pendente.ativar_conectividade_incremental()
+    assert pendente.is_conexo() and pendente.num_componentes_conexas() == 1
+    # Incluído o vértice, a aresta (a, c) passa a valer
+    pendente.incluir_vertice('c')
+    assert pendente.num_componentes_conexas() == 1 and pendente.mesma_componente('b', 'c')
+    
+    print("✅ Teste passou!")
+
+def teste_vistas_mascaradas():
+    """Testa as vistas de subgrafo induzido e de vértices/arestas ocultos."""
+    imprimir_separador_teste("TESTE - VISTAS MASCARADAS")
+    
+    # Caminho a-b-c-d com a corda (a, c)
+    grafo = Grafo({'a', 'b', 'c', 'd'}, [('a', 'b'), ('b', 'c'), ('c', 'd'), ('a', 'c')])
+    
+    # "E se 'c' for removido?": 'd' fica isolado, sem tocar no grafo
+    sem_c = grafo.mascarar(vertices=['c'])
+    print(f"Sem 'c': {sem_c.criar_lista_adjacencia()}")
+    assert sem_c.vertices() == ['a', 'b', 'd']
+    assert sem_c.num_arestas() == 1 and sem_c.grau('a') == 1
+    assert not sem_c.is_conexo()
+    assert sem_c.componentes_conexas()['num_componentes'] == 2
+    assert grafo.is_conexo() and grafo.num_arestas == 4
+    
+    # Ocultando a aresta (b, c) (ID 1), 'b' só alcança 'c' passando por 'a'
+    sem_bc = grafo.mascarar(arestas=[1])
+    assert sem_bc.busca_em_largura('b')['distancias'] == {'b': 0, 'a': 1, 'c': 2, 'd': 3}
+    assert sem_bc.mascarar(vertices=['a']).busca_em_largura('b')['alcancaveis'] == {'b'}
+    
+    # Subgrafo induzido por {a, b, d}: só a aresta (a, b)
+    induzido = grafo.subgrafo_induzido(['a', 'b', 'd'])
+    assert induzido.num_vertices == 3 and induzido.num_arestas() == 1
+    assert induzido.vizinhos('a') == ['b'] and not induzido.contem_vertice('c')
+    por_gerador = grafo.subgrafo_induzido(v for v in 'abd')
+    assert por_gerador.num_vertices == 3 and por_gerador.num_arestas() == 1
+    
+    try:
+        induzido.vizinhos('c')
+        assert False, "Deveria ter lançado ValueError"
+    except ValueError as e:
+        print(f"✅ Exceção capturada: {e}")
+    
+    # Depois de uma mutação, a vista deixa de valer
+    grafo.incluir_aresta('b', 'd')
+    try:
+        induzido.num_vertices
+        assert False, "Deveria ter lançado ValueError"
+    except ValueError as e:
+        print(f"✅ Exceção capturada: {e}")
+    try:
+        sem_c.is_conexo()
+        assert False, "Deveria ter lançado ValueError"
+    except ValueError as e:
+        print(f"✅ Exceção capturada: {e}")
+    
+    print("✅ Teste passou!")
+
 # ==============================================================================
 # TESTES ITEM 9 - INCLUSÃO DE VÉRTICE
 # ==============================================================================
@@ -534,6 +1001,64 @@ def teste_item_10_excluir_vertice_com_arestas_parciais():
     
     print("✅ Teste passou!")
 
+def teste_item_10_versoes_persistentes():
+    imprimir_separador_teste("ITEM 10.9 - Versões Persistentes (Itens 9 e 10 Encadeados)")
+    
+    vertices = {f"v{i:03d}" for i in range(0, 200, 2)}
+    arestas = [(f"v{i:03d}", f"v{(i + 2) % 200:03d}") for i in range(0, 200, 2)]
+    grafo = Grafo(vertices, arestas)
+    
+    lista_adj = grafo.criar_lista_adjacencia()
+    referencia = {v: list(vizinhos) for v, vizinhos in lista_adj.items()}
+    versoes = [grafo.incluir_vertice_lista_adjacencia(lista_adj, 'v001', [('v001', 'v000')])]
+    referencia['v001'] = ['v000']
+    referencia['v000'] = referencia['v000'] + ['v001']
+    
+    # Muitas versões encadeadas, conferidas contra um dicionário comum
+    for i in range(3, 200, 2):
+        novo = f"v{i:03d}"
+        anterior = f"v{i - 2:03d}"
+        versoes.append(grafo.incluir_vertice_lista_adjacencia(
+            versoes[-1], novo, [(novo, anterior), (novo, novo)]))
+        referencia[anterior] = referencia[anterior] + [novo]
+        referencia[novo] = [anterior, novo]
+    for i in range(0, 200, 6):
+        removido = f"v{i:03d}"
+        versoes.append(grafo.excluir_vertice_lista_adjacencia(versoes[-1], removido))
+        for vizinho in referencia.pop(removido):
+            if vizinho != removido:
+                referencia[vizinho] = [v for v in referencia[vizinho] if v != removido]
+    
+    final = versoes[-1]
+    assert list(final) == sorted(referencia), "Vértices deveriam seguir a ordem crescente"
+    assert dict(final.items()) == referencia, "Versão final deveria coincidir com a referência"
+    
+    # Versões anteriores e a lista original não mudam; linhas não afetadas são compartilhadas
+    assert lista_adj == grafo.criar_lista_adjacencia(), "A lista original não deveria mudar"
+    assert 'v199' not in versoes[50] and 'v101' in versoes[50], "Versão antiga deveria ser preservada"
+    assert versoes[1]['v150'] is lista_adj['v150'], "Linha não afetada deveria ser compartilhada"
+    
+    # Matriz persistente: encadeada e conferida contra a matriz densa da referência
+    matriz = grafo.criar_matriz_adjacencia(formato='persistente')
+    assert matriz == grafo.criar_matriz_adjacencia(), "Matriz persistente deveria coincidir com a densa"
+    matriz_nova, rotulos, mapa = grafo.incluir_vertice_matriz_adjacencia(
+        matriz, 'v001', [('v000', 'v001'), ('v001', 'v198')])
+    matriz_nova, rotulos, mapa = grafo.incluir_vertice_matriz_adjacencia(
+        matriz_nova, 'v003', [('v003', 'v001')])
+    matriz_nova, rotulos, mapa = grafo.excluir_vertice_matriz_adjacencia(matriz_nova, 'v000')
+    
+    esperado = Grafo(
+        (vertices | {'v001', 'v003'}) - {'v000'},
+        [a for a in arestas if 'v000' not in a] + [('v001', 'v198'), ('v001', 'v003')]
+    )
+    assert rotulos == esperado.vertices_ordenados, "Ordem dos vértices incorreta"
+    assert mapa['v003'] == esperado.mapa_vertices['v003'], "Mapa de posições incorreto"
+    assert matriz_nova == esperado.criar_matriz_adjacencia(), "Matriz encadeada incorreta"
+    assert len(matriz) == 100 and matriz[0][1] == 1, "A matriz original não deveria mudar"
+    
+    print(f"Versões de lista criadas: {len(versoes)}; vértices na final: {len(final)}")
+    print("✅ Teste passou!")
+
 def executar_todos_os_testes():
     """Executa toda a bateria de testes para a classe Grafo."""
     imprimir_cabecalho_teste("BATERIA DE TESTES PARA A CLASSE GRAFO")
@@ -541,7 +1066,19 @@ def executar_todos_os_testes():
     teste_estruturas_basicas()
     teste_propriedades_basicas()
     teste_grafo_bipartido()
+    teste_ciclo_impar_certificado()
     teste_casos_especiais()
+    teste_representacao_csr()
+    teste_cache_representacoes()
+    teste_indices_grau_adjacencia()
+    teste_matriz_adjacencia_bits()
+    teste_matriz_incidencia_esparsa()
+    teste_backend_numpy()
+    teste_matriz_crescente()
+    teste_api_mutacao()
+    teste_visoes_ordenadas_compartilhadas()
+    teste_conectividade_incremental()
+    teste_vistas_mascaradas()
     
     # Testes de Inclusão de Vértices (Item 9)
     imprimir_cabecalho_teste("TESTES ITEM 9 - INCLUSÃO DE VÉRTICE")
@@ -566,6 +1103,7 @@ def executar_todos_os_testes():
     teste_item_10_excluir_vertice_do_grafo()
     teste_item_10_excluir_vertice_central_do_grafo()
     teste_item_10_excluir_vertice_com_arestas_parciais()
+    teste_item_10_versoes_persistentes()
     
     imprimir_cabecalho_teste("TODOS OS TESTES DA CLASSE GRAFO FORAM CONCLUÍDOS")
 
@@ -0,0 +1,173 @@
+"""
+Estrutura de união e busca (union-find) para componentes conexas.
+
+Os elementos são os índices 0..n-1 dos vértices. O estado fica em vetores:
+- pais: o pai de cada elemento na floresta (as raízes apontam para si mesmas);
+- postos: limite superior da altura de cada árvore (união por posto, em bytes);
+- tamanhos: quantidade de elementos de cada árvore (válido nas raízes).
+
+Com compressão de caminho na busca e união por posto, qualquer sequência de m
+operações custa O(m α(n)), praticamente constante por operação. Novos elementos
+podem ser acrescentados a qualquer momento (ver `adicionar`), o que permite
+manter a conectividade enquanto o grafo cresce.
+"""
+
+from array import array
+
+from csr import tipo_indice, vetor_preenchido
+
+
+class UniaoBusca:
+    """
+    Conjuntos disjuntos sobre os elementos 0..n-1, com contagem de componentes.
+    """
+
+    def __init__(self, num_elementos=0):
+        """
+        Inicializa cada elemento em seu próprio conjunto.
+
+        Args:
+            num_elementos (int): Quantidade inicial de elementos
+        """
+        # Vetores de 64 bits: a estrutura pode crescer além de 2**31 elementos
+        self.pais = array('q', range(num_elementos))
+        self.postos = bytearray(num_elementos)
+        self.tamanhos = vetor_preenchido('q', 1, num_elementos)
+        self.num_componentes = num_elementos
+
+    def __len__(self):
+        return len(self.pais)
+
+    def adicionar(self):
+        """
+        Acrescenta um novo elemento isolado em O(1) amortizado.
+
+        Returns:
+            int: Índice do novo elemento
+        """
+        elemento = len(self.pais)
+        self.pais.append(elemento)
+        self.postos.append(0)
+        self.tamanhos.append(1)
+        self.num_componentes += 1
+        return elemento
+
+    def encontrar(self, elemento):
+        """
+        Retorna a raiz (representante) do conjunto de `elemento`, comprimindo o caminho.
+        """
+        pais = self.pais
+        raiz = elemento
+        while pais[raiz] != raiz:
+            raiz = pais[raiz]
+        # Segunda passada: todos os elementos do caminho passam a apontar para a raiz
+        while pais[elemento] != raiz:
+            proximo = pais[elemento]
+            pais[elemento] = raiz
+            elemento = proximo
+        return raiz
+
+    def unir(self, a, b):
+        """
+        Une os conjuntos de `a` e `b` (a árvore de menor posto fica sob a outra).
+
+        Returns:
+            bool: True se eram conjuntos distintos, False se já estavam unidos
+        """
+        raiz_a = self.encontrar(a)
+        raiz_b = self.encontrar(b)
+        if raiz_a == raiz_b:
+            return False
+        postos = self.postos
+        if postos[raiz_a] < postos[raiz_b]:
+            raiz_a, raiz_b = raiz_b, raiz_a
+        elif postos[raiz_a] == postos[raiz_b]:
+            postos[raiz_a] += 1
+        self.pais[raiz_b] = raiz_a
+        self.tamanhos[raiz_a] += self.tamanhos[raiz_b]
+        self.num_componentes -= 1
+        return True
+
+    def unir_pares(self, origens, destinos, parar_quando_conexo=False):
+        """
+        Une as extremidades de cada par (origens[i], destinos[i]); pares com
+        índice negativo (vértice inexistente) são ignorados.
+
+        Equivale a chamar `unir` par a par, com as buscas feitas em linha.
+
+        Args:
+            origens (sequence): Primeira extremidade de cada par
+            destinos (sequence): Segunda extremidade de cada par
+            parar_quando_conexo (bool): Se True, para assim que resta uma única componente
+
+        Returns:
+            int: Quantidade de pares processados
+        """
+        pais = self.pais
+        postos = self.postos
+        tamanhos = self.tamanhos
+        processados = 0
+        for u, v in zip(origens, destinos):
+            if parar_quando_conexo and self.num_componentes <= 1:
+                break
+            processados += 1
+            if u < 0 or v < 0:
+                continue
+            raiz_u = u
+            while pais[raiz_u] != raiz_u:
+                raiz_u = pais[raiz_u]
+            while pais[u] != raiz_u:
+                proximo = pais[u]
+                pais[u] = raiz_u
+                u = proximo
+            raiz_v = v
+            while pais[raiz_v] != raiz_v:
+                raiz_v = pais[raiz_v]
+            while pais[v] != raiz_v:
+                proximo = pais[v]
+                pais[v] = raiz_v
+                v = proximo
+            if raiz_u == raiz_v:
+                continue
+            if postos[raiz_u] < postos[raiz_v]:
+                raiz_u, raiz_v = raiz_v, raiz_u
+            elif postos[raiz_u] == postos[raiz_v]:
+                postos[raiz_u] += 1
+            pais[raiz_v] = raiz_u
+            tamanhos[raiz_u] += tamanhos[raiz_v]
+            self.num_componentes -= 1
+        return processados
+
+    def mesmo_conjunto(self, a, b):
+        """
+        Verifica se `a` e `b` estão no mesmo conjunto.
+        """
+        return self.encontrar(a) == self.encontrar(b)
+
+    def tamanho_conjunto(self, elemento):
+        """
+        Retorna a quantidade de elementos no conjunto de `elemento`.
+        """
+        return self.tamanhos[self.encontrar(elemento)]
+
+    def rotulos(self):
+        """
+        Numera as componentes de 0 a num_componentes - 1, na ordem do menor elemento.
+
+        Returns:
+            tuple: (componente, tamanhos): array com o rótulo da componente de cada
+                   elemento e array com o tamanho de cada componente
+        """
+        n = len(self.pais)
+        tipo = tipo_indice(n)
+        componente = vetor_preenchido(tipo, -1, n)
+        rotulo_da_raiz = vetor_preenchido(tipo, -1, n)
+        tamanhos = array(tipo)
+        for elemento in range(n):
+            raiz = self.encontrar(elemento)
+            rotulo = rotulo_da_raiz[raiz]
+            if rotulo < 0:
+                rotulo = rotulo_da_raiz[raiz] = len(tamanhos)
+                tamanhos.append(self.tamanhos[raiz])
+            componente[elemento] = rotulo
+        return componente, tamanhos
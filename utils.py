@@ -1,7 +1,21 @@
+from matriz_bits import MatrizBits
+from matriz_numpy import lista_de_matriz, matriz_de_lista, np
+
+
 def converter_matriz_para_lista(matriz_adj, vertices_ordenados):
     """
     Converte uma matriz de adjacência para uma lista de adjacência.
+    Aceita a lista de listas, a MatrizBits (lida linha a linha como bits) e, com o
+    NumPy instalado, o ndarray (extração vetorizada com `nonzero`).
     """
+    if np is not None and isinstance(matriz_adj, np.ndarray):
+        return lista_de_matriz(matriz_adj, vertices_ordenados)
+    if isinstance(matriz_adj, MatrizBits):
+        return {
+            vertice_origem: [vertices_ordenados[j] for j in matriz_adj.indices_linha(i)]
+            for i, vertice_origem in enumerate(vertices_ordenados)
+        }
+
     lista_adj = {v: [] for v in vertices_ordenados}
     for i, vertice_origem in enumerate(vertices_ordenados):
         for j, vertice_destino in enumerate(vertices_ordenados):
@@ -9,13 +23,31 @@ def converter_matriz_para_lista(matriz_adj, vertices_ordenados):
                 lista_adj[vertice_origem].append(vertice_destino)
     return lista_adj
 
-def converter_lista_para_matriz(lista_adj, vertices_ordenados):
+def converter_lista_para_matriz(lista_adj, vertices_ordenados, formato='lista'):
     """
     Converte uma lista de adjacência para uma matriz de adjacência.
+
+    Args:
+        lista_adj (dict): Lista de adjacência (vértice -> lista de vizinhos)
+        vertices_ordenados (list): Ordem dos vértices nas linhas/colunas
+        formato (str): 'lista' (padrão) para lista de listas, 'bits' para MatrizBits
+                       ou 'numpy' para ndarray de uint8 (preenchimento vetorizado)
+
+    Raises:
+        ValueError: Se o formato for desconhecido
+        ImportError: Se formato='numpy' e o NumPy não estiver instalado
     """
+    if formato == 'numpy':
+        return matriz_de_lista(lista_adj, vertices_ordenados)
+
     num_vertices = len(vertices_ordenados)
     mapa_vertices = {vertice: i for i, vertice in enumerate(vertices_ordenados)}
-    matriz_adj = [[0] * num_vertices for _ in range(num_vertices)]
+    if formato == 'lista':
+        matriz_adj = [[0] * num_vertices for _ in range(num_vertices)]
+    elif formato == 'bits':
+        matriz_adj = MatrizBits(num_vertices)
+    else:
+        raise ValueError(f"Formato de matriz desconhecido: '{formato}'.")
 
     for vertice, vizinhos in lista_adj.items():
         idx_origem = mapa_vertices.get(vertice)
@@ -23,5 +55,8 @@ def converter_lista_para_matriz(lista_adj, vertices_ordenados):
             for vizinho in vizinhos:
                 idx_destino = mapa_vertices.get(vizinho)
                 if idx_destino is not None:
-                    matriz_adj[idx_origem][idx_destino] = 1
-    return matriz_adj
\ No newline at end of file
+                    if formato == 'bits':
+                        matriz_adj.definir(idx_origem, idx_destino)
+                    else:
+                        matriz_adj[idx_origem][idx_destino] = 1
+    return matriz_adj
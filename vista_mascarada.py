@@ -0,0 +1,310 @@
+"""
+Vistas de subgrafo (induzido ou com vértices/arestas ocultos) sem cópia.
+
+Uma vista compartilha a CSR do grafo original e guarda apenas a máscara: o
+conjunto de vértices visíveis (subgrafo induzido), o de vértices ocultos e o de
+arestas ocultas. Criar uma vista, ou derivar outra com mais elementos ocultos,
+custa O(tamanho da máscara), e não O(V + E): análises do tipo "e se o vértice X
+for removido" para milhares de candidatos não reconstroem listas nem matrizes.
+
+As consultas percorrem a CSR do grafo pulando os elementos ocultos. Nas buscas,
+os vértices ocultos já começam marcados como visitados (um `bytearray` montado
+na hora, com custo de memset mais O(máscara)); as arestas ocultas são testadas
+por ID só quando existem.
+
+Os índices de vértices e de arestas da máscara são posições da CSR, válidas
+enquanto o grafo não for modificado: uma vista criada antes de uma mutação
+deixa de valer e suas consultas levantam ValueError.
+"""
+
+from array import array
+from bisect import bisect_left
+
+from busca_largura import busca_em_largura_csr, resultado_bfs_com_rotulos
+from csr import tipo_indice, vetor_preenchido
+
+
+class VistaMascarada:
+    """
+    Subgrafo de um Grafo definido por máscaras, lido diretamente da CSR original.
+    """
+
+    def __init__(self, grafo, visiveis=None, ocultos=frozenset(), arestas_ocultas=frozenset()):
+        """
+        Use Grafo.subgrafo_induzido e Grafo.mascarar em vez de chamar diretamente.
+
+        Args:
+            grafo (Grafo): Grafo original (não é copiado)
+            visiveis (frozenset, optional): Índices dos vértices do subgrafo induzido
+                                            (None: todos os vértices)
+            ocultos (frozenset): Índices dos vértices ocultos
+            arestas_ocultas (frozenset): Posições (IDs da CSR) das arestas ocultas
+        """
+        self.grafo = grafo
+        self._versao = grafo.cache.versao
+        self._visiveis = visiveis
+        self._ocultos = ocultos
+        self._arestas_ocultas = arestas_ocultas
+
+    def _verificar_versao(self):
+        if self.grafo.cache.versao != self._versao:
+            raise ValueError("A vista não vale mais: o grafo foi modificado depois de criá-la.")
+
+    def _visivel(self, indice):
+        return ((self._visiveis is None or indice in self._visiveis)
+                and indice not in self._ocultos)
+
+    def _indice(self, vertice):
+        indice = self.grafo.mapa_vertices.get(vertice)
+        if indice is None or not self._visivel(indice):
+            raise ValueError(f"O vértice '{vertice}' não existe na vista.")
+        return indice
+
+    def _bloqueados(self):
+        """
+        Monta o vetor de bloqueio das buscas (1 nos vértices fora da vista).
+        """
+        n = self.grafo.num_vertices
+        if self._visiveis is None:
+            bloqueados = bytearray(n)
+        else:
+            bloqueados = bytearray(b'\x01') * n
+            for indice in self._visiveis:
+                bloqueados[indice] = 0
+        for indice in self._ocultos:
+            bloqueados[indice] = 1
+        return bloqueados
+
+    # =========================================================================
+    # DERIVAÇÃO DE VISTAS
+    # =========================================================================
+
+    def mascarar(self, vertices=(), arestas=()):
+        """
+        Cria uma nova vista que também oculta os vértices e arestas informados.
+        Custa O(máscara): esta vista não é alterada.
+
+        Args:
+            vertices (iterable): Vértices a ocultar
+            arestas (iterable): IDs estáveis das arestas a ocultar (ver Grafo.aresta_por_id)
+
+        Returns:
+            VistaMascarada: Nova vista
+
+        Raises:
+            ValueError: Se algum vértice ou aresta não existir na vista
+        """
+        self._verificar_versao()
+        ocultos = self._ocultos.union(self._indice(v) for v in vertices)
+        arestas_ocultas = self._arestas_ocultas.union(
+            self.grafo._posicoes_arestas(arestas)
+        )
+        return VistaMascarada(self.grafo, self._visiveis, ocultos, arestas_ocultas)
+
+    # =========================================================================
+    # VÉRTICES, ARESTAS E VIZINHANÇA
+    # =========================================================================
+
+    @property
+    def num_vertices(self):
+        """
+        Quantidade de vértices visíveis.
+        """
+        self._verificar_versao()
+        if self._visiveis is None:
+            return self.grafo.num_vertices - len(self._ocultos)
+        return len(self._visiveis) - len(self._ocultos)
+
+    def vertices(self):
+        """
+        Retorna os vértices visíveis em ordem crescente.
+        """
+        self._verificar_versao()
+        rotulos = self.grafo.vertices_ordenados
+        if self._visiveis is None:
+            return [rotulo for i, rotulo in enumerate(rotulos) if i not in self._ocultos]
+        return [rotulos[i] for i in sorted(self._visiveis) if i not in self._ocultos]
+
+    def contem_vertice(self, vertice):
+        """
+        Verifica se o vértice existe no grafo e está visível na vista.
+        """
+        self._verificar_versao()
+        indice = self.grafo.mapa_vertices.get(vertice)
+        return indice is not None and self._visivel(indice)
+
+    def _entradas_visiveis(self, indice):
+        """
+        Gera (vizinho, ID da aresta) das entradas visíveis da linha `indice` da CSR.
+        """
+        csr = self.grafo.obter_csr()
+        visivel = self._visivel
+        arestas_ocultas = self._arestas_ocultas
+        for posicao in range(csr.offsets[indice], csr.offsets[indice + 1]):
+            v = csr.vizinhos[posicao]
+            id_aresta = csr.ids_arestas[posicao]
+            if visivel(v) and id_aresta not in arestas_ocultas:
+                yield v, id_aresta
+
+    def vizinhos(self, vertice):
+        """
+        Retorna os vizinhos visíveis do vértice (com repetição para arestas paralelas),
+        na ordem da CSR.
+
+        Raises:
+            ValueError: Se o vértice não estiver na vista
+        """
+        self._verificar_versao()
+        indice = self._indice(vertice)
+        rotulos = self.grafo.vertices_ordenados
+        # Um laço aparece duas vezes na linha da CSR: conta uma só
+        ids_vistos = set()
+        vizinhos = []
+        for v, id_aresta in self._entradas_visiveis(indice):
+            if v == indice:
+                if id_aresta in ids_vistos:
+                    continue
+                ids_vistos.add(id_aresta)
+            vizinhos.append(rotulos[v])
+        return vizinhos
+
+    def grau(self, vertice):
+        """
+        Retorna o número de arestas visíveis que contêm o vértice, em O(grau).
+
+        Raises:
+            ValueError: Se o vértice não estiver na vista
+        """
+        return len(self.vizinhos(vertice))
+
+    def num_arestas(self):
+        """
+        Conta as arestas visíveis.
+
+        Sem subgrafo induzido, o custo é O(soma dos graus dos vértices ocultos +
+        arestas ocultas): as arestas escondidas são descontadas do total do grafo.
+        No subgrafo induzido, é O(soma dos graus dos vértices visíveis).
+        """
+        self._verificar_versao()
+        csr = self.grafo.obter_csr()
+        if self._visiveis is None:
+            escondidas = set(self._arestas_ocultas)
+            for indice in self._ocultos:
+                escondidas.update(csr.arestas_de(indice))
+            return self.grafo.num_arestas - len(escondidas)
+        visiveis = set()
+        for indice in self._visiveis:
+            if indice not in self._ocultos:
+                visiveis.update(e for _, e in self._entradas_visiveis(indice))
+        return len(visiveis)
+
+    def criar_lista_adjacencia(self):
+        """
+        Monta a lista de adjacência (dict de listas) do subgrafo visível.
+        """
+        return {vertice: self.vizinhos(vertice) for vertice in self.vertices()}
+
+    # =========================================================================
+    # BUSCA E CONECTIVIDADE
+    # =========================================================================
+
+    def busca_em_largura(self, vertice_inicial, deterministico=True):
+        """
+        Realiza a BFS no subgrafo visível (mesmo formato de Grafo.busca_em_largura).
+
+        Raises:
+            ValueError: Se o vértice inicial não estiver na vista
+        """
+        self._verificar_versao()
+        inicio = self._indice(vertice_inicial)
+        resultado = busca_em_largura_csr(
+            self.grafo.obter_csr(ordenada=deterministico), inicio,
+            bloqueados=self._bloqueados(), arestas_bloqueadas=self._arestas_ocultas
+        )
+        return resultado_bfs_com_rotulos(resultado, self.grafo.vertices_ordenados)
+
+    def componentes_conexas(self):
+        """
+        Calcula as componentes conexas do subgrafo visível em O(V + E), com uma BFS
+        por componente sobre a CSR do grafo.
+
+        Returns:
+            dict: Dicionário contendo:
+                - 'componente': array com o rótulo da componente de cada vértice, na
+                                ordem de vertices_ordenados do grafo (-1 nos ocultos);
+                                numeradas na ordem do seu primeiro vértice
+                - 'tamanhos': array com o número de vértices de cada componente
+                - 'num_componentes': Quantidade de componentes
+        """
+        self._verificar_versao()
+        csr = self.grafo.obter_csr()
+        n = csr.num_vertices
+        offsets = csr.offsets
+        vizinhos = csr.vizinhos
+        ids_arestas = csr.ids_arestas
+        arestas_ocultas = self._arestas_ocultas
+        tipo = tipo_indice(n)
+
+        visitados = self._bloqueados()
+        componente = vetor_preenchido(tipo, -1, n)
+        tamanhos = array(tipo)
+        fila = array(tipo)
+        for raiz in range(n):
+            if visitados[raiz]:
+                continue
+            rotulo = len(tamanhos)
+            inicio_componente = len(fila)
+            cabeca = inicio_componente
+            visitados[raiz] = 1
+            fila.append(raiz)
+            while cabeca < len(fila):
+                u = fila[cabeca]
+                cabeca += 1
+                componente[u] = rotulo
+                for posicao in range(offsets[u], offsets[u + 1]):
+                    v = vizinhos[posicao]
+                    if not visitados[v] and ids_arestas[posicao] not in arestas_ocultas:
+                        visitados[v] = 1
+                        fila.append(v)
+            tamanhos.append(len(fila) - inicio_componente)
+        return {
+            'componente': componente,
+            'tamanhos': tamanhos,
+            'num_componentes': len(tamanhos)
+        }
+
+    def is_conexo(self):
+        """
+        Verifica se o subgrafo visível é conexo (uma vista vazia é conexa).
+        Uma única BFS a partir do primeiro vértice visível basta.
+        """
+        self._verificar_versao()
+        if self.num_vertices == 0:
+            return True
+        bloqueados = self._bloqueados()
+        inicio = bloqueados.index(0)
+        resultado = busca_em_largura_csr(self.grafo.obter_csr(), inicio, bloqueados=bloqueados,
+                                         arestas_bloqueadas=self._arestas_ocultas)
+        return len(resultado['ordem']) == self.num_vertices
+
+
+def posicoes_arestas(ids_estaveis, ids):
+    """
+    Converte IDs estáveis de arestas em posições da CSR por busca binária.
+
+    Args:
+        ids_estaveis (array): ID estável de cada posição, em ordem crescente
+                              (None quando os dois coincidem)
+        ids (iterable): IDs estáveis a converter
+
+    Returns:
+        list: Posição de cada ID, ou -1 se a aresta não existir
+    """
+    if ids_estaveis is None:
+        return list(ids)
+    posicoes = []
+    for id_aresta in ids:
+        posicao = bisect_left(ids_estaveis, id_aresta)
+        existe = posicao < len(ids_estaveis) and ids_estaveis[posicao] == id_aresta
+        posicoes.append(posicao if existe else -1)
+    return posicoes
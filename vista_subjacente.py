@@ -0,0 +1,217 @@
+"""
+Vista não direcionada (grafo subjacente) de um dígrafo, sem cópia.
+
+Em vez de montar um novo Grafo com as arestas {u, v} deduplicadas, a vista lê
+diretamente as estruturas do dígrafo: os vizinhos de um vértice são os seus
+sucessores (CSR de saída) seguidos dos predecessores (CSR de entrada), com os
+repetidos descartados durante a iteração. Os algoritmos sobre o grafo subjacente
+recebem as duas CSRs e tratam arcos paralelos ou opostos como uma só aresta:
+- bipartição: BFS de 2 cores sobre as duas linhas de cada vértice;
+- conectividade: união e busca direto sobre os vetores de extremidades dos arcos;
+- biconexidade: DFS única sobre as duas linhas, com os IDs dos arcos.
+
+A vista não guarda cópia dos arcos e acompanha o dígrafo: as CSRs vêm do cache
+do dígrafo a cada consulta.
+"""
+
+from biconexidade import arvore_blocos_csr, decomposicao_biconexa_csr
+from bipartido import ciclo_impar_bfs, coloracao_bipartida_csr
+from uniao_busca import UniaoBusca
+
+
+class VistaSubjacente:
+    """
+    Grafo subjacente de um dígrafo, calculado sob demanda a partir dos seus arcos.
+    """
+
+    def __init__(self, digrafo):
+        """
+        Args:
+            digrafo (Digrafo): Dígrafo observado (não é copiado)
+        """
+        self.digrafo = digrafo
+
+    @property
+    def vertices_ordenados(self):
+        return self.digrafo.vertices_ordenados
+
+    @property
+    def mapa_vertices(self):
+        return self.digrafo.mapa_vertices
+
+    @property
+    def num_vertices(self):
+        return self.digrafo.num_vertices
+
+    def _linhas(self):
+        return self.digrafo.obter_csr(), self.digrafo.obter_csr_reversa()
+
+    # =========================================================================
+    # VIZINHANÇA
+    # =========================================================================
+
+    def iterar_vizinhos(self, indice):
+        """
+        Gera os índices dos vizinhos de um vértice no grafo subjacente, sem repetições:
+        primeiro os sucessores, depois os predecessores que não são sucessores.
+
+        Args:
+            indice (int): Índice do vértice (posição em `mapa_vertices`)
+
+        Yields:
+            int: Índice de cada vizinho distinto
+        """
+        vistos = set()
+        for csr in self._linhas():
+            for v in csr.vizinhos_de(indice):
+                if v not in vistos:
+                    vistos.add(v)
+                    yield v
+
+    def vizinhos(self, vertice):
+        """
+        Retorna os vizinhos (sucessores e predecessores, sem repetições) de um vértice.
+
+        Raises:
+            ValueError: Se o vértice não existir no dígrafo
+        """
+        if vertice not in self.mapa_vertices:
+            raise ValueError(f"O vértice '{vertice}' não existe no dígrafo.")
+        rotulos = self.vertices_ordenados
+        return [rotulos[v] for v in self.iterar_vizinhos(self.mapa_vertices[vertice])]
+
+    # =========================================================================
+    # BIPARTIÇÃO
+    # =========================================================================
+
+    def eh_bipartido(self, apenas_verificar=False):
+        """
+        Determina se o grafo subjacente é bipartido (ver Grafo.eh_bipartido).
+
+        Args:
+            apenas_verificar (bool): Se True, retorna apenas o booleano
+
+        Returns:
+            bool: Se apenas_verificar for True, indica se é bipartido
+            dict: Caso contrário, dicionário com 'eh_bipartido', 'particoes',
+                  'coloracao' e 'ciclo_impar', como em Grafo.eh_bipartido
+        """
+        csr, csr_reversa = self._linhas()
+        if apenas_verificar:
+            _, _, conflito = coloracao_bipartida_csr(csr, registrar_pais=False,
+                                                     csr_reversa=csr_reversa)
+            return conflito is None
+
+        rotulos = self.vertices_ordenados
+        cores, pais, conflito = coloracao_bipartida_csr(csr, csr_reversa=csr_reversa)
+        coloracao = {rotulos[i]: cor for i, cor in enumerate(cores)}
+
+        if conflito is not None:
+            return {
+                'eh_bipartido': False,
+                'particoes': None,
+                'coloracao': coloracao,
+                'ciclo_impar': [rotulos[i] for i in ciclo_impar_bfs(pais, *conflito)]
+            }
+
+        return {
+            'eh_bipartido': True,
+            'particoes': ({rotulos[i] for i, cor in enumerate(cores) if cor == 0},
+                          {rotulos[i] for i, cor in enumerate(cores) if cor == 1}),
+            'coloracao': coloracao,
+            'ciclo_impar': None
+        }
+
+    # =========================================================================
+    # CONECTIVIDADE
+    # =========================================================================
+
+    def is_conexo(self):
+        """
+        Verifica se o grafo subjacente é conexo (o dígrafo é fracamente conexo).
+        Para assim que resta uma única componente.
+
+        Returns:
+            bool: True se for conexo (ou vazio)
+        """
+        if self.num_vertices == 0:
+            return True
+        uniao_busca = UniaoBusca(self.num_vertices)
+        uniao_busca.unir_pares(*self.digrafo.vetores_extremidades(), parar_quando_conexo=True)
+        return uniao_busca.num_componentes == 1
+
+    def componentes_conexas(self):
+        """
+        Calcula as componentes conexas do grafo subjacente (componentes fracas do dígrafo).
+
+        Returns:
+            dict: Dicionário com 'componente', 'tamanhos' e 'num_componentes',
+                  como em Grafo.componentes_conexas
+        """
+        uniao_busca = UniaoBusca(self.num_vertices)
+        uniao_busca.unir_pares(*self.digrafo.vetores_extremidades())
+        componente, tamanhos = uniao_busca.rotulos()
+        return {
+            'componente': componente,
+            'tamanhos': tamanhos,
+            'num_componentes': uniao_busca.num_componentes
+        }
+
+    # =========================================================================
+    # BICONEXIDADE
+    # =========================================================================
+
+    def decomposicao_biconexa(self):
+        """
+        Calcula articulações, pontes, blocos e a árvore de blocos do grafo subjacente
+        em uma única DFS (ver Grafo.decomposicao_biconexa).
+
+        Os IDs são os dos arcos do dígrafo (posições em `arcos`): cada ponte é
+        representada por um dos seus arcos, e um bloco lista todos os arcos das
+        suas arestas (inclusive os paralelos e os opostos).
+
+        Returns:
+            dict: Dicionário com 'articulacoes', 'pontes', 'blocos' e 'arvore_blocos',
+                  como em Grafo.decomposicao_biconexa
+        """
+        resultado = decomposicao_biconexa_csr(*self._linhas())
+        blocos = resultado['blocos']
+        arvore, nos_articulacao = arvore_blocos_csr(
+            blocos, resultado['articulacao'], *self.digrafo.vetores_extremidades()
+        )
+        rotulos = self.vertices_ordenados
+        return {
+            'articulacoes': {rotulos[v] for v in nos_articulacao},
+            'pontes': resultado['pontes'],
+            'blocos': blocos,
+            'arvore_blocos': {
+                'csr': arvore,
+                'num_blocos': len(blocos),
+                'articulacoes': [rotulos[v] for v in nos_articulacao]
+            }
+        }
+
+    def determinar_articulacoes_blocos(self):
+        """
+        Encontra as articulações e os blocos (como conjuntos de vértices) do grafo
+        subjacente, no formato de Grafo.determinar_articulacoes_blocos.
+
+        Returns:
+            dict: Dicionário contendo:
+                - 'articulacoes': Um conjunto com os pontos de articulação.
+                - 'blocos': Uma lista de conjuntos, onde cada conjunto representa um bloco.
+        """
+        resultado = self.decomposicao_biconexa()
+        origens, destinos = self.digrafo.vetores_extremidades()
+        rotulos = self.vertices_ordenados
+        blocos = []
+        for bloco in resultado['blocos']:
+            vertices = set()
+            for id_arco in bloco:
+                vertices.add(rotulos[origens[id_arco]])
+                vertices.add(rotulos[destinos[id_arco]])
+            blocos.append(vertices)
+        return {
+            'articulacoes': resultado['articulacoes'],
+            'blocos': blocos
+        }